@@ -0,0 +1,200 @@
+"""
+Array Backends for Aethelgard-QGF
+
+Every engine runs on an array backend, chosen by name with backend=... or,
+when that is None, by the AETHELGARD_BACKEND environment variable (default
+"numpy"). A backend supplies three things:
+
+    xp       - the array module fields are allocated with (numpy or cupy)
+    kernels  - optional fused kernels for the static sweep and the ADM step
+               (solve_g00_kernel / adm_step_kernel, as in aethelgard_numba)
+    host     - whether arrays live in host memory (device backends run the
+               plain iterative sweep only)
+
+Built-in backends:
+    "numpy"    - NumPy, no kernels (the reference path)
+    "numba"    - NumPy arrays, compiled parallel kernels (aethelgard_numba)
+    "threaded" - NumPy arrays, the same kernels written in NumPy and run over
+                 cache-sized blocks of cells on a thread pool (NumPy releases
+                 the GIL inside its loops)
+    "cupy"     - CuPy arrays on an NVIDIA GPU
+
+Loaders run on every lookup and import their dependency lazily, so a
+missing optional package only fails for the engine that asks for it, with an
+ImportError naming the package. register_backend() adds further backends.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+BACKEND_ENV = "AETHELGARD_BACKEND"
+DEFAULT_BACKEND = "numpy"
+
+# Cells per block of the threaded kernels (256 KiB of float64: stays in L2)
+BLOCK_CELLS = 2**15
+
+
+class Backend:
+    """
+    One array backend.
+
+    Parameters:
+    -----------
+    name : str
+        Registry name
+    xp : module
+        Array module (numpy or a NumPy-compatible one)
+    kernels : object, optional
+        Provider of solve_g00_kernel and adm_step_kernel
+    host : bool
+        True if arrays live in host memory
+    """
+
+    def __init__(self, name, xp, kernels=None, host=True):
+        self.name = name
+        self.xp = xp
+        self.kernels = kernels
+        self.host = host
+
+    def to_device(self, array):
+        """`array` in the backend's memory (unchanged on host backends)."""
+        if self.host:
+            return array
+        return self.xp.asarray(array)
+
+    def to_host(self, array):
+        """`array` as a NumPy array (unchanged on host backends)."""
+        if self.host or not hasattr(array, "get"):
+            return array
+        return array.get()
+
+    def __repr__(self):
+        return f"Backend({self.name!r})"
+
+
+_LOADERS = {}
+
+
+def register_backend(name, loader):
+    """
+    Register `loader`, a callable returning a Backend (or raising
+    ImportError when its dependency is missing), under `name`.
+    """
+    _LOADERS[name] = loader
+
+
+def backend_names():
+    """Names of the registered backends."""
+    return tuple(_LOADERS)
+
+
+def get_backend(name=None):
+    """
+    The Backend called `name` (AETHELGARD_BACKEND, else "numpy", if None).
+
+    Raises ValueError for unknown names and ImportError when the backend's
+    dependency is not installed.
+    """
+    if name is None:
+        name = os.environ.get(BACKEND_ENV, DEFAULT_BACKEND)
+    if name not in _LOADERS:
+        raise ValueError(f"Backend must be one of {backend_names()}.")
+    return _LOADERS[name]()
+
+
+def backend_available(name):
+    """True if the backend `name` can be loaded here."""
+    try:
+        get_backend(name)
+    except ImportError:
+        return False
+    return True
+
+
+class ThreadedKernels:
+    """
+    NumPy versions of the aethelgard_numba kernels, evaluated block by
+    block on a thread pool. Each block repeats the NumPy path's operations,
+    so results are bit-for-bit identical to it.
+
+    Parameters:
+    -----------
+    threads : int, optional
+        Pool size (default: os.cpu_count())
+    """
+
+    def __init__(self, threads=None):
+        self.threads = threads or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self.threads)
+
+    def _map(self, task, size):
+        blocks = [slice(start, min(start + BLOCK_CELLS, size))
+                  for start in range(0, size, BLOCK_CELLS)]
+        list(self._pool.map(task, blocks))
+
+    def solve_g00_kernel(self, g_00, mass, T_quantum, c2, coupling, iterations, lo, hi):
+        """Static solver: every iteration of the clamped sweep on one block at a time."""
+        def solve(cells):
+            T_total = mass[cells] * c2
+            T_total -= T_quantum[cells]
+            increment = (0.01 * (coupling * T_total)).astype(g_00.dtype, copy=False)
+            x = g_00[cells]
+            for _ in range(iterations):
+                x += increment
+                # PHYSICAL CONSTRAINT: Causality Clamp
+                np.clip(x, lo, hi, out=x)
+
+        self._map(solve, g_00.size)
+
+    def adm_step_kernel(self, metric, K, mass, T_quantum, c2, metric_coupling, K_coupling, dt):
+        """Time evolution: one simplified ADM step of metric (4, cells) and K (3, cells)."""
+        def step(cells):
+            T_total = mass[cells] * c2
+            T_total -= T_quantum[cells]
+            increment = T_total * metric_coupling
+            increment *= dt
+            increment *= 0.01
+            metric[:, cells] += increment
+            np.multiply(T_total, K_coupling, out=increment)
+            increment *= dt
+            increment *= 0.005
+            K[:, cells] += increment
+
+        self._map(step, mass.size)
+
+
+def _load_numpy():
+    return Backend("numpy", np)
+
+
+def _load_numba():
+    import aethelgard_numba
+    aethelgard_numba.require_numba()
+    return Backend("numba", np, aethelgard_numba)
+
+
+_threaded_kernels = None
+
+
+def _load_threaded():
+    global _threaded_kernels
+    if _threaded_kernels is None:
+        _threaded_kernels = ThreadedKernels()
+    return Backend("threaded", np, _threaded_kernels)
+
+
+def _load_cupy():
+    try:
+        import cupy
+    except ImportError:
+        raise ImportError("The 'cupy' backend requires CuPy. "
+                          "Install with: pip install cupy-cuda12x") from None
+    return Backend("cupy", cupy, host=False)
+
+
+register_backend("numpy", _load_numpy)
+register_backend("numba", _load_numba)
+register_backend("threaded", _load_threaded)
+register_backend("cupy", _load_cupy)
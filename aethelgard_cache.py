@@ -0,0 +1,228 @@
+"""
+Derived-Term Caching for Aethelgard-QGF
+
+SourceTermCache memoizes fields derived from input arrays, such as the
+quantum pressure of an entropy map or the total stress-energy of a
+(mass, entropy) pair. A time evolution with static sources then computes
+them once instead of on every step.
+
+Entries are keyed by the identity of the input arrays (object, data
+pointer, shape, strides, dtype) and hold a reference to those arrays, so a
+key cannot be reused while its entry is cached. NumPy has no write counter,
+so in-place modification of a cached input is not detected: call
+invalidate(array) (or invalidate() for everything) after mutating one.
+
+ResultCache persists whole solver results on disk across processes. Entries
+are content-addressed: the key is a SHA-256 digest of the solver parameters
+and the bytes of every input array, so changing any input selects a
+different entry and nothing needs invalidating. Each entry is a directory
+of .npy arrays plus entry.json. The cache is bounded in bytes and evicts the
+least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+from aethelgard_checkpoint import checked_dir
+
+ENTRY_FILE = "entry.json"
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _identity(array):
+    return (id(array), array.__array_interface__["data"][0], array.shape, array.strides,
+            array.dtype.str)
+
+
+class SourceTermCache:
+    """
+    Small LRU cache of derived source terms.
+
+    Parameters:
+    -----------
+    maxsize : int
+        Maximum number of cached fields (each is one grid-sized array)
+    """
+
+    def __init__(self, maxsize=4):
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (inputs, value)
+
+    def get(self, name, inputs, compute):
+        """
+        Return the cached `name` term for `inputs`, computing it on a miss.
+
+        Parameters:
+        -----------
+        name : str
+            Term name (e.g. "T_quantum")
+        inputs : tuple of ndarray
+            Arrays the term is derived from
+        compute : callable
+            compute(*inputs) -> array; only called on a miss
+        """
+        key = (name,) + tuple(_identity(array) for array in inputs)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = compute(*inputs)
+        self._entries[key] = (tuple(inputs), value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, array=None):
+        """Drop every entry derived from `array` (all entries if None)."""
+        if array is None:
+            self._entries.clear()
+            return
+        stale = [key for key, (inputs, _) in self._entries.items()
+                 if any(cached is array for cached in inputs)]
+        for key in stale:
+            del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (f"SourceTermCache(entries={len(self)}, hits={self.hits}, "
+                f"misses={self.misses})")
+
+
+class ResultCache:
+    """
+    Persistent, content-addressed LRU cache of solver results.
+
+    Parameters:
+    -----------
+    directory : str or Path
+        Cache directory (created if missing); may be shared between processes
+    max_bytes : int
+        Size bound of all entries together; least recently used entries
+        are evicted beyond it (the newest entry is always kept)
+    """
+
+    def __init__(self, directory, max_bytes=2**30):
+        if isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("Cache size must be a positive number of bytes.")
+        self.directory = checked_dir(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(arrays, **params):
+        """
+        Content key of a result: SHA-256 over the JSON-encoded `params` and
+        the dtype, shape and bytes of every array in `arrays`.
+        """
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode())
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(array.reshape(-1).view(np.uint8))
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        # Security: keys name directories, so only digests are accepted
+        if not isinstance(key, str) or not _KEY.match(key):
+            raise ValueError("Cache keys must be SHA-256 hex digests.")
+        return self.directory / key
+
+    def get(self, key):
+        """
+        The cached (arrays, meta) for `key`, or None on a miss. A hit marks
+        the entry as most recently used.
+        """
+        entry = self._entry(key)
+        try:
+            meta = json.loads((entry / ENTRY_FILE).read_text())
+            arrays = {name: np.load(entry / f"{name}.npy") for name in meta["arrays"]}
+            os.utime(entry / ENTRY_FILE)
+        except (OSError, ValueError, KeyError):
+            # Missing, evicted concurrently, or incomplete
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays, meta["meta"]
+
+    def put(self, key, arrays, meta=None):
+        """
+        Store `arrays` (dict of name -> ndarray) and the JSON-serializable
+        `meta` under `key`, then evict down to max_bytes.
+        """
+        entry = self._entry(key)
+        for name in arrays:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid array name {name!r}.")
+        # Written under a private name and renamed, so readers never see a partial entry
+        staging = self.directory / f".{key}-{uuid.uuid4().hex}"
+        staging.mkdir()
+        try:
+            for name, array in arrays.items():
+                np.save(staging / f"{name}.npy", array)
+            (staging / ENTRY_FILE).write_text(json.dumps({"arrays": list(arrays), "meta": meta}))
+            try:
+                staging.rename(entry)
+            except OSError:
+                pass  # Another process stored the same result first
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._evict(keep=entry)
+
+    def _entries(self):
+        """[(last use, bytes, path)] of every complete entry, oldest first."""
+        entries = []
+        for path in self.directory.iterdir():
+            if not _KEY.match(path.name):
+                continue
+            try:
+                used = (path / ENTRY_FILE).stat().st_mtime
+                size = sum(item.stat().st_size for item in path.iterdir())
+            except OSError:
+                continue
+            entries.append((used, size, path))
+        return sorted(entries)
+
+    def _evict(self, keep):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    def size(self):
+        """Bytes held by all entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        """Delete every entry."""
+        for _, _, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __repr__(self):
+        return (f"ResultCache({str(self.directory)!r}, entries={len(self)}, hits={self.hits}, "
+                f"misses={self.misses})")
@@ -0,0 +1,184 @@
+"""
+Checkpoint / Restart for Aethelgard-QGF Time Evolution
+
+A checkpoint is a directory of plain .npy files, one per field, plus a small
+JSON manifest:
+
+    run.ckpt/
+        manifest.json
+        metric-000003.npy     # (4, N, N, N) diagonal metric components
+        K-000003.npy          # (3, N, N, N) diagonal extrinsic curvature
+        alpha-000003.npy      # lapse
+        beta-000003.npy       # shift
+        history-000003.npy    # EvolutionHistory records
+        entropy-000003.npy    # current entropy field, when one was given
+
+Every write gets a new sequence number. Fields are streamed from the live
+arrays with np.save (no copies) and synced to disk. Only then is the manifest
+atomically replaced, so an interrupted write leaves the previous checkpoint
+valid. Files the new manifest no longer references are removed afterwards.
+
+load_checkpoint() memory-maps the fields copy-on-write. Pages are read on
+first touch, and updates stay private to the resumed process, so a
+checkpoint is never modified by the run that resumed from it.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+
+from aethelgard_metric import CompactMetric
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+_FIELD_FILE = re.compile(r"^[A-Za-z_]+-\d{6}\.npy$")
+
+
+def checked_dir(path):
+    """
+    Validate a run output directory (checkpoints, snapshots).
+    """
+    path = Path(path)
+    # Security: run output may live on scratch volumes (absolute paths),
+    # but must not climb out of the directory it names
+    if ".." in path.parts:
+        raise ValueError("Invalid output path. Path traversal not allowed.")
+    return path
+
+
+def read_manifest(path):
+    """
+    Read and validate the manifest of the checkpoint directory `path`.
+    """
+    path = checked_dir(path)
+    try:
+        manifest = json.loads((path / MANIFEST).read_text())
+    except FileNotFoundError:
+        raise ValueError(f"No checkpoint found in {path}.") from None
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format: {manifest.get('format')!r}.")
+    return manifest
+
+
+def write_checkpoint(engine, path, entropy=None):
+    """
+    Write the state of a time-evolution engine to the directory `path`.
+
+    Parameters:
+    -----------
+    engine : AethelgardEngineTimeEvolution
+        Engine to checkpoint
+    path : str or Path
+        Checkpoint directory (created if needed)
+    entropy : ndarray, optional
+        Current entropy field, needed to resume an evolving entropy
+
+    Returns:
+    --------
+    manifest : dict
+        The manifest that was written
+    """
+    path = checked_dir(path)
+    path.mkdir(parents=True, exist_ok=True)
+    try:
+        sequence = read_manifest(path)["sequence"] + 1
+    except ValueError:
+        sequence = 0
+
+    fields = {
+        "metric": engine.metric.components,
+        "K": engine.K.components,
+        "alpha": engine.alpha,
+        "beta": engine.beta,
+        "history": engine.history.records,
+    }
+    if entropy is not None:
+        fields["entropy"] = np.asarray(entropy)
+
+    files = {}
+    for name, array in fields.items():
+        files[name] = f"{name}-{sequence:06d}.npy"
+        with open(path / files[name], "wb") as fh:
+            np.save(fh, array, allow_pickle=False)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "sequence": sequence,
+        "step": engine.step_count,
+        "current_time": engine.current_time,
+        "engine": {
+            "grid_size": engine.N,
+            "domain_size": engine.L,
+            "dt": engine.dt,
+            "stencil": engine.laplacian.stencil,
+            "backend": engine.backend,
+            "in_place": engine.in_place,
+            "diffusion_coefficient": engine.diffusion.D,
+            "integrator": engine.diffusion.method,
+            "dtype": engine.dtype.name,
+        },
+        "files": files,
+    }
+    staging = path / (MANIFEST + ".tmp")
+    staging.write_text(json.dumps(manifest, indent=2))
+    os.replace(staging, path / MANIFEST)
+
+    # Drop the previous checkpoint's fields (a resumed run may still map them;
+    # POSIX keeps the data alive until it is unmapped)
+    live = set(files.values())
+    for stale in path.iterdir():
+        if _FIELD_FILE.match(stale.name) and stale.name not in live:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return manifest
+
+
+def load_checkpoint(path, engine_cls, mmap_mode="c"):
+    """
+    Rebuild an engine of class `engine_cls` from the checkpoint at `path`.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Checkpoint directory
+    engine_cls : type
+        AethelgardEngineTimeEvolution or a subclass
+    mmap_mode : str or None
+        np.load mmap mode: "c" (lazy, copy-on-write, default), "r+" to
+        update the files in place, or None to read everything into RAM
+
+    Returns:
+    --------
+    engine : engine_cls
+        Engine positioned at the checkpointed step; engine.entropy holds
+        the checkpointed entropy field (or None)
+    """
+    path = checked_dir(path)
+    manifest = read_manifest(path)
+    engine = engine_cls(**manifest["engine"])
+
+    def load(name):
+        return np.load(path / manifest["files"][name], mmap_mode=mmap_mode,
+                       allow_pickle=False)
+
+    grid = (engine.N,) * 3
+    engine.metric = CompactMetric(grid, dim=4, components=load("metric"))
+    engine.K = CompactMetric(grid, dim=3, components=load("K"))
+    for name in ("alpha", "beta"):
+        field = load(name)
+        if field.shape != getattr(engine, name).shape:
+            raise ValueError(f"Checkpoint field {name!r} has shape {field.shape}.")
+        setattr(engine, name, field)
+    engine.history.extend(load("history"))
+    engine.entropy = load("entropy") if "entropy" in manifest["files"] else None
+    engine.current_time = manifest["current_time"]
+    engine.step_count = manifest["step"]
+    return engine
@@ -13,23 +13,21 @@ Usage:
     
     engine = AethelgardEngineGPU(grid_size=128, domain_size=20.0)
     # ... rest is identical to CPU version
+
+AethelgardEngineGPU is AethelgardEngine on the "cupy" array backend
+(aethelgard_backends). Without CuPy, or with use_gpu=False, it runs on the
+"numpy" backend, which is the CPU engine's own code path. On the GPU the
+solver is the plain iterative sweep.
 """
 
 import numpy as np
 
-try:
-    import cupy as cp
-    GPU_AVAILABLE = True
-    print("✓ CuPy detected - GPU acceleration enabled")
-except ImportError:
-    GPU_AVAILABLE = False
-    print("⚠ CuPy not found - falling back to CPU (NumPy)")
-    print("  Install with: pip install cupy-cuda12x")
-    # Fallback: use numpy as cp
-    import numpy as cp
+from aethelgard_backends import backend_available
+from aethelgard_engine import AethelgardEngine
+from aethelgard_metric import CompactMetric
 
 
-class AethelgardEngineGPU:
+class AethelgardEngineGPU(AethelgardEngine):
     """
     GPU-accelerated AGI-optimized solver for Aethelgard-QGF.
     
@@ -37,7 +35,8 @@ class AethelgardEngineGPU:
     Automatically falls back to CPU if CuPy is not installed.
     """
     
-    def __init__(self, grid_size=32, domain_size=10.0, use_gpu=True):
+    def __init__(self, grid_size=32, domain_size=10.0, use_gpu=True, stencil="gradient",
+                 dtype=np.float64):
         """
         Initialize the GPU-accelerated engine.
         
@@ -49,161 +48,15 @@ class AethelgardEngineGPU:
             Physical size of simulation domain in meters
         use_gpu : bool
             If True and GPU available, use GPU. If False, use CPU.
+        stencil : str or int
+            Laplacian stencil: "gradient" (compatibility), 2 or 4
+        dtype : dtype
+            np.float64 or np.float32 for the metric and its increment
+            (the source terms keep the precision of the inputs)
         """
-        # Security: Input validation
-        if not isinstance(grid_size, int) or grid_size <= 0:
-            raise ValueError("Grid size must be a positive integer.")
-        if grid_size > 256:
-            raise ValueError("Grid size exceeds maximum limit of 256 to prevent resource exhaustion.")
-        if not isinstance(domain_size, (int, float)) or domain_size <= 0:
-            raise ValueError("Domain size must be a positive number.")
-
-        self.N = grid_size
-        self.L = domain_size
-        self.dx = self.L / self.N
-        
-        # Physical Constants
-        self.G = 6.674e-11
-        self.c = 3.0e8
-        self.hbar = 1.054e-34
-        
-        # Determine compute backend
-        self.use_gpu = use_gpu and GPU_AVAILABLE
-        self.xp = cp if self.use_gpu else np
-        
-        if self.use_gpu:
-            print("🚀 Using GPU acceleration (CuPy)")
-            # Print GPU info
-            try:
-                device = cp.cuda.Device()
-                print(f"   Device: {device.compute_capability}")
-                mem_info = cp.cuda.runtime.memGetInfo()
-                print(f"   Free memory: {mem_info[0] / 1e9:.2f} GB")
-            except Exception:
-                pass
-        else:
-            print("💻 Using CPU (NumPy)")
-        
-        # Physical Constraints & Limits
-        self.causality_limit = (0.1, 10.0)
-
-        # Initialize Spacetime Grid (Minkowski start)
-        self.metric = self.xp.zeros((self.N, self.N, self.N, 4, 4))
-        for i in range(4):
-            self.metric[..., i, i] = 1.0  # Diagonal components
-    
-    def calculate_quantum_pressure(self, entropy_field):
-        """
-        Implements the 'Antigravity' component via Negative Energy Density.
-        
-        GPU-accelerated version using CuPy arrays.
-        
-        Parameters:
-        -----------
-        entropy_field : cupy.ndarray or numpy.ndarray
-            Quantum entropy field
-            
-        Returns:
-        --------
-        T_quantum : cupy.ndarray or numpy.ndarray
-            Quantum pressure field
-        """
-        # Ensure input is on correct device
-        if self.use_gpu and isinstance(entropy_field, np.ndarray):
-            entropy_field = cp.asarray(entropy_field)
-        elif not self.use_gpu and hasattr(entropy_field, 'get'):
-            entropy_field = entropy_field.get()
-        
-        # S = A / 4G_hbar -> Localized entropy gradients
-        grad_S = self.xp.gradient(entropy_field, self.dx)
-        laplacian_S = self.xp.zeros_like(entropy_field)
-        
-        for i, g in enumerate(grad_S):
-            laplacian_S += self.xp.gradient(g, self.dx)[i]
-        
-        # The 'Antigravity' Term: Repulsive Stress-Energy (T_quantum)
-        T_quantum = (self.hbar * self.c / (self.dx**4)) * laplacian_S
-        return T_quantum
-    
-    def solve_field_equations(self, mass_distribution, entropy_map, iterations=50, verbose=True):
-        """
-        Iterative solver for G_mu_nu + Lambda*g_mu_nu = 8*pi*G*T_mu_nu.
-        
-        GPU-accelerated version.
-        
-        Parameters:
-        -----------
-        mass_distribution : array-like
-            Mass density field (kg/m³)
-        entropy_map : array-like
-            Quantum entropy field
-        iterations : int
-            Number of solver iterations
-        verbose : bool
-            Print progress messages
-            
-        Returns:
-        --------
-        metric : cupy.ndarray or numpy.ndarray
-            Spacetime metric tensor
-        """
-        # Security: Input validation
-        if not isinstance(iterations, int) or iterations <= 0:
-            raise ValueError("Iterations must be a positive integer.")
-        if iterations > 10000:
-            raise ValueError("Iterations exceeds maximum limit of 10000.")
-
-        if hasattr(mass_distribution, 'shape') and mass_distribution.shape != (self.N, self.N, self.N):
-            raise ValueError(f"Mass distribution shape {mass_distribution.shape} must match grid size ({self.N}, {self.N}, {self.N}).")
-
-        if hasattr(entropy_map, 'shape') and entropy_map.shape != (self.N, self.N, self.N):
-            raise ValueError(f"Entropy map shape {entropy_map.shape} must match grid size ({self.N}, {self.N}, {self.N}).")
-
-        if verbose:
-            backend = "GPU (CuPy)" if self.use_gpu else "CPU (NumPy)"
-            print(f"Synthesizing metric for Aethelgard-QGF on {backend}...")
-        
-        # Transfer data to GPU if needed
-        if self.use_gpu:
-            if isinstance(mass_distribution, np.ndarray):
-                mass_distribution = cp.asarray(mass_distribution)
-            if isinstance(entropy_map, np.ndarray):
-                entropy_map = cp.asarray(entropy_map)
-        else:
-            if hasattr(mass_distribution, 'get'):
-                mass_distribution = mass_distribution.get()
-            if hasattr(entropy_map, 'get'):
-                entropy_map = entropy_map.get()
-        
-        current_geometry = self.metric.copy()
-        
-        # Pre-compute quantum pressure (doesn't change during iteration)
-        T_repulsive = self.calculate_quantum_pressure(entropy_map)
-        
-        for i in range(iterations):
-            # 1. Compute Classical Stress (Attractive)
-            T_classic = mass_distribution * (self.c**2)
-            
-            # 2. Total Stress-Energy Tensor T_total
-            T_total = T_classic - T_repulsive  # Negative sign allows for 'antigravity' effects
-            
-            # 3. Update Metric based on Einstein Tensor G_mu_nu
-            curvature_update = (8 * self.xp.pi * self.G / self.c**4) * T_total
-            current_geometry[..., 0, 0] += 0.01 * curvature_update
-            
-            # PHYSICAL CONSTRAINT: Causality Clamp
-            current_geometry[..., 0, 0] = self.xp.clip(
-                current_geometry[..., 0, 0], 
-                self.causality_limit[0], 
-                self.causality_limit[1]
-            )
-
-            # Progress indicator
-            if verbose and (i + 1) % 20 == 0:
-                print(f"  Iteration {i+1}/{iterations}")
-        
-        self.metric = current_geometry
-        return self.metric
+        backend = "cupy" if use_gpu and backend_available("cupy") else "numpy"
+        super().__init__(grid_size, domain_size, stencil, backend, dtype)
+        self.use_gpu = backend == "cupy"
     
     def to_cpu(self, array):
         """
@@ -211,17 +64,19 @@ class AethelgardEngineGPU:
         
         Parameters:
         -----------
-        array : cupy.ndarray or numpy.ndarray
-            Array to transfer
+        array : cupy.ndarray, numpy.ndarray or CompactMetric
+            Array (or metric returned by solve_field_equations) to transfer
             
         Returns:
         --------
-        numpy.ndarray
-            Array on CPU
+        numpy.ndarray or CompactMetric
+            Array on CPU; a CompactMetric comes back as a CompactMetric
+            whose components are NumPy arrays
         """
-        if hasattr(array, 'get'):
-            return array.get()
-        return array
+        if isinstance(array, CompactMetric):
+            return CompactMetric(array.grid_shape, array.dim, np,
+                                 components=self.to_cpu(array.components))
+        return self._backend.to_host(array)
     
     def to_gpu(self, array):
         """
@@ -237,9 +92,7 @@ class AethelgardEngineGPU:
         cupy.ndarray
             Array on GPU
         """
-        if self.use_gpu and isinstance(array, np.ndarray):
-            return cp.asarray(array)
-        return array
+        return self._backend.to_device(array)
     
     def get_memory_usage(self):
         """
@@ -251,7 +104,7 @@ class AethelgardEngineGPU:
             Memory usage statistics
         """
         if self.use_gpu:
-            mem_info = cp.cuda.runtime.memGetInfo()
+            mem_info = self.xp.cuda.runtime.memGetInfo()
             return {
                 'free': mem_info[0] / 1e9,  # GB
                 'total': mem_info[1] / 1e9,  # GB
@@ -296,7 +149,7 @@ def benchmark_cpu_vs_gpu(grid_sizes=None):
         print(f"    CPU time: {cpu_time:.2f} seconds")
         
         # GPU benchmark (if available)
-        if GPU_AVAILABLE:
+        if backend_available("cupy"):
             print("  Testing GPU...")
             engine_gpu = AethelgardEngineGPU(grid_size=N, use_gpu=True)
             
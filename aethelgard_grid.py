@@ -0,0 +1,134 @@
+"""
+Grid Coordinates for Aethelgard-QGF
+
+CoordinateGrid serves the coordinates that scenarios and entropy sources
+evaluate their fields on: np.linspace(0, domain_size, N) along each axis.
+The three coordinate arrays are open (np.ogrid-style) views of that one axis,
+shaped (N, 1, 1), (1, N, 1) and (1, 1, N), and expressions in them broadcast
+to the full grid. Building X, Y, Z with np.meshgrid costs three dense N³
+arrays before any physics starts; dense() still provides them, but only when
+called.
+
+Radial distances from a center are the common derived field. They are
+computed from the open axes (one N³ array, no dense temporaries), cached per
+(center, floor) in a small LRU, and returned read-only so no caller can
+corrupt the shared copy. Values are bit-for-bit identical to the meshgrid
+formula sqrt((X - cx)² + (Y - cy)² + (Z - cz)²).
+
+coordinate_grid(N, domain_size) returns one shared CoordinateGrid per grid,
+so engines (engine.coordinates) and scenario builders reuse the same cache.
+At most GRID_CACHE_SIZE grids are kept, so the cached radial fields stay
+bounded by GRID_CACHE_SIZE · RADIAL_CACHE_SIZE N³ arrays (537 MB at 256³);
+clear_grid_cache() releases all of them.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+# Radial fields kept per grid (each is one N³ float64 array: 134 MB at 256³)
+RADIAL_CACHE_SIZE = 2
+
+# Grids kept by coordinate_grid (least recently used out)
+GRID_CACHE_SIZE = 2
+
+
+class CoordinateGrid:
+    """
+    Lazily computed, cached coordinates of an (N, N, N) grid.
+
+    Parameters:
+    -----------
+    grid_size : int
+        Number of grid points per dimension
+    domain_size : float
+        Physical size of domain in meters
+    """
+
+    def __init__(self, grid_size, domain_size):
+        if not isinstance(grid_size, int) or grid_size <= 0:
+            raise ValueError("Grid size must be a positive integer.")
+        if not isinstance(domain_size, (int, float)) or domain_size <= 0:
+            raise ValueError("Domain size must be a positive number.")
+        self.N = grid_size
+        self.L = domain_size
+        self.shape = (grid_size,) * 3
+        self._axis = None
+        self._radial = OrderedDict()  # (center, floor) -> r
+
+    @property
+    def axis(self):
+        """Coordinates along one axis, np.linspace(0, domain_size, N) (read-only)."""
+        if self._axis is None:
+            axis = np.linspace(0, self.L, self.N)
+            axis.flags.writeable = False
+            self._axis = axis
+        return self._axis
+
+    @property
+    def axes(self):
+        """Open coordinate arrays (x, y, z), shaped (N,1,1), (1,N,1), (1,1,N)."""
+        x = self.axis
+        return x.reshape(-1, 1, 1), x.reshape(1, -1, 1), x.reshape(1, 1, -1)
+
+    def dense(self):
+        """Materialized (X, Y, Z), each a new N³ array as from np.meshgrid."""
+        return np.meshgrid(self.axis, self.axis, self.axis, indexing='ij')
+
+    def _center(self, center):
+        if center is None:
+            center = self.L / 2
+        if np.ndim(center) == 0:
+            return (float(center),) * 3
+        if len(center) != 3:
+            raise ValueError("Center must be a scalar or one coordinate per axis.")
+        return tuple(float(c) for c in center)
+
+    def radial_distance(self, center=None, floor=None):
+        """
+        Distance of every cell from `center` (read-only, cached).
+
+        Parameters:
+        -----------
+        center : float or tuple, optional
+            Center coordinate, shared by all axes or one per axis
+            (default: the domain center)
+        floor : float, optional
+            Minimum distance, e.g. to avoid division by zero at the center
+        """
+        key = (self._center(center), None if floor is None else float(floor))
+        r = self._radial.get(key)
+        if r is not None:
+            self._radial.move_to_end(key)
+            return r
+
+        x, y, z = ((axis - c)**2 for axis, c in zip(self.axes, key[0], strict=True))
+        r = x + y + z  # the only N³ array
+        np.sqrt(r, out=r)
+        if floor is not None:
+            np.maximum(r, floor, out=r)
+        r.flags.writeable = False
+
+        self._radial[key] = r
+        if len(self._radial) > RADIAL_CACHE_SIZE:
+            self._radial.popitem(last=False)
+        return r
+
+    def clear(self):
+        """Drop the cached radial fields."""
+        self._radial.clear()
+
+    def __repr__(self):
+        return f"CoordinateGrid(N={self.N}, L={self.L}, radial={len(self._radial)})"
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def coordinate_grid(grid_size, domain_size):
+    """The shared CoordinateGrid of an N³ grid over [0, domain_size]."""
+    return CoordinateGrid(grid_size, domain_size)
+
+
+def clear_grid_cache():
+    """Release every shared grid and its cached radial fields."""
+    coordinate_grid.cache_clear()
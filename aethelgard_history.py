@@ -0,0 +1,179 @@
+"""
+Time-Evolution History for Aethelgard-QGF
+
+EvolutionHistory replaces the dict of Python lists kept by
+AethelgardEngineTimeEvolution. Records live in one preallocated structured
+NumPy array that grows geometrically, and reading keeps the old dict-style
+interface:
+
+    history['time']          # float64 array of recorded times
+    history['metric_mean']   # ⟨g₀₀⟩ per record
+    history.records          # the structured array itself
+
+The grid diagnostics are computed in cache-sized chunks with one scratch
+buffer that is reused across steps. moments() streams the field once and
+merges per-chunk mean / sum of squared deviations with the parallel Welford
+update (Chan et al.). abs_mean() accumulates sum(|x|) chunk by chunk, so
+neither allocates a full-grid temporary.
+"""
+
+import numpy as np
+
+HISTORY_FIELDS = ('time', 'dt', 'metric_mean', 'metric_std', 'K_mean', 'entropy_mean')
+
+# Elements per reduction chunk (512 KiB of float64: stays in L2)
+CHUNK_CELLS = 1 << 16
+
+
+class EvolutionHistory:
+    """
+    Preallocated, array-backed evolution history.
+
+    Parameters:
+    -----------
+    fields : tuple of str
+        Record fields (all float64)
+    capacity : int
+        Initial number of records to allocate
+    """
+
+    def __init__(self, fields=HISTORY_FIELDS, capacity=0):
+        self._data = np.zeros(capacity, dtype=[(name, 'f8') for name in fields])
+        self._size = 0
+        self._scratch = None
+
+    @property
+    def fields(self):
+        return self._data.dtype.names
+
+    @property
+    def size(self):
+        """Number of records stored."""
+        return self._size
+
+    @property
+    def records(self):
+        """Structured array view of the stored records."""
+        return self._data[:self._size]
+
+    def reserve(self, count):
+        """Make room for `count` more records without further reallocation."""
+        needed = self._size + count
+        if needed > len(self._data):
+            grown = np.zeros(max(needed, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def append(self, **values):
+        """Store one record; fields that are not given are recorded as NaN."""
+        if self._size == len(self._data):
+            self.reserve(max(1, self._size))
+        row = self._data[self._size]
+        for name in self.fields:
+            row[name] = values.pop(name, np.nan)
+        if values:
+            raise KeyError(f"Unknown history fields: {sorted(values)}")
+        self._size += 1
+
+    def extend(self, records):
+        """Append a structured array of records (e.g. one restored from disk)."""
+        records = np.asarray(records)
+        missing = set(self.fields) - set(records.dtype.names or ())
+        if missing:
+            raise KeyError(f"Records lack history fields: {sorted(missing)}")
+        self.reserve(len(records))
+        stop = self._size + len(records)
+        for name in self.fields:
+            self._data[name][self._size:stop] = records[name]
+        self._size = stop
+
+    def clear(self):
+        self._size = 0
+
+    # Dict-style read access, compatible with the former dict of lists
+    def __getitem__(self, name):
+        return self._data[name][:self._size]
+
+    def __contains__(self, name):
+        return name in self.fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def keys(self):
+        return self.fields
+
+    def items(self):
+        return [(name, self[name]) for name in self.fields]
+
+    def __repr__(self):
+        return f"EvolutionHistory(records={self._size}, fields={self.fields})"
+
+    # Streaming reductions
+    def moments(self, field):
+        """
+        Mean and (population) standard deviation of `field` in one pass over
+        memory, merging per-chunk statistics with the parallel Welford update.
+        Sums are accumulated in float64 whatever the field's dtype.
+        """
+        count, mean, m2 = self.partial_moments(field)
+        if count == 0:
+            return np.nan, np.nan
+        return mean, float(np.sqrt(m2 / count))
+
+    def partial_moments(self, field):
+        """(count, mean, sum of squared deviations) of `field`, for merge_moments()."""
+        return merge_moments(self._chunk_moments(field))
+
+    def _chunk_moments(self, field):
+        for chunk, buf in self._chunks(field):
+            if chunk.size == 0:
+                continue
+            mean_b = float(chunk.mean(dtype=float))
+            np.subtract(chunk, mean_b, out=buf)
+            np.multiply(buf, buf, out=buf)
+            yield chunk.size, mean_b, float(buf.sum())
+
+    def abs_sum(self, field):
+        """sum(|field|) without allocating an |field| temporary."""
+        total = 0.0
+        for chunk, buf in self._chunks(field):
+            np.abs(chunk, out=buf)
+            total += float(buf.sum())
+        return total
+
+    def abs_mean(self, field):
+        """mean(|field|) without allocating an |field| temporary."""
+        field = np.asarray(field)
+        return self.abs_sum(field) / field.size if field.size else np.nan
+
+    def _chunks(self, field):
+        """Yield (chunk, scratch) pairs along the leading axis of field."""
+        field = np.asarray(field)
+        if field.ndim == 0:
+            field = field.reshape(1)
+        row_cells = max(1, int(np.prod(field.shape[1:])))
+        rows = max(1, CHUNK_CELLS // row_cells)
+        # One flat buffer serves every field shape
+        if self._scratch is None or self._scratch.size < rows * row_cells:
+            self._scratch = np.empty(max(CHUNK_CELLS, rows * row_cells))
+        for start in range(0, field.shape[0], rows):
+            chunk = field[start:start + rows]
+            yield chunk, self._scratch[:chunk.size].reshape(chunk.shape)
+
+
+def merge_moments(parts):
+    """
+    Combine (count, mean, sum of squared deviations) triples of disjoint
+    parts of a field (Chan et al.'s parallel update).
+    """
+    count, mean, m2 = 0, 0.0, 0.0
+    for n_b, mean_b, m2_b in parts:
+        if n_b == 0:
+            continue
+        total = count + n_b
+        delta = mean_b - mean
+        mean += delta * n_b / total
+        m2 += m2_b + delta * delta * count * n_b / total
+        count = total
+    return count, mean, m2
@@ -0,0 +1,196 @@
+"""
+Compact Metric Storage for Aethelgard-QGF
+
+The engines only ever write the diagonal of g_mu_nu (and the static solver
+only g_00), so storing the full (N, N, N, 4, 4) tensor wastes 12 of every 16
+doubles. CompactMetric keeps just the diagonal components, one contiguous
+(N, N, N) array per component, and expands to the dense 4x4 view on demand.
+
+Indexing follows the dense layout, so existing code keeps working:
+
+    metric[..., 0, 0]          # contiguous g_00 view (no copy)
+    metric[..., 1, 1] += dg    # in-place update of g_11
+    metric[..., 0, 1]          # zeros (off-diagonal)
+    np.asarray(metric)         # dense (N, N, N, 4, 4) array
+"""
+
+import numbers
+
+import numpy as np
+
+# Field dtypes the engines accept (their dtype= option)
+DTYPES = ("float64", "float32")
+
+
+def field_dtype(dtype):
+    """Validate an engine's dtype= option; returns the np.dtype."""
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        dtype = None
+    if dtype is None or dtype.name not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}.")
+    return dtype
+
+
+class CompactMetric:
+    """
+    Diagonal-only storage for a rank-2 tensor field on a 3D grid.
+
+    Parameters:
+    -----------
+    grid_shape : tuple
+        Spatial grid shape, e.g. (N, N, N)
+    dim : int
+        Tensor dimension (4 for g_mu_nu, 3 for spatial tensors)
+    xp : module
+        Array module (numpy or cupy)
+    dtype : dtype
+        Component dtype
+    components : ndarray, optional
+        Existing (dim, *grid_shape) component array to wrap without copying.
+        Defaults to the identity (Minkowski-like start).
+    """
+
+    def __init__(self, grid_shape, dim=4, xp=np, dtype=float, components=None):
+        if components is None:
+            components = xp.ones((dim,) + tuple(grid_shape), dtype=dtype)
+        expected = (dim,) + tuple(grid_shape)
+        if components.shape != expected:
+            raise ValueError(f"Components shape {components.shape} must be {expected}.")
+
+        self.components = components
+        self.dim = dim
+        self.xp = xp
+
+    @property
+    def grid_shape(self):
+        return self.components.shape[1:]
+
+    @property
+    def shape(self):
+        return self.grid_shape + (self.dim, self.dim)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        return self.components.dtype
+
+    @property
+    def nbytes(self):
+        """Bytes actually stored (not the dense equivalent)."""
+        return self.components.nbytes
+
+    @property
+    def g_00(self):
+        """Contiguous view of the time-time component."""
+        return self.components[0]
+
+    def _normalize_key(self, key):
+        """
+        Expand key to one entry per dense axis (grid axes + mu + nu).
+
+        Returns None for keys the partial expansion does not handle (array or
+        boolean indices, np.newaxis); those index the dense tensor instead.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if not all(k is Ellipsis or isinstance(k, slice)
+                   or (isinstance(k, numbers.Integral) and not isinstance(k, bool)) for k in key):
+            return None
+        ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+        if len(ellipses) > 1:
+            return None
+        if ellipses:
+            i = ellipses[0]
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1:]
+        if len(key) > self.ndim:
+            return None
+        return key + (slice(None),) * (self.ndim - len(key))
+
+    def _split_key(self, key):
+        """Return (spatial_key, mu, nu) for [..., mu, nu] keys, else None."""
+        key = self._normalize_key(key)
+        if key is None:
+            return None
+        mu, nu = key[-2], key[-1]
+        if not (isinstance(mu, numbers.Integral) and isinstance(nu, numbers.Integral)):
+            return None
+        if not (-self.dim <= mu < self.dim and -self.dim <= nu < self.dim):
+            raise IndexError(f"Tensor index out of range for dimension {self.dim}.")
+        return key[:-2], int(mu) % self.dim, int(nu) % self.dim
+
+    def __getitem__(self, key):
+        split = self._split_key(key)
+        if split is None:
+            return self._expand_slice(key)
+
+        spatial, mu, nu = split
+        component = self.components[(mu,) + spatial]
+        if mu == nu:
+            return component
+        return self.xp.zeros_like(component)
+
+    def _expand_slice(self, key):
+        """
+        Dense values for a general key, expanding only the selected cells
+        (metric[0] materializes one (N, N, 4, 4) plane, not the whole grid).
+        """
+        normalized = self._normalize_key(key)
+        if normalized is None:
+            return self.to_dense()[key]
+
+        selected = self.components[(slice(None),) + normalized[:-2]]
+        dense = self.xp.zeros(selected.shape[1:] + (self.dim, self.dim), dtype=self.dtype)
+        for mu in range(self.dim):
+            dense[..., mu, mu] = selected[mu]
+        return dense[(Ellipsis,) + normalized[-2:]]
+
+    def __setitem__(self, key, value):
+        split = self._split_key(key)
+        if split is None:
+            raise IndexError("CompactMetric only supports assignment to [..., mu, nu] components.")
+
+        spatial, mu, nu = split
+        if mu != nu:
+            if self.xp.any(self.xp.asarray(value) != 0):
+                raise ValueError("CompactMetric stores only diagonal components.")
+            return
+
+        index = (mu,) + spatial
+        if _same_view(self.components[index], value):
+            # In-place update (e.g. metric[..., i, i] += x) already landed
+            return
+        self.components[index] = value
+
+    def to_dense(self):
+        """Materialize the full (..., dim, dim) tensor."""
+        dense = self.xp.zeros(self.shape, dtype=self.dtype)
+        for mu in range(self.dim):
+            dense[..., mu, mu] = self.components[mu]
+        return dense
+
+    def __array__(self, dtype=None, copy=None):
+        dense = self.to_dense()
+        if hasattr(dense, 'get'):
+            dense = dense.get()
+        return dense if dtype is None else dense.astype(dtype)
+
+    def copy(self):
+        return CompactMetric(self.grid_shape, self.dim, self.xp, components=self.components.copy())
+
+    def __repr__(self):
+        return f"CompactMetric(grid_shape={self.grid_shape}, dim={self.dim}, dtype={self.dtype})"
+
+
+def _same_view(target, value):
+    """True if value is exactly the memory target already refers to."""
+    try:
+        a = target.__array_interface__
+        b = value.__array_interface__
+    except AttributeError:
+        return False
+    return a['data'] == b['data'] and a['shape'] == b['shape'] and a['strides'] == b['strides']
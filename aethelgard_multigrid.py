@@ -0,0 +1,239 @@
+"""
+Geometric Multigrid Solver for Aethelgard-QGF
+
+MultigridSolver solves ∇²u = f for the compact 3-point Laplacian on the
+engine's cell-centred grid, with u = 0 on the domain faces. This is the same
+discrete problem as PoissonSolver(boundary="dirichlet"), solved with
+V-cycles instead of transforms:
+
+    smooth (pre_smooth sweeps)
+    → restrict the residual to a grid of half the resolution
+    → solve there recursively
+    → prolong the correction back
+    → smooth (post_smooth sweeps)
+
+Restriction averages the 8 children of a coarse cell, and prolongation is
+trilinear. Levels coarsen while every axis is even and at least
+2 · coarsest cells long. The coarsest level is solved directly with
+PoissonSolver.
+
+One V-cycle costs O(N³) and reduces the residual by a grid-independent
+factor: about 0.1 with red-black Gauss-Seidel, about 0.25 with weighted
+Jacobi. A fixed tolerance is therefore reached in O(N³) work at any grid
+size.
+"""
+
+import numpy as np
+
+from aethelgard_operators import PoissonSolver
+
+SMOOTHERS = ("gauss_seidel", "jacobi")
+
+# Damping of the Jacobi smoother (optimal high-frequency smoothing in 3D)
+JACOBI_WEIGHT = 6.0 / 7.0
+
+# Default stopping threshold on the relative residual max|f - ∇²u| / max|f|
+DEFAULT_TOL = 1e-8
+
+
+class MultigridSolver:
+    """
+    V-cycle multigrid for ∇²u = f over the last three axes (leading axes
+    are batch axes).
+
+    Parameters:
+    -----------
+    smoother : str
+        "gauss_seidel" (red-black) or "jacobi" (weighted)
+    pre_smooth, post_smooth : int
+        Smoothing sweeps before and after each coarse-grid correction
+    coarsest : int
+        Smallest axis length to coarsen down to before the direct solve
+    """
+
+    def __init__(self, smoother="gauss_seidel", pre_smooth=2, post_smooth=2, coarsest=2):
+        if smoother not in SMOOTHERS:
+            raise ValueError(f"Smoother must be one of {SMOOTHERS}.")
+        for name, value in (("pre_smooth", pre_smooth), ("post_smooth", post_smooth)):
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f"{name} must be a non-negative integer.")
+        if pre_smooth + post_smooth == 0:
+            raise ValueError("At least one smoothing sweep per cycle is required.")
+        if not isinstance(coarsest, int) or coarsest < 1:
+            raise ValueError("coarsest must be a positive integer.")
+        self.smoother = smoother
+        self.pre_smooth = pre_smooth
+        self.post_smooth = post_smooth
+        self.coarsest = coarsest
+        self._hierarchy_cache = None  # ((shape, dx), levels)
+
+    def solve(self, f, dx, cycles=50, tol=None):
+        """
+        Run V-cycles from u = 0 until the relative residual is <= tol.
+
+        Parameters:
+        -----------
+        f : ndarray
+            Right-hand side, shape (..., N0, N1, N2)
+        dx : float
+            Grid spacing
+        cycles : int
+            Largest number of V-cycles
+        tol : float, optional
+            Threshold on max|f - ∇²u| / max|f| (DEFAULT_TOL if None)
+
+        Returns:
+        --------
+        u : ndarray
+            Solution, shaped like f
+        info : dict
+            'iterations' (cycles run), 'converged', and per-cycle
+            'residual_max' / 'residual_rms' arrays (relative to max|f|)
+        """
+        tol = DEFAULT_TOL if tol is None else tol
+        f = np.asarray(f, dtype=float)
+        levels = self._hierarchy(f.shape[-3:], dx)
+        u = np.zeros_like(f)
+        scale = np.max(np.abs(f)) if f.size else 0.0
+
+        residual_max = []
+        residual_rms = []
+        converged = scale == 0
+        while not converged and len(residual_max) < cycles:
+            if len(levels) == 1:
+                u = levels[0].direct(f)
+            else:
+                self._v_cycle(u, f, levels, 0)
+            r = levels[0].residual(u, f)
+            residual_max.append(float(np.max(np.abs(r))) / scale)
+            residual_rms.append(float(np.sqrt(np.mean(r * r))) / scale)
+            converged = residual_max[-1] <= tol
+
+        return u, {'iterations': len(residual_max), 'converged': bool(converged),
+                   'residual_max': np.array(residual_max),
+                   'residual_rms': np.array(residual_rms)}
+
+    def _hierarchy(self, shape, dx):
+        """Grid levels for a spatial shape, finest first (cached for reuse)."""
+        key = (tuple(shape), dx)
+        if self._hierarchy_cache is not None and self._hierarchy_cache[0] == key:
+            return self._hierarchy_cache[1]
+        levels = [_Level(shape, dx)]
+        while all(n % 2 == 0 and n // 2 >= self.coarsest for n in shape):
+            shape = tuple(n // 2 for n in shape)
+            dx = 2 * dx
+            levels.append(_Level(shape, dx))
+        self._hierarchy_cache = (key, levels)
+        return levels
+
+    def _v_cycle(self, u, f, levels, depth):
+        """One V-cycle on level `depth`, updating u in place."""
+        level = levels[depth]
+        self._smooth(u, f, level, self.pre_smooth)
+
+        coarse_f = _restrict(level.residual(u, f))
+        coarse = levels[depth + 1]
+        if depth + 2 == len(levels):
+            coarse_u = coarse.direct(coarse_f)
+        else:
+            coarse_u = np.zeros_like(coarse_f)
+            self._v_cycle(coarse_u, coarse_f, levels, depth + 1)
+        u += _prolong(coarse_u)
+
+        self._smooth(u, f, level, self.post_smooth)
+
+    def _smooth(self, u, f, level, sweeps):
+        if sweeps == 0:
+            return
+        rhs = f * level.dx**2
+        update = np.empty_like(u)
+        for _ in range(sweeps):
+            if self.smoother == "jacobi":
+                level.neighbour_sum(u, out=update)
+                update -= rhs
+                update *= level.inverse_diagonal
+                update -= u
+                update *= JACOBI_WEIGHT
+                u += update
+            else:
+                for colour in level.colours:
+                    level.neighbour_sum(u, out=update)
+                    update -= rhs
+                    update *= level.inverse_diagonal
+                    np.copyto(u, update, where=colour)
+
+
+class _Level:
+    """
+    One grid of the hierarchy. The face condition u = 0 puts a ghost value
+    of -u beyond each boundary cell, folded into the diagonal here.
+    """
+
+    def __init__(self, shape, dx):
+        self.shape = shape
+        self.dx = dx
+        # 6 neighbours, plus 1 for every domain face the cell touches
+        self.diagonal = np.full(shape, 6.0)
+        for axis, n in enumerate(shape):
+            edges = [slice(None)] * 3
+            for edge in (0, n - 1):
+                edges[axis] = edge
+                self.diagonal[tuple(edges)] += 1.0
+        self.inverse_diagonal = 1.0 / self.diagonal
+        parity = np.indices(shape).sum(axis=0) % 2
+        self.colours = (parity == 0, parity == 1)  # red, black
+        self._direct = None
+
+    def neighbour_sum(self, u, out=None):
+        """Sum of the interior neighbours of every cell (written into out)."""
+        if out is None:
+            total = np.zeros_like(u)
+        else:
+            total = out
+            total[...] = 0
+        for axis in (-3, -2, -1):
+            lower = [slice(None)] * u.ndim
+            upper = [slice(None)] * u.ndim
+            lower[axis] = slice(None, -1)
+            upper[axis] = slice(1, None)
+            total[tuple(upper)] += u[tuple(lower)]
+            total[tuple(lower)] += u[tuple(upper)]
+        return total
+
+    def residual(self, u, f):
+        """f - ∇²u."""
+        r = self.neighbour_sum(u)
+        r -= self.diagonal * u
+        r /= -self.dx**2
+        r += f
+        return r
+
+    def direct(self, f):
+        if self._direct is None:
+            self._direct = PoissonSolver(self.dx, "dirichlet")
+        return self._direct(f)
+
+
+def _restrict(fine):
+    """Average the 2x2x2 children of every coarse cell."""
+    *batch, n0, n1, n2 = fine.shape
+    blocks = fine.reshape(*batch, n0 // 2, 2, n1 // 2, 2, n2 // 2, 2)
+    return blocks.mean(axis=(-5, -3, -1))
+
+
+def _prolong(coarse):
+    """Trilinear interpolation to the grid of twice the resolution."""
+    fine = coarse
+    for axis in (-3, -2, -1):
+        fine = _prolong_axis(fine, axis)
+    return fine
+
+
+def _prolong_axis(c, axis):
+    """Children 2j, 2j+1 get 3/4 of cell j plus 1/4 of its neighbour on their side."""
+    c = np.moveaxis(c, axis, -1)
+    before = np.concatenate([-c[..., :1], c[..., :-1]], axis=-1)  # ghost -c at the faces
+    after = np.concatenate([c[..., 1:], -c[..., -1:]], axis=-1)
+    fine = np.stack([0.75 * c + 0.25 * before, 0.75 * c + 0.25 * after], axis=-1)
+    fine = fine.reshape(*c.shape[:-1], 2 * c.shape[-1])
+    return np.moveaxis(fine, -1, axis)
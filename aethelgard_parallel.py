@@ -0,0 +1,236 @@
+"""
+Shared-Memory Slab Parallelism for Aethelgard-QGF
+
+SlabWorkers splits an (N, N, N) grid into slabs along its first axis, one
+per worker process, and keeps the processes alive between calls. Fields are
+placed in multiprocessing.shared_memory blocks. Every process maps the same
+pages, so only block names cross process boundaries.
+
+Laplacian (SlabLaplacian, a drop-in LaplacianOperator): the input is
+published in shared memory. Each worker then takes its slab plus `halo`
+ghost planes from its neighbours' slabs and applies the stencil there. The
+halo exchange is a read of the neighbours' boundary planes, which are
+complete before any worker starts. Each worker writes its slab of the
+result. The global faces get the usual edge handling, so results are
+bit-for-bit identical to the serial operator. The explicit entropy
+diffusion step |S + dt·D·∇²S| is fused into the same pass.
+
+Reductions are collective: each worker reduces its own slab and the parent
+merges the partial results. A worker computes the mean and sum of squared
+deviations, the sum of |x|, the sum, or max |x - 1|. Means can differ from
+the serial ones in the last bits, because the summation order changes.
+"""
+
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from aethelgard_history import EvolutionHistory, merge_moments
+from aethelgard_operators import HALO, LaplacianOperator
+
+# A slab needs this many planes for its stencil to match the serial one at the faces
+MIN_SLAB_PLANES = 3
+
+
+class _SharedBlock(shared_memory.SharedMemory):
+    """
+    SharedMemory that is never unmapped explicitly. NumPy arrays over the
+    block do not pin the mapping, so closing it would leave them dangling;
+    instead the mapping goes away with the last array that references it.
+    """
+
+    def __del__(self):
+        pass
+
+
+class SlabWorkers:
+    """
+    Pool of slab worker processes with named shared-memory fields.
+
+    Parameters:
+    -----------
+    workers : int
+        Number of processes (= slabs), at least 2
+    grid_shape : tuple
+        Spatial grid shape (N0, N1, N2); slabs split N0
+    dtype : dtype
+        Default dtype of the shared fields
+    """
+
+    def __init__(self, workers, grid_shape, dtype=float):
+        grid_shape = tuple(grid_shape)
+        # Security: bound the process count by the grid
+        if not isinstance(workers, int) or workers < 2:
+            raise ValueError("Slab parallelism needs an integer number of workers >= 2.")
+        if workers > grid_shape[0] // MIN_SLAB_PLANES:
+            raise ValueError(f"At most {grid_shape[0] // MIN_SLAB_PLANES} workers fit a grid "
+                             f"of {grid_shape[0]} planes ({MIN_SLAB_PLANES} planes per slab).")
+
+        self.workers = workers
+        self.grid_shape = grid_shape
+        self.dtype = np.dtype(dtype)
+        n = grid_shape[0]
+        edges = [i * n // workers for i in range(workers + 1)]
+        self.slabs = list(zip(edges[:-1], edges[1:], strict=True))
+
+        self._blocks = {}  # field name -> _SharedBlock
+        self._arrays = {}  # field name -> ndarray over the block
+        # spawn, not fork: forking after Numba/BLAS thread pools start can deadlock
+        context = multiprocessing.get_context("spawn")
+        self._pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._blocks)
+
+    def shared(self, name, shape=None, dtype=None):
+        """
+        The shared array `name` (grid-shaped and of the workers' dtype
+        unless `shape` / `dtype` are given), allocated on first use.
+        """
+        shape = self.grid_shape if shape is None else tuple(shape)
+        dtype = self.dtype if dtype is None else np.dtype(dtype)
+        array = self._arrays.get(name)
+        if array is not None and array.shape == shape and array.dtype == dtype:
+            return array
+        if array is not None:
+            self._arrays.pop(name)
+            self._blocks.pop(name).unlink()
+        block = _SharedBlock(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        self._blocks[name] = block
+        self._arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        return self._arrays[name]
+
+    def spec(self, array):
+        """(block name, shape, dtype) if `array` is one of the shared fields, else None."""
+        for name, shared in self._arrays.items():
+            if array is shared:
+                return self._blocks[name].name, shared.shape, shared.dtype.str
+        return None
+
+    def _publish(self, array, name):
+        """Spec of `array`, copied into the shared field `name` unless already shared."""
+        spec = self.spec(array)
+        if spec is None:
+            buffer = self.shared(name, array.shape, array.dtype)
+            np.copyto(buffer, array)
+            spec = self.spec(buffer)
+        return spec
+
+    def _map(self, task, *args):
+        """Run `task` on every slab; returns the per-slab results."""
+        return list(self._pool.map(task, [args + slab for slab in self.slabs]))
+
+    def laplacian(self, field, dx, stencil, out, step=None):
+        """
+        ∇²field into the shared array `out`; with `step`, |field + step·∇²field|
+        instead (one explicit diffusion step).
+        """
+        source = self._publish(field, "laplacian_in")
+        self._map(_stencil_task, source, self.spec(out), dx, stencil, step)
+
+    def diffuse(self, field, step, dx, stencil):
+        """
+        One explicit diffusion step into a shared double buffer; returns it.
+        The result stays valid until the step after next.
+        """
+        target = self.shared("diffused_a")
+        if field is target:
+            target = self.shared("diffused_b")
+        self.laplacian(field, dx, stencil, target, step)
+        return target
+
+    def reduce(self, kind, field, index=None):
+        """
+        Collective reduction of field (or field[index]) over the grid.
+
+        kind : "moments" -> (mean, std), "abs_sum", "sum" or "max_deviation"
+        (max |x - 1|). Non-shared fields are published first.
+        """
+        source = self._publish(field, "reduce_in")
+        parts = self._map(_reduce_task, source, index, kind)
+        if kind == "moments":
+            count, mean, m2 = merge_moments(parts)
+            return mean, float(np.sqrt(m2 / count))
+        if kind == "max_deviation":
+            return max(parts)
+        return float(sum(parts))
+
+    def close(self):
+        """Stop the workers and free the shared blocks (idempotent)."""
+        self._arrays.clear()
+        self._finalizer()
+
+
+def _release(pool, blocks):
+    pool.shutdown()
+    for block in blocks.values():
+        block.unlink()  # the name goes now, the memory with the last array over it
+    blocks.clear()
+
+
+class SlabLaplacian(LaplacianOperator):
+    """
+    LaplacianOperator evaluating grid-shaped fields on slab workers.
+    Other shapes (e.g. batches) fall back to the serial kernel.
+    """
+
+    def __init__(self, slabs, dx, stencil="gradient"):
+        super().__init__(dx, stencil)
+        self.slabs = slabs
+
+    def __call__(self, field, out=None):
+        if field.shape != self.slabs.grid_shape or field.dtype != self.slabs.dtype:
+            return super().__call__(field, out)
+        result = self.slabs.shared("laplacian_out")
+        self.slabs.laplacian(field, self.dx, self.stencil, result)
+        if out is None:
+            return result.copy()
+        out[...] = result
+        return out
+
+
+# Worker side: blocks stay attached for the life of the worker process
+_attached = {}
+_operators = {}
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    if name not in _attached:
+        block = _SharedBlock(name=name)
+        _attached[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    return _attached[name][1]
+
+
+def _stencil_task(task):
+    source, target, dx, stencil, step, z0, z1 = task
+    field, out = _attach(source), _attach(target)
+    key = (dx, stencil)
+    if key not in _operators:
+        _operators[key] = LaplacianOperator(dx, stencil)
+
+    # Halo exchange: the neighbours' boundary planes, read in place
+    halo = HALO[stencil]
+    lo, hi = max(z0 - halo, 0), min(z1 + halo, field.shape[0])
+    laplacian = _operators[key](field[lo:hi])[z0 - lo:z1 - lo]
+    if step is None:
+        out[z0:z1] = laplacian
+    else:
+        # Same arithmetic as the serial update: |S + (dt·D)·∇²S|
+        np.abs(field[z0:z1] + step * laplacian, out=out[z0:z1])
+
+
+def _reduce_task(task):
+    source, index, kind, z0, z1 = task
+    field = _attach(source)
+    if index is not None:
+        field = field[index]
+    slab = field[..., z0:z1, :, :]  # slabs split the first grid axis
+    if kind == "moments":
+        return EvolutionHistory().partial_moments(slab)
+    if kind == "abs_sum":
+        return EvolutionHistory().abs_sum(slab)
+    if kind == "sum":
+        return float(np.sum(slab, dtype=float))
+    return float(np.max(np.abs(slab - 1.0)))
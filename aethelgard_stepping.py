@@ -0,0 +1,193 @@
+"""
+Time Stepping for Aethelgard-QGF
+
+DiffusionIntegrator advances the entropy diffusion ∂S/∂t = D ∇²S by one
+step:
+
+    "euler"           - explicit forward Euler (the original update)
+    "rk4"             - classical fourth-order Runge-Kutta
+    "crank_nicolson"  - implicit, second order in time
+    "backward_euler"  - implicit, first order, damps every mode
+
+The explicit methods use the engine's Laplacian stencil and are stable for
+dt · D · ρ up to 2 (Euler) or about 2.785 (RK4), where ρ bounds the
+Laplacian spectrum. The implicit methods are unconditionally stable. They
+diagonalize the 3-point Laplacian with zero-flux (reflecting) boundaries
+in a DCT-II basis, so each step costs one forward and one inverse
+transform, O(N³ log N).
+
+AdaptiveTimeStep picks the step size of AethelgardEngineTimeEvolution for
+every step, within [dt_min, dt_max], as the smallest of:
+
+- the diffusion stability limit of an explicit entropy integrator,
+  safety · extent / (D · ρ), where ρ bounds the Laplacian spectrum and
+  extent is 2 for Euler (ρ = 12/dx² for the 3-point stencil, i.e.
+  D·dt/dx² ≤ safety/6); implicit integrators have no limit;
+- an accuracy limit: max_change / (largest |∂g/∂t| or |∂K/∂t| seen on the
+  previous step), so no component of g or K moves by more than max_change;
+- growth · (previous dt), so the step never jumps after a quiet phase.
+
+The update rates come from the previous step (the entropy update of a step
+already depends on its dt). The first step therefore starts from the
+engine's configured dt.
+"""
+
+import numpy as np
+
+INTEGRATORS = ("euler", "rk4", "crank_nicolson", "backward_euler")
+
+# Stable step of each integrator on the negative real axis, in units of 1/(D·ρ)
+STABILITY_EXTENT = {"euler": 2.0, "rk4": 2.785293563405282,
+                    "crank_nicolson": np.inf, "backward_euler": np.inf}
+
+
+class DiffusionIntegrator:
+    """
+    One-step integrator for ∂S/∂t = D ∇²S.
+
+    Parameters:
+    -----------
+    laplacian : LaplacianOperator
+        Spatial operator of the explicit methods (its dx is used throughout)
+    diffusion_coefficient : float
+        D (non-negative)
+    method : str
+        One of INTEGRATORS
+    """
+
+    def __init__(self, laplacian, diffusion_coefficient, method="euler"):
+        if method not in INTEGRATORS:
+            raise ValueError(f"Integrator must be one of {INTEGRATORS}.")
+        if (not isinstance(diffusion_coefficient, (int, float))
+                or not diffusion_coefficient >= 0):
+            raise ValueError("Diffusion coefficient must be a non-negative number.")
+        self.laplacian = laplacian
+        self.D = diffusion_coefficient
+        self.method = method
+        self._gain = None  # (shape, dt, amplification factors) of the implicit solve
+
+    def step(self, S, dt):
+        """Return S advanced by dt."""
+        if self.method == "euler":
+            return S + dt * self.D * self.laplacian(S)
+        if self.method == "rk4":
+            return self._rk4(S, dt)
+        return self._implicit(S, dt)
+
+    def _rk4(self, S, dt):
+        D, L = self.D, self.laplacian
+        k = L(S)
+        k *= D
+        total = k.copy()
+        for weight, fraction in ((2.0, 0.5), (2.0, 0.5), (1.0, 1.0)):
+            k *= dt * fraction
+            k += S
+            k = L(k)
+            k *= D
+            total += weight * k
+        total *= dt / 6.0
+        total += S
+        return total
+
+    def _implicit(self, S, dt):
+        from scipy import fft
+
+        gain = self._amplification(S.shape, dt)
+        spectrum = fft.dctn(S, type=2, norm="ortho", workers=-1)
+        spectrum *= gain
+        return fft.idctn(spectrum, type=2, norm="ortho", workers=-1)
+
+    def _amplification(self, shape, dt):
+        """Per-mode growth factor of the implicit step, cached per (shape, dt)."""
+        if self._gain is not None and self._gain[:2] == (shape, dt):
+            return self._gain[2]
+        dx = self.laplacian.dx
+        # DCT-II eigenvalues of the reflecting 3-point Laplacian, summed over axes
+        eigenvalues = np.zeros(shape)
+        for axis, n in enumerate(shape):
+            along = -4.0 * np.sin(np.pi * np.arange(n) / (2 * n))**2 / dx**2
+            eigenvalues += along.reshape([-1 if a == axis else 1 for a in range(len(shape))])
+        z = dt * self.D * eigenvalues
+        if self.method == "crank_nicolson":
+            gain = (1 + 0.5 * z) / (1 - 0.5 * z)
+        else:
+            gain = 1 / (1 - z)
+        self._gain = (shape, dt, gain)
+        return gain
+
+    def stability_limit(self):
+        """Largest stable dt (np.inf for the implicit methods)."""
+        if self.D == 0:
+            return np.inf
+        return STABILITY_EXTENT[self.method] / (self.D * self.laplacian.spectral_radius)
+
+
+class AdaptiveTimeStep:
+    """
+    Step-size controller for evolve_metric(..., adaptive=...).
+
+    Parameters:
+    -----------
+    dt_min : float
+        Smallest step allowed (the run fails if stability needs less)
+    dt_max : float
+        Largest step allowed
+    max_change : float
+        Largest change of any metric / K component per step
+    safety : float
+        Fraction of the diffusion stability limit to use, in (0, 1]
+    growth : float
+        Largest factor by which dt may grow from one step to the next
+    """
+
+    def __init__(self, dt_min, dt_max, max_change=1e-3, safety=0.9, growth=2.0):
+        # Security: same bounds as the engine's fixed dt
+        for name, value in (("dt_min", dt_min), ("dt_max", dt_max)):
+            if not isinstance(value, (int, float)) or not 0 < value <= 1000.0:
+                raise ValueError(f"{name} must be a positive number no larger than 1000.")
+        if dt_min > dt_max:
+            raise ValueError("dt_min must not exceed dt_max.")
+        if not isinstance(max_change, (int, float)) or not max_change > 0:
+            raise ValueError("max_change must be a positive number.")
+        if not isinstance(safety, (int, float)) or not 0 < safety <= 1:
+            raise ValueError("safety must be in (0, 1].")
+        if not isinstance(growth, (int, float)) or not growth > 1:
+            raise ValueError("growth must be greater than 1.")
+
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.max_change = max_change
+        self.safety = safety
+        self.growth = growth
+
+    def diffusion_limit(self, integrator):
+        """Largest dt to use with a DiffusionIntegrator (safety · stability limit)."""
+        return self.safety * integrator.stability_limit()
+
+    def check(self, stability_limit):
+        """Reject runs whose stability limit is below dt_min."""
+        if stability_limit < self.dt_min:
+            raise ValueError(f"Diffusion stability requires dt <= {stability_limit:.3g}, "
+                             f"below dt_min = {self.dt_min:.3g}.")
+
+    def propose(self, dt_prev, rate, stability_limit=np.inf):
+        """
+        Step size for the next step.
+
+        Parameters:
+        -----------
+        dt_prev : float
+            Step size of the previous step (the configured dt at the start)
+        rate : float or None
+            Largest |∂g/∂t| or |∂K/∂t| of the previous step (None at the start)
+        stability_limit : float
+            Diffusion stability limit (np.inf when nothing diffuses)
+        """
+        if rate is None:
+            dt = dt_prev
+        else:
+            dt = self.growth * dt_prev
+            if rate > 0:
+                dt = min(dt, self.max_change / rate)
+        dt = min(dt, self.dt_max, stability_limit)
+        return max(dt, self.dt_min)
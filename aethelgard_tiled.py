@@ -0,0 +1,261 @@
+"""
+Tiled Engine for Aethelgard-QGF
+
+AethelgardEngineTiled lifts the 256³ limit of AethelgardEngine, which keeps
+every field in one in-memory array, by working block by block. The domain is
+cut into tiles of at most tile_size cells per axis. Each tile is read
+together with the ghost layers its Laplacian stencil reaches
+(laplacian.halo), so every cell sees exactly the neighbours it has in the
+full grid. Because the rest of the solve is local to each cell, results are
+bit-for-bit identical to the monolithic engine. Peak memory is a few
+(tile_size + 2·halo)³ arrays, whatever the grid size.
+
+Out of core: with `storage` set, the metric lives in a memory-mapped file
+(storage/metric.npy, the (4, N, N, N) CompactMetric components), and so does
+the pressure field returned by calculate_quantum_pressure (a new
+storage/T_quantum-*.npy per call, so earlier results stay valid). Inputs may
+be ordinary arrays or memory maps, e.g. np.load(path, mmap_mode="r").
+
+In parallel: with workers > 1, tiles are solved in a spawn-context process
+pool. Workers reopen the memory-mapped metric and inputs and write disjoint
+tiles, so only file names cross process boundaries. This needs `storage`.
+In-memory inputs are written there once per solve and removed afterwards.
+"""
+
+import mmap
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from aethelgard_cache import SourceTermCache
+from aethelgard_checkpoint import checked_dir
+from aethelgard_engine import AethelgardEngine
+from aethelgard_metric import CompactMetric
+from aethelgard_operators import BOUNDARIES, LaplacianOperator
+
+METRIC_FILE = "metric.npy"
+
+# Solvers that act cell by cell (the global elliptic solves need the whole grid)
+TILED_SOLVERS = ("auto", "closed_form", "iterative")
+
+
+class AethelgardEngineTiled(AethelgardEngine):
+    """
+    Block-decomposed AethelgardEngine for grids beyond 256³.
+
+    Parameters:
+    -----------
+    grid_size, domain_size, stencil, backend, dtype :
+        As for AethelgardEngine (grid_size up to MAX_GRID_SIZE with storage,
+        else up to AethelgardEngine.MAX_GRID_SIZE)
+    tile_size : int
+        Largest tile edge in cells (at most 256, like one monolithic grid)
+    storage : str or Path, optional
+        Directory for the memory-mapped fields; None keeps them in memory
+    workers : int
+        Processes solving tiles in parallel (> 1 requires storage)
+    """
+
+    # Security: bounded by disk, not memory (a 2048³ metric is 275 GB), so
+    # grids beyond the monolithic cap need storage
+    MAX_GRID_SIZE = 2048
+
+    def __init__(self, grid_size=32, domain_size=10.0, stencil="gradient", backend=None,
+                 tile_size=64, storage=None, workers=1, dtype=np.float64):
+        # Security: Input validation
+        if not isinstance(tile_size, int) or not 0 < tile_size <= 256:
+            raise ValueError("Tile size must be a positive integer no larger than 256.")
+        if not isinstance(workers, int) or workers <= 0:
+            raise ValueError("Workers must be a positive integer.")
+        if workers > 1 and storage is None:
+            raise ValueError("Parallel workers need a storage directory to share fields.")
+        if (storage is None and isinstance(grid_size, int)
+                and grid_size > AethelgardEngine.MAX_GRID_SIZE):
+            raise ValueError(f"Grid sizes above {AethelgardEngine.MAX_GRID_SIZE} need a storage "
+                             "directory; the metric would not fit in memory.")
+
+        self.tile_size = tile_size
+        self.workers = workers
+        self.storage = None
+        if storage is not None:
+            self.storage = checked_dir(storage)
+            self.storage.mkdir(parents=True, exist_ok=True)
+        super().__init__(grid_size, domain_size, stencil, backend, dtype)
+        self._require_host()
+
+    def _new_metric(self):
+        if self.storage is None:
+            return super()._new_metric()
+        components = np.lib.format.open_memmap(
+            self.storage / METRIC_FILE, mode="w+", dtype=self.dtype,
+            shape=(4,) + (self.N,) * 3)
+        components[...] = 1.0
+        return CompactMetric(components.shape[1:], components=components)
+
+    def __getstate__(self):
+        # Workers reopen the memory-mapped metric instead of receiving a copy,
+        # and rebuild the objects holding modules (backend, kernels, thread pools)
+        state = self.__dict__.copy()
+        state.update(metric=None, _backend=None, xp=None, _kernels=None,
+                     sources=SourceTermCache(), laplacian=self.laplacian.stencil)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._use_backend(self.backend)
+        self.laplacian = LaplacianOperator(self.dx, state["laplacian"])
+        components = np.load(self.storage / METRIC_FILE, mmap_mode="r+")
+        self.metric = CompactMetric(components.shape[1:], components=components)
+
+    def tiles(self):
+        """Global index tuples of every tile (sizes differ by at most one cell per axis)."""
+        count = -(-self.N // self.tile_size)
+        edges = [i * self.N // count for i in range(count + 1)]
+        spans = [slice(a, b) for a, b in zip(edges[:-1], edges[1:], strict=True)]
+        return [(z, y, x) for z in spans for y in spans for x in spans]
+
+    def _with_halo(self, tile):
+        """(padded tile, index of the tile inside the padded block)."""
+        h = self.laplacian.halo
+        padded = tuple(slice(max(s.start - h, 0), min(s.stop + h, self.N)) for s in tile)
+        inner = tuple(slice(s.start - p.start, s.stop - p.start)
+                      for s, p in zip(tile, padded, strict=True))
+        return padded, inner
+
+    def _tile_pressure(self, entropy_field, tile):
+        padded, inner = self._with_halo(tile)
+        block = np.array(entropy_field[padded])
+        return super().calculate_quantum_pressure(block)[inner]
+
+    def _check_field(self, name, field):
+        if field.shape != (self.N, self.N, self.N):
+            raise ValueError(f"{name} shape {field.shape} must match grid size "
+                             f"({self.N}, {self.N}, {self.N}).")
+
+    def calculate_quantum_pressure(self, entropy_field, out=None):
+        """
+        Quantum pressure of the whole grid, computed tile by tile.
+
+        Written into `out` if given; otherwise into a new memory-mapped
+        storage/T_quantum-*.npy when the engine has storage, else a new array.
+        """
+        self._check_field("Entropy map", entropy_field)
+        if out is None:
+            # Same precision as the input, like the monolithic engine
+            dtype = entropy_field.dtype
+            if self.storage is None:
+                out = np.empty(entropy_field.shape, dtype=dtype)
+            else:
+                out = np.lib.format.open_memmap(self._storage_file("T_quantum"), mode="w+",
+                                                dtype=dtype, shape=entropy_field.shape)
+        for tile in self.tiles():
+            out[tile] = self._tile_pressure(entropy_field, tile)
+        return out
+
+    def solve_field_equations(self, mass_distribution, entropy_map, iterations=50, verbose=True,
+                              solver="auto", tol=None, return_info=False, boundary="dirichlet",
+                              multigrid=None, cache=None):
+        """
+        Tile-by-tile version of AethelgardEngine.solve_field_equations.
+
+        Solvers are limited to the cell-local ones (TILED_SOLVERS); the
+        tolerance-tracked sweep and the spectral / multigrid solves need the
+        whole grid at once. tol, multigrid and cache are therefore rejected
+        with ValueError; boundary only applies to those global solves.
+
+        Returns:
+        --------
+        metric : CompactMetric
+            The engine's metric, updated in place (memory-mapped with storage)
+        info : dict
+            Only with return_info: self.solver_info (no residuals)
+        """
+        # Security: Input validation
+        if not isinstance(iterations, int) or iterations <= 0:
+            raise ValueError("Iterations must be a positive integer.")
+        if iterations > 10000:
+            raise ValueError("Iterations exceeds maximum limit of 10000.")
+        if solver not in TILED_SOLVERS:
+            raise ValueError(f"The tiled engine supports solvers {TILED_SOLVERS}.")
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Boundary must be one of {BOUNDARIES}.")
+        if tol is not None or multigrid is not None:
+            raise ValueError("The tiled engine has no tracked sweep or multigrid solve "
+                             "(tol and multigrid need the whole grid).")
+        if cache is not None:
+            raise ValueError("The tiled engine does not support a result cache.")
+        self._check_field("Mass distribution", mass_distribution)
+        self._check_field("Entropy map", entropy_map)
+
+        tiles = self.tiles()
+        if verbose:
+            print(f"Synthesizing metric for Aethelgard-QGF ({len(tiles)} tiles)...")
+
+        if self.workers > 1:
+            spilled = []
+            try:
+                mass_ref = self._share(mass_distribution, "mass", spilled)
+                entropy_ref = self._share(entropy_map, "entropy", spilled)
+                tasks = [(self, mass_ref, entropy_ref, tile, iterations, solver)
+                         for tile in tiles]
+                # spawn, not fork: forking after Numba/BLAS thread pools start can deadlock
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                    resolved = list(pool.map(_solve_tile_task, tasks,
+                                             chunksize=max(1, len(tasks) // (4 * self.workers))))
+            finally:
+                for path in spilled:
+                    path.unlink()
+            solver = resolved[0]
+        else:
+            for tile in tiles:
+                solver = self._solve_tile(mass_distribution, entropy_map, tile, iterations, solver)
+
+        self.solver_info = {'solver': solver, 'iterations': iterations, 'converged': None,
+                            'residual_max': None, 'residual_rms': None}
+        if return_info:
+            return self.metric, self.solver_info
+        return self.metric
+
+    def _solve_tile(self, mass_distribution, entropy_map, tile, iterations, solver):
+        """Solve one tile into self.metric; return the solver actually used."""
+        T_repulsive = self._tile_pressure(entropy_map, tile)
+        g_00 = np.array(self.metric.g_00[tile])
+        self.metric.g_00[tile] = self._solve_g00(g_00, np.asarray(mass_distribution[tile]),
+                                                 T_repulsive, iterations, solver)
+        return self.solver_info['solver']
+
+    def _storage_file(self, prefix):
+        """A new, uniquely named .npy path in storage; no existing file is reused."""
+        fd, path = tempfile.mkstemp(prefix=f"{prefix}-", suffix=".npy", dir=self.storage)
+        os.close(fd)
+        return Path(path)
+
+    def _share(self, field, name, spilled):
+        """
+        Reference to `field` that a worker can open: (file, dtype, shape, offset).
+        Files written for in-memory fields are appended to `spilled`.
+        """
+        # Only a memmap that maps its file directly (not a view of one) can be reopened
+        if not (isinstance(field, np.memmap) and isinstance(field.base, mmap.mmap)
+                and field.flags.c_contiguous):
+            path = self._storage_file(name)
+            spilled.append(path)
+            np.save(path, field)
+            field = np.load(path, mmap_mode="r")
+        return (field.filename, field.dtype.str, field.shape, field.offset)
+
+    def calculate_paradox_hazard(self):
+        """Paradox hazard of the whole metric, reduced tile by tile."""
+        return max(float(self._hazard_from_g00(self.metric.g_00[tile])) for tile in self.tiles())
+
+
+def _solve_tile_task(task):
+    engine, mass_ref, entropy_ref, tile, iterations, solver = task
+    mass, entropy = (np.memmap(Path(filename), dtype=dtype, mode="r", shape=shape, offset=offset)
+                     for filename, dtype, shape, offset in (mass_ref, entropy_ref))
+    return engine._solve_tile(mass, entropy, tile, iterations, solver)
@@ -11,16 +11,12 @@ matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 
 from aethelgard_engine import AethelgardEngine
+from aethelgard_grid import coordinate_grid
 
 
 def create_gaussian_distribution(grid_size, center, sigma):
     """Create a 3D Gaussian distribution centered at a point."""
-    x = np.linspace(0, 10, grid_size)
-    y = np.linspace(0, 10, grid_size)
-    z = np.linspace(0, 10, grid_size)
-    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
-    
-    dist = np.sqrt((X - center[0])**2 + (Y - center[1])**2 + (Z - center[2])**2)
+    dist = coordinate_grid(grid_size, 10.0).radial_distance(center)
     return np.exp(-dist**2 / (2 * sigma**2))
 
 def visualize_slice(data, title, slice_idx=16):
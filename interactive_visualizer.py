@@ -14,21 +14,27 @@ Then open your browser to: http://localhost:8050
 """
 
 
+from importlib.util import find_spec
+from pathlib import Path
+
 import numpy as np
 
-try:
+from aethelgard_cache import ResultCache
+from aethelgard_engine import AethelgardEngine
+
+# Plotly and Dash take about a second to import, so they are imported on first
+# use (_load_interactive); availability is checked without importing them.
+INTERACTIVE_AVAILABLE = find_spec("dash") is not None and find_spec("plotly") is not None
+
+
+def _load_interactive():
+    """Import Plotly and Dash into this module's namespace (once)."""
+    global dash, go, dcc, html, Input, Output, State, make_subplots
     import dash
     import plotly.graph_objects as go
     from dash import dcc, html
     from dash.dependencies import Input, Output, State
     from plotly.subplots import make_subplots
-    INTERACTIVE_AVAILABLE = True
-except ImportError:
-    INTERACTIVE_AVAILABLE = False
-    print("⚠ Plotly/Dash not installed. Install with:")
-    print("  pip install plotly dash")
-
-from aethelgard_engine import AethelgardEngine
 
 
 class InteractiveVisualizer:
@@ -36,7 +42,7 @@ class InteractiveVisualizer:
     Interactive 3D visualizer for Aethelgard-QGF simulations.
     """
     
-    def __init__(self, grid_size=32, domain_size=10.0):
+    def __init__(self, grid_size=32, domain_size=10.0, cache=None):
         """
         Initialize visualizer.
         
@@ -46,17 +52,17 @@ class InteractiveVisualizer:
             Grid resolution
         domain_size : float
             Domain size in meters
+        cache : ResultCache, optional
+            Persistent result cache for the scenario solves
         """
         if not INTERACTIVE_AVAILABLE:
             raise ImportError("Plotly and Dash required. Install with: pip install plotly dash")
+        _load_interactive()
         
         self.engine = AethelgardEngine(grid_size=grid_size, domain_size=domain_size)
         self.grid_size = grid_size
         self.domain_size = domain_size
-        
-        # Create coordinate grids
-        x = np.linspace(0, domain_size, grid_size)
-        self.X, self.Y, self.Z = np.meshgrid(x, x, x, indexing='ij')
+        self.cache = cache
         
         # Storage for current simulation
         self.mass_dist = None
@@ -265,10 +271,11 @@ class InteractiveVisualizer:
             else:  # isosurface
                 # Create 3D isosurface
                 isovalue = np.median(data)
+                X, Y, Z = self.engine.coordinates.dense()
                 fig = go.Figure(data=go.Isosurface(
-                    x=self.X.flatten(),
-                    y=self.Y.flatten(),
-                    z=self.Z.flatten(),
+                    x=X.flatten(),
+                    y=Y.flatten(),
+                    z=Z.flatten(),
                     value=data.flatten(),
                     isomin=isovalue * 0.9,
                     isomax=isovalue * 1.1,
@@ -293,33 +300,28 @@ class InteractiveVisualizer:
     
     def _create_blackhole_scenario(self):
         """Create black hole scenario."""
-        r = np.sqrt((self.X - self.domain_size/2)**2 + 
-                   (self.Y - self.domain_size/2)**2 + 
-                   (self.Z - self.domain_size/2)**2)
-        r = np.maximum(r, 0.1)
+        r = self.engine.coordinates.radial_distance(floor=0.1)
         
         self.mass_dist = 5e12 / (r**2 + 0.5)
         self.entropy_map = 15.0 * np.exp(-r**2 / 4.0)
         
         self.metric = self.engine.solve_field_equations(
-            self.mass_dist, self.entropy_map, iterations=100, verbose=False
+            self.mass_dist, self.entropy_map, iterations=100, verbose=False, cache=self.cache
         )
-        self.quantum_pressure = self.engine.calculate_quantum_pressure(self.entropy_map)
+        self.quantum_pressure = self._quantum_pressure()
     
     def _create_wormhole_scenario(self):
         """Create wormhole scenario."""
-        r = np.sqrt((self.X - self.domain_size/2)**2 + 
-                   (self.Y - self.domain_size/2)**2 + 
-                   (self.Z - self.domain_size/2)**2)
+        r = self.engine.coordinates.radial_distance()
         
         r_throat = 2.5
         self.mass_dist = 8e11 * np.exp(-((r - r_throat)**2) / 0.8)
         self.entropy_map = 20.0 * np.exp(-((r - r_throat)**2) / 0.5)
         
         self.metric = self.engine.solve_field_equations(
-            self.mass_dist, self.entropy_map, iterations=100, verbose=False
+            self.mass_dist, self.entropy_map, iterations=100, verbose=False, cache=self.cache
         )
-        self.quantum_pressure = self.engine.calculate_quantum_pressure(self.entropy_map)
+        self.quantum_pressure = self._quantum_pressure()
     
     def _create_darkenergy_scenario(self):
         """Create dark energy scenario."""
@@ -328,36 +330,41 @@ class InteractiveVisualizer:
         self.entropy_map = np.abs(self.entropy_map)
         
         self.metric = self.engine.solve_field_equations(
-            self.mass_dist, self.entropy_map, iterations=100, verbose=False
+            self.mass_dist, self.entropy_map, iterations=100, verbose=False, cache=self.cache
         )
-        self.quantum_pressure = self.engine.calculate_quantum_pressure(self.entropy_map)
+        self.quantum_pressure = self._quantum_pressure()
     
     def _create_custom_scenario(self):
         """Create custom Gaussian scenario."""
         center = self.domain_size / 2
-        self.mass_dist = 1e11 * np.exp(-((self.X-center)**2 + (self.Y-center)**2 + (self.Z-center)**2) / 4.0)
-        self.entropy_map = 10.0 * np.exp(-((self.X-center)**2 + (self.Y-center)**2 + (self.Z-center)**2) / 6.0)
+        x, y, z = self.engine.coordinates.axes
+        distance2 = (x-center)**2 + (y-center)**2 + (z-center)**2
+        self.mass_dist = 1e11 * np.exp(-distance2 / 4.0)
+        self.entropy_map = 10.0 * np.exp(-distance2 / 6.0)
         
         self.metric = self.engine.solve_field_equations(
-            self.mass_dist, self.entropy_map, iterations=100, verbose=False
+            self.mass_dist, self.entropy_map, iterations=100, verbose=False, cache=self.cache
         )
-        self.quantum_pressure = self.engine.calculate_quantum_pressure(self.entropy_map)
+        self.quantum_pressure = self._quantum_pressure()
 
     def _create_supernova_scenario(self):
         """Create supernova collapse scenario."""
-        r = np.sqrt((self.X - self.domain_size/2)**2 + 
-                   (self.Y - self.domain_size/2)**2 + 
-                   (self.Z - self.domain_size/2)**2)
+        r = self.engine.coordinates.radial_distance()
         
         # High density core, expanding shell
         self.mass_dist = 2e12 * np.exp(-r**2 / 1.0) + 5e11 * np.exp(-(r-4)**2 / 0.5)
         self.entropy_map = 25.0 * np.exp(-r**2 / 2.0)
         
         self.metric = self.engine.solve_field_equations(
-            self.mass_dist, self.entropy_map, iterations=100, verbose=False
+            self.mass_dist, self.entropy_map, iterations=100, verbose=False, cache=self.cache
         )
-        self.quantum_pressure = self.engine.calculate_quantum_pressure(self.entropy_map)
+        self.quantum_pressure = self._quantum_pressure()
     
+    def _quantum_pressure(self):
+        """Quantum pressure of the current entropy map (stored by a cached solve)."""
+        return self.engine.sources.get("T_quantum", (self.entropy_map,),
+                                       self.engine.calculate_quantum_pressure)
+
     def _compute_statistics(self, data, field_name):
         """Compute statistics for display."""
         stats = f"""
@@ -413,6 +420,7 @@ def create_static_3d_visualization(engine, metric, mass_dist, entropy_map, outpu
     if not INTERACTIVE_AVAILABLE:
         print("⚠ Plotly not available. Install with: pip install plotly")
         return
+    _load_interactive()
     
     # Create subplots
     fig = make_subplots(
@@ -466,7 +474,9 @@ def create_static_3d_visualization(engine, metric, mass_dist, entropy_map, outpu
 if __name__ == "__main__":
     if INTERACTIVE_AVAILABLE:
         # Create and run visualizer
-        viz = InteractiveVisualizer(grid_size=32, domain_size=10.0)
+        # Scenario results persist across dashboard restarts
+        cache = ResultCache(Path(__file__).parent / 'scenarios' / 'output' / 'cache')
+        viz = InteractiveVisualizer(grid_size=32, domain_size=10.0, cache=cache)
         viz.run(debug=False, port=8050)
     else:
         print("\n❌ Cannot run interactive visualizer without Plotly and Dash")
@@ -12,21 +12,66 @@ Physical Interpretation:
 - Results in a "gravastar" or "quantum star" configuration
 """
 
-import matplotlib
-import numpy as np
-
-matplotlib.use('Agg')
 import sys
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from grid_utils import radial_distance
+
+from aethelgard_cache import ResultCache
 from aethelgard_engine import AethelgardEngine
 
 
-def create_black_hole_scenario(grid_size=64, domain_size=20.0):
+def build_black_hole_inputs(grid_size=64, domain_size=20.0, core_radius=2.0,
+                            entropy_scale=1e67, seed=42, r=None):
+    """
+    Build the mass and entropy fields for the black hole scenario.
+
+    Parameters:
+    -----------
+    grid_size : int
+        Number of grid points per dimension
+    domain_size : float
+        Physical size of domain in meters
+    core_radius : float
+        Radius of the high-entropy quantum core in meters
+    entropy_scale : float
+        Entropy amplitude (~10^66 or more to balance gravity in SI units)
+    seed : int
+        Seed for the quantum fluctuations
+    r : ndarray, optional
+        Precomputed radial_distance(grid_size, domain_size, floor=0.1)
+
+    Returns:
+    --------
+    tuple
+        (mass_distribution, entropy_map)
+    """
+    if r is None:
+        r = radial_distance(grid_size, domain_size, floor=0.1)  # Avoid division by zero
+
+    # Mass distribution: 1/r^2 profile (like Schwarzschild)
+    # Scale mass to astrophysical densities (~1e27 kg/m³) to observe GR effects
+    mass_scale = 1e27
+    mass_distribution = 5.0 * mass_scale / (r**2 + 0.5)  # kg/m³
+
+    # Quantum entropy: High at core, decreasing outward
+    # (Bekenstein-Hawking entropy S = A/4Lp^2 ~ 10^70 for macroscopic objects)
+    entropy_map = 15.0 * entropy_scale * np.exp(-r**2 / core_radius**2)
+
+    # Add quantum fluctuations
+    np.random.seed(seed)
+    entropy_map += 0.5 * entropy_scale * np.random.randn(grid_size, grid_size, grid_size)
+    entropy_map = np.abs(entropy_map)
+
+    return mass_distribution, entropy_map
+
+
+def create_black_hole_scenario(grid_size=64, domain_size=20.0, core_radius=2.0,
+                               entropy_scale=1e67, iterations=200, cache=None):
     """
     Create a black hole with quantum core.
     
@@ -36,6 +81,14 @@ def create_black_hole_scenario(grid_size=64, domain_size=20.0):
         Number of grid points per dimension
     domain_size : float
         Physical size of domain in meters
+    core_radius : float
+        Radius of the high-entropy quantum core in meters
+    entropy_scale : float
+        Entropy amplitude of the core
+    iterations : int
+        Solver iterations
+    cache : ResultCache, optional
+        Persistent result cache; a repeated run reads its solves from disk
     """
     print("=" * 70)
     print("BLACK HOLE WITH QUANTUM CORE")
@@ -45,33 +98,13 @@ def create_black_hole_scenario(grid_size=64, domain_size=20.0):
     # Initialize engine
     engine = AethelgardEngine(grid_size=grid_size, domain_size=domain_size)
     
-    # Create coordinate grid
-    x = np.linspace(0, domain_size, grid_size)
-    X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
-    
-    # Radial distance from center
-    center = domain_size / 2
-    r = np.sqrt((X - center)**2 + (Y - center)**2 + (Z - center)**2)
-    r = np.maximum(r, 0.1)  # Avoid division by zero
-    
-    # Mass distribution: 1/r^2 profile (like Schwarzschild)
     print("\n[1/4] Creating black hole mass distribution (1/r² profile)...")
-    # Scale mass to astrophysical densities (~1e27 kg/m³) to observe GR effects
-    mass_scale = 1e27
-    mass_distribution = 5.0 * mass_scale / (r**2 + 0.5)  # kg/m³
-    
-    # Quantum entropy: High at core, decreasing outward
     print("[2/4] Generating quantum core (high entropy region)...")
-    r_core = 2.0  # Core radius in meters
-    # Entropy must be ~10^66 to create pressure comparable to gravity in SI units
-    # (Bekenstein-Hawking entropy S = A/4Lp^2 ~ 10^70 for macroscopic objects)
-    entropy_scale = 1e67
-    entropy_map = 15.0 * entropy_scale * np.exp(-r**2 / r_core**2)
-    
-    # Add quantum fluctuations
-    np.random.seed(42)
-    entropy_map += 0.5 * entropy_scale * np.random.randn(grid_size, grid_size, grid_size)
-    entropy_map = np.abs(entropy_map)
+    r = radial_distance(grid_size, domain_size, floor=0.1)
+    mass_distribution, entropy_map = build_black_hole_inputs(
+        grid_size, domain_size, core_radius, entropy_scale, r=r
+    )
+    r_core = core_radius
     
     # Solve field equations
     print("[3/4] Solving modified Einstein equations...")
@@ -79,30 +112,36 @@ def create_black_hole_scenario(grid_size=64, domain_size=20.0):
     result_metric = engine.solve_field_equations(
         mass_distribution,
         entropy_map,
-        iterations=200
+        iterations=iterations,
+        cache=cache
     )
     
     # Extract metric component
     g_00 = result_metric[..., 0, 0]
 
     # Control Run: Classical Black Hole (No Quantum Core)
+    # Solved as a one-member batch: no second engine or metric allocation
     print("\n[3.5/4] Running classical control simulation (no quantum core)...")
-    engine_classic = AethelgardEngine(grid_size=grid_size, domain_size=domain_size)
-    metric_classic = engine_classic.solve_field_equations(
-        mass_distribution,
-        np.zeros_like(entropy_map),
-        iterations=200
+    g_00_classic_batch, _ = engine.solve_field_equations_batch(
+        mass_distribution[np.newaxis],
+        np.zeros((1,) + entropy_map.shape),
+        iterations=iterations,
+        cache=cache
     )
-    g_00_classic = metric_classic[..., 0, 0]
+    g_00_classic = g_00_classic_batch[0]
 
     # Calculate Quantum Shift
     quantum_shift = g_00 - g_00_classic
     
     # Calculate quantum pressure
-    T_quantum = engine.calculate_quantum_pressure(entropy_map)
+    T_quantum = engine.sources.get("T_quantum", (entropy_map,),
+                                   engine.calculate_quantum_pressure)
     
     # Visualizations
     print("[4/4] Generating visualizations...")
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     
     # Create output directory
     output_dir = Path(__file__).parent / 'output'
@@ -229,4 +268,4 @@ def create_black_hole_scenario(grid_size=64, domain_size=20.0):
 
 
 if __name__ == "__main__":
-    create_black_hole_scenario()
+    create_black_hole_scenario(cache=ResultCache(Path(__file__).parent / 'output' / 'cache'))
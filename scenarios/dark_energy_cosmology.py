@@ -12,20 +12,62 @@ Physical Interpretation:
 - Repulsive pressure → accelerated expansion
 """
 
-import matplotlib
-import numpy as np
-
-matplotlib.use('Agg')
 import sys
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from aethelgard_cache import ResultCache
 from aethelgard_engine import AethelgardEngine
 
 
-def create_dark_energy_scenario(grid_size=32, domain_size=10.0):
+def build_dark_energy_inputs(grid_size=32, domain_size=10.0, vacuum_entropy=5.0,
+                             entropy_scale=1.0, seed=42):
+    """
+    Build the mass and entropy fields for the dark energy scenario.
+
+    Parameters:
+    -----------
+    grid_size : int
+        Number of grid points per dimension
+    domain_size : float
+        Physical size of domain in meters (unused: the fields are uniform
+        plus noise, accepted so all scenario builders share a signature)
+    vacuum_entropy : float
+        Uniform background entropy level
+    entropy_scale : float
+        Multiplier applied to the whole entropy field
+    seed : int
+        Seed for the matter and vacuum fluctuations
+
+    Returns:
+    --------
+    tuple
+        (mass_distribution, entropy_map)
+    """
+    # Minimal matter density (nearly empty universe)
+    mass_distribution = np.ones((grid_size, grid_size, grid_size)) * 1e6  # Very low density
+
+    # Add small matter perturbations (structure seeds)
+    np.random.seed(seed)
+    perturbations = 1e7 * np.random.randn(grid_size, grid_size, grid_size)
+    mass_distribution += perturbations
+    mass_distribution = np.abs(mass_distribution)
+
+    # Quantum vacuum entropy: Nearly uniform with fluctuations
+    # Quantum fluctuations (scale-invariant)
+    entropy_fluctuations = 0.5 * np.random.randn(grid_size, grid_size, grid_size)
+
+    # Total entropy field
+    entropy_map = vacuum_entropy + entropy_fluctuations
+    entropy_map = np.abs(entropy_map) * entropy_scale
+
+    return mass_distribution, entropy_map
+
+
+def create_dark_energy_scenario(grid_size=32, domain_size=10.0, vacuum_entropy=5.0,
+                                entropy_scale=1.0, iterations=100, cache=None):
     """
     Create a dark energy cosmology simulation.
     
@@ -35,6 +77,14 @@ def create_dark_energy_scenario(grid_size=32, domain_size=10.0):
         Number of grid points per dimension
     domain_size : float
         Physical size of domain in meters (represents cosmological patch)
+    vacuum_entropy : float
+        Uniform background entropy level
+    entropy_scale : float
+        Multiplier applied to the whole entropy field
+    iterations : int
+        Solver iterations
+    cache : ResultCache, optional
+        Persistent result cache; a repeated run reads its solves from disk
     """
     print("=" * 70)
     print("DARK ENERGY FROM QUANTUM VACUUM")
@@ -44,44 +94,33 @@ def create_dark_energy_scenario(grid_size=32, domain_size=10.0):
     # Initialize engine
     engine = AethelgardEngine(grid_size=grid_size, domain_size=domain_size)
     
-    # Minimal matter density (nearly empty universe)
     print("\n[1/4] Creating nearly empty universe...")
-    mass_distribution = np.ones((grid_size, grid_size, grid_size)) * 1e6  # Very low density
-    
-    # Add small matter perturbations (structure seeds)
-    np.random.seed(42)
-    perturbations = 1e7 * np.random.randn(grid_size, grid_size, grid_size)
-    mass_distribution += perturbations
-    mass_distribution = np.abs(mass_distribution)
-    
-    # Quantum vacuum entropy: Nearly uniform with fluctuations
     print("[2/4] Generating quantum vacuum entropy field...")
-    # Base vacuum entropy
-    vacuum_entropy = 5.0  # Uniform background
-    
-    # Quantum fluctuations (scale-invariant)
-    entropy_fluctuations = 0.5 * np.random.randn(grid_size, grid_size, grid_size)
-    
-    # Total entropy field
-    entropy_map = vacuum_entropy + entropy_fluctuations
-    entropy_map = np.abs(entropy_map)
+    mass_distribution, entropy_map = build_dark_energy_inputs(
+        grid_size, domain_size, vacuum_entropy, entropy_scale
+    )
     
     # Solve field equations
     print("[3/4] Solving cosmological field equations...")
     result_metric = engine.solve_field_equations(
         mass_distribution,
         entropy_map,
-        iterations=100
+        iterations=iterations,
+        cache=cache
     )
     
     # Extract metric
     g_00 = result_metric[..., 0, 0]
     
     # Calculate quantum pressure (dark energy)
-    T_quantum = engine.calculate_quantum_pressure(entropy_map)
+    T_quantum = engine.sources.get("T_quantum", (entropy_map,),
+                                   engine.calculate_quantum_pressure)
     
     # Visualizations
     print("[4/4] Generating visualizations...")
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     
     output_dir = Path(__file__).parent / 'output'
     output_dir.mkdir(exist_ok=True)
@@ -122,12 +161,9 @@ def create_dark_energy_scenario(grid_size=32, domain_size=10.0):
     fft_3d = np.fft.fftn(g_perturbation)
     power_spectrum = np.abs(fft_3d)**2
     
-    # Spherically average
-    kx = np.fft.fftfreq(grid_size)
-    ky = np.fft.fftfreq(grid_size)
-    kz = np.fft.fftfreq(grid_size)
-    KX, KY, KZ = np.meshgrid(kx, ky, kz, indexing='ij')
-    k_mag = np.sqrt(KX**2 + KY**2 + KZ**2)
+    # Spherically average (open k axes: only |k| is a full grid)
+    k = np.fft.fftfreq(grid_size)
+    k_mag = np.sqrt(k[:, None, None]**2 + k[None, :, None]**2 + k[None, None, :]**2)
     
     k_bins = np.linspace(0, 0.5, 20)
     P_k = []
@@ -222,4 +258,4 @@ def create_dark_energy_scenario(grid_size=32, domain_size=10.0):
 
 
 if __name__ == "__main__":
-    create_dark_energy_scenario()
+    create_dark_energy_scenario(cache=ResultCache(Path(__file__).parent / 'output' / 'cache'))
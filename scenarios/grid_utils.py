@@ -0,0 +1,31 @@
+"""
+Grid helpers shared by the scenario scripts.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from aethelgard_grid import coordinate_grid
+
+
+def radial_distance(grid_size, domain_size, floor=None):
+    """
+    Distance from the domain center on the scenarios' linspace grid.
+
+    Parameters:
+    -----------
+    grid_size : int
+        Number of grid points per dimension
+    domain_size : float
+        Physical size of domain in meters
+    floor : float, optional
+        Minimum distance, e.g. to avoid division by zero at the center
+
+    Returns:
+    --------
+    r : ndarray
+        Read-only field cached by aethelgard_grid (shared with engines on
+        the same grid); derive new arrays from it rather than writing to it
+    """
+    return coordinate_grid(grid_size, domain_size).radial_distance(floor=floor)
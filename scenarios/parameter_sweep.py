@@ -0,0 +1,359 @@
+"""
+Parameter Sweep Runner
+
+Runs a scenario over a grid of parameters in parallel and collects summary
+metrics into a single table.
+
+Work is pipelined over a process pool in two stages:
+
+1. A build task constructs one set of input fields in a worker, computes the
+   quantum pressure once and places mass and T_quantum in shared memory.
+2. One solve task per configuration attaches to those blocks by name, so the
+   (N, N, N) arrays are never pickled or copied. Configurations that differ
+   only in `iterations` share a single build.
+
+Each group of blocks is unlinked as soon as its last solve finishes, and at
+most `max_workers` groups are alive at once, so /dev/shm use stays bounded by
+max_workers x 2 x N³ x 8 bytes however large the sweep is.
+
+Usage:
+    from parameter_sweep import run_sweep, write_table
+
+    rows = run_sweep("black_hole", {
+        "grid_size": [32, 64],
+        "core_radius": [1.0, 2.0, 3.0],
+        "entropy_scale": [1e66, 1e67],
+        "iterations": [200],
+    })
+    write_table(rows, "sweep.csv")
+
+Plotting is off by default; pass plot=True to also save a summary figure of
+each metric against the swept parameters.
+"""
+
+import collections
+import csv
+import inspect
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from black_hole_quantum_core import build_black_hole_inputs
+from dark_energy_cosmology import build_dark_energy_inputs
+from wormhole_stabilization import build_wormhole_inputs
+
+from aethelgard_engine import AethelgardEngine
+
+# Scenario name -> (input builder, default iterations)
+SCENARIOS = {
+    "black_hole": (build_black_hole_inputs, 200),
+    "wormhole": (build_wormhole_inputs, 150),
+    "dark_energy": (build_dark_energy_inputs, 100),
+}
+
+# SECURITY: Bound the number of configurations per sweep
+MAX_CONFIGURATIONS = 1000
+
+# SECURITY: Same bound solve_field_equations puts on iterations
+MAX_ITERATIONS = 10000
+
+METRICS = ("core_g00", "min_g00", "mean_g00", "hazard",
+           "pressure_mean", "pressure_std", "pressure_min", "pressure_max")
+
+
+def expand_grid(param_grid):
+    """
+    Expand {name: [values]} into a list of {name: value} configurations
+    (Cartesian product, in the order the values are given).
+    """
+    names = list(param_grid)
+    values = [[v] if isinstance(v, str) or not hasattr(v, '__iter__') else list(v)
+              for v in param_grid.values()]
+    return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*values)]
+
+
+def run_sweep(scenario, param_grid, max_workers=None, plot=False, output_dir=None):
+    """
+    Solve every configuration in the parameter grid and summarize the results.
+
+    Parameters:
+    -----------
+    scenario : str
+        One of SCENARIOS ("black_hole", "wormhole", "dark_energy")
+    param_grid : dict
+        Maps parameter names to lists of values. Accepts the scenario
+        builder's arguments (grid_size, domain_size, entropy_scale, ...)
+        plus "iterations"
+    max_workers : int, optional
+        Worker processes (defaults to the CPU count); also the number of
+        input sets kept in shared memory at once
+    plot : bool
+        Save a summary figure of the metrics (default False)
+    output_dir : str or Path, optional
+        Where to save the figure (defaults to scenarios/output)
+
+    Returns:
+    --------
+    list of dict
+        One row per configuration: the parameters, the summary METRICS and
+        the solve time in seconds
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Scenario must be one of {tuple(SCENARIOS)}.")
+    builder, default_iterations = SCENARIOS[scenario]
+
+    defaults = {name: param.default
+                for name, param in inspect.signature(builder).parameters.items()}
+    allowed = (set(defaults) - {"r"}) | {"iterations"}
+    unknown = set(param_grid) - allowed
+    if unknown:
+        raise ValueError(f"Unknown parameters for {scenario}: {sorted(unknown)}")
+
+    configs = expand_grid(param_grid)
+    if not configs:
+        raise ValueError("Parameter grid is empty.")
+    if len(configs) > MAX_CONFIGURATIONS:
+        raise ValueError(f"Sweep size exceeds limit ({MAX_CONFIGURATIONS}).")
+
+    # Configurations that differ only in iterations share one set of inputs
+    groups = {}
+    for index, config in enumerate(configs):
+        inputs = {k: v for k, v in config.items() if k != "iterations"}
+        groups.setdefault(tuple(sorted(inputs.items())), (inputs, []))[1].append(index)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    tasks = []
+    for inputs, indices in groups.values():
+        grid = {"grid_size": inputs.get("grid_size", defaults["grid_size"]),
+                "domain_size": inputs.get("domain_size", defaults["domain_size"])}
+        solves = [{**grid, "iterations": configs[i].get("iterations", default_iterations)}
+                  for i in indices]
+        # Workers skip solve_field_equations' checks: validate before any work starts
+        _validate_solve(grid["grid_size"], [solve["iterations"] for solve in solves])
+        tasks.append(({**grid, "inputs": inputs}, indices, solves))
+
+    # spawn, not fork: forking after Numba/BLAS thread pools start can deadlock
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        summaries = _run_pipeline(pool, scenario, tasks, len(configs), window=max_workers)
+
+    rows = [{**config, **summary} for config, summary in zip(configs, summaries, strict=True)]
+    if plot:
+        plot_sweep(rows, scenario, output_dir)
+    return rows
+
+
+def _validate_solve(grid_size, iterations):
+    """Check a configuration's grid size and iteration counts like the engine does."""
+    if isinstance(grid_size, bool) or not isinstance(grid_size, int) or grid_size <= 0:
+        raise ValueError("Grid size must be a positive integer.")
+    if grid_size > AethelgardEngine.MAX_GRID_SIZE:
+        raise ValueError(f"Grid size exceeds maximum limit of {AethelgardEngine.MAX_GRID_SIZE}.")
+    for count in iterations:
+        if isinstance(count, bool) or not isinstance(count, int) or count <= 0:
+            raise ValueError("Iterations must be a positive integer.")
+        if count > MAX_ITERATIONS:
+            raise ValueError(f"Iterations exceeds maximum limit of {MAX_ITERATIONS}.")
+
+
+def _run_pipeline(pool, scenario, tasks, n_rows, window):
+    """
+    Schedule build and solve tasks, keeping at most `window` input groups in
+    shared memory. Returns the summaries in configuration order.
+    """
+    summaries = [None] * n_rows
+    waiting = collections.deque(tasks)
+    pending = {}   # future -> (kind, group)
+    live = {}      # group id -> [block specs, pressure stats, solves remaining]
+    in_flight = 0  # groups building or holding shared memory
+    # Sequential ids: id() of a finished group's dict can be reused by the next
+    group_ids = itertools.count()
+
+    try:
+        while waiting or pending:
+            while waiting and in_flight < window:
+                build, indices, solves = waiting.popleft()
+                group = {"id": next(group_ids), "indices": indices, "solves": solves}
+                pending[pool.submit(_build_task, scenario, build)] = ("build", group)
+                in_flight += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, group = pending.pop(future)
+                if kind == "build":
+                    specs, stats = future.result()
+                    gid = group["id"]
+                    live[gid] = [specs, stats, len(group["solves"])]
+                    for index, solve in zip(group["indices"], group["solves"], strict=True):
+                        solve_future = pool.submit(_solve_task, {**solve, "arrays": specs})
+                        pending[solve_future] = ("solve", (gid, index))
+                else:
+                    gid, index = group
+                    specs, stats, remaining = live[gid]
+                    summary = future.result()
+                    seconds = summary.pop("seconds")
+                    summaries[index] = {**summary, **stats, "seconds": seconds}
+                    if remaining == 1:
+                        _unlink(live.pop(gid)[0])
+                        in_flight -= 1
+                    else:
+                        live[gid][2] = remaining - 1
+    finally:
+        # On failure: drop queued work, then release every block still alive
+        for future, (kind, _) in pending.items():
+            if not future.cancel() and kind == "build" and future.exception() is None:
+                _unlink(future.result()[0])
+        for specs, _, _ in live.values():
+            _unlink(specs)
+
+    return summaries
+
+
+def _share_arrays(arrays):
+    """Copy arrays into new shared-memory blocks and return their specs."""
+    specs = []
+    for array in arrays:
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        specs.append((shm.name, array.shape, array.dtype.str))
+        del view
+        shm.close()
+    return specs
+
+
+def _attach(spec):
+    """
+    Attach to a block by name. Pool workers share the parent's resource
+    tracker, so the parent's unlink() is the only cleanup needed.
+    """
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _unlink(specs):
+    """Remove shared-memory blocks once no task needs them."""
+    for name, _, _ in specs:
+        shm = shared_memory.SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
+
+
+def _build_task(scenario, build):
+    """
+    Worker: build one input set, evaluate the quantum pressure once and
+    publish mass and T_quantum in shared memory.
+    """
+    builder = SCENARIOS[scenario][0]
+    mass_distribution, entropy_map = builder(**build["inputs"])
+    engine = AethelgardEngine(grid_size=build["grid_size"], domain_size=build["domain_size"])
+    T_quantum = engine.calculate_quantum_pressure(entropy_map)
+
+    stats = {
+        "pressure_mean": float(np.mean(T_quantum)),
+        "pressure_std": float(np.std(T_quantum)),
+        "pressure_min": float(np.min(T_quantum)),
+        "pressure_max": float(np.max(T_quantum)),
+    }
+    return _share_arrays([mass_distribution, T_quantum]), stats
+
+
+def _solve_task(task):
+    """Worker: solve one configuration from shared inputs and summarize it."""
+    (mass_shm, mass_distribution), (T_shm, T_quantum) = (_attach(s) for s in task["arrays"])
+    try:
+        engine = AethelgardEngine(grid_size=task["grid_size"], domain_size=task["domain_size"])
+        start = time.perf_counter()
+        # Same update solve_field_equations runs, reusing the shared T_quantum
+        g_00 = engine._solve_g00(np.ones(mass_distribution.shape), mass_distribution,
+                                 T_quantum, task["iterations"], "auto")
+        elapsed = time.perf_counter() - start
+        center = task["grid_size"] // 2
+
+        return {
+            "iterations": task["iterations"],
+            "core_g00": float(g_00[center, center, center]),
+            "min_g00": float(np.min(g_00)),
+            "mean_g00": float(np.mean(g_00)),
+            "hazard": float(engine._hazard_from_g00(g_00)),
+            "seconds": elapsed,
+        }
+    finally:
+        del mass_distribution, T_quantum
+        mass_shm.close()
+        T_shm.close()
+
+
+def write_table(rows, path):
+    """Write sweep rows to a CSV file."""
+    fieldnames = list(dict.fromkeys(k for row in rows for k in row))
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_table(rows):
+    """Render sweep rows as a fixed-width text table."""
+    if not rows:
+        return ""
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    cells = [[_format_cell(row.get(c, "")) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.rjust(w) for c, w in zip(columns, widths, strict=True))]
+    lines += ["  ".join(v.rjust(w) for v, w in zip(r, widths, strict=True)) for r in cells]
+    return "\n".join(lines)
+
+
+def _format_cell(value):
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def plot_sweep(rows, scenario, output_dir=None):
+    """Save core g₀₀, hazard and mean pressure against each swept parameter."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    output_dir = Path(output_dir) if output_dir else Path(__file__).parent / 'output'
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    swept = [k for k in rows[0] if k not in METRICS and k != "seconds"
+             and len({row[k] for row in rows}) > 1]
+    swept = swept or ["iterations"]
+    fig, axes = plt.subplots(3, len(swept), figsize=(5 * len(swept), 12), squeeze=False)
+    for col, param in enumerate(swept):
+        x = [row[param] for row in rows]
+        for ax, metric in zip(axes[:, col], ("core_g00", "hazard", "pressure_mean"), strict=True):
+            ax.scatter(x, [row[metric] for row in rows])
+            ax.set_xlabel(param)
+            ax.set_ylabel(metric)
+            ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    path = output_dir / f'{scenario}_sweep.png'
+    plt.savefig(path, dpi=150)
+    plt.close(fig)
+    return path
+
+
+if __name__ == "__main__":
+    rows = run_sweep("black_hole", {
+        "grid_size": [32],
+        "core_radius": [1.0, 2.0, 3.0],
+        "entropy_scale": [1e66, 1e67],
+        "iterations": [200],
+    })
+    print(format_table(rows))
@@ -12,20 +12,71 @@ Physical Interpretation:
 - Stabilization without classical exotic matter
 """
 
-import matplotlib
-import numpy as np
-
-matplotlib.use('Agg')
 import sys
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from grid_utils import radial_distance
+
+from aethelgard_cache import ResultCache
 from aethelgard_engine import AethelgardEngine
 
 
-def create_wormhole_scenario(grid_size=48, domain_size=15.0):
+def build_wormhole_inputs(grid_size=48, domain_size=15.0, throat_radius=2.5,
+                          entropy_scale=1.0, seed=123, r=None):
+    """
+    Build the mass and entropy fields for the wormhole scenario.
+
+    Parameters:
+    -----------
+    grid_size : int
+        Number of grid points per dimension
+    domain_size : float
+        Physical size of domain in meters
+    throat_radius : float
+        Radius of the wormhole throat in meters
+    entropy_scale : float
+        Multiplier applied to the stabilizing entropy field
+    seed : int
+        Seed for the quantum fluctuations
+    r : ndarray, optional
+        Precomputed radial_distance(grid_size, domain_size)
+
+    Returns:
+    --------
+    tuple
+        (mass_distribution, entropy_map)
+    """
+    if r is None:
+        r = radial_distance(grid_size, domain_size)
+
+    # Mass distribution: Ring around throat
+    # Mass concentrated in a toroidal region around throat
+    throat_mass = np.exp(-((r - throat_radius)**2) / 0.8)
+    mass_distribution = 8e11 * throat_mass
+
+    # Quantum entropy: Maximum at throat for stabilization
+    # High entropy exactly at throat radius
+    entropy_throat = 20.0 * np.exp(-((r - throat_radius)**2) / 0.5)
+
+    # Additional entropy at center
+    entropy_center = 10.0 * np.exp(-r**2 / 1.5)
+
+    # Combined entropy field
+    entropy_map = entropy_throat + entropy_center
+
+    # Add quantum fluctuations
+    np.random.seed(seed)
+    entropy_map += 0.3 * np.random.randn(grid_size, grid_size, grid_size)
+    entropy_map = np.abs(entropy_map) * entropy_scale
+
+    return mass_distribution, entropy_map
+
+
+def create_wormhole_scenario(grid_size=48, domain_size=15.0, throat_radius=2.5,
+                             entropy_scale=1.0, iterations=150, cache=None):
     """
     Create a stabilized wormhole configuration.
     
@@ -35,6 +86,14 @@ def create_wormhole_scenario(grid_size=48, domain_size=15.0):
         Number of grid points per dimension
     domain_size : float
         Physical size of domain in meters
+    throat_radius : float
+        Radius of the wormhole throat in meters
+    entropy_scale : float
+        Multiplier applied to the stabilizing entropy field
+    iterations : int
+        Solver iterations
+    cache : ResultCache, optional
+        Persistent result cache; a repeated run reads its solves from disk
     """
     print("=" * 70)
     print("WORMHOLE STABILIZATION")
@@ -44,38 +103,13 @@ def create_wormhole_scenario(grid_size=48, domain_size=15.0):
     # Initialize engine
     engine = AethelgardEngine(grid_size=grid_size, domain_size=domain_size)
     
-    # Create coordinate grid
-    x = np.linspace(0, domain_size, grid_size)
-    X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
-    
-    # Wormhole throat at center
-    center = domain_size / 2
-    r = np.sqrt((X - center)**2 + (Y - center)**2 + (Z - center)**2)
-    
-    # Throat radius
-    r_throat = 2.5  # meters
-    
-    # Mass distribution: Ring around throat
     print("\n[1/4] Creating wormhole throat geometry...")
-    # Mass concentrated in a toroidal region around throat
-    throat_mass = np.exp(-((r - r_throat)**2) / 0.8)
-    mass_distribution = 8e11 * throat_mass
-    
-    # Quantum entropy: Maximum at throat for stabilization
     print("[2/4] Generating stabilizing quantum field...")
-    # High entropy exactly at throat radius
-    entropy_throat = 20.0 * np.exp(-((r - r_throat)**2) / 0.5)
-    
-    # Additional entropy at center
-    entropy_center = 10.0 * np.exp(-r**2 / 1.5)
-    
-    # Combined entropy field
-    entropy_map = entropy_throat + entropy_center
-    
-    # Add quantum fluctuations
-    np.random.seed(123)
-    entropy_map += 0.3 * np.random.randn(grid_size, grid_size, grid_size)
-    entropy_map = np.abs(entropy_map)
+    r = radial_distance(grid_size, domain_size)
+    mass_distribution, entropy_map = build_wormhole_inputs(
+        grid_size, domain_size, throat_radius, entropy_scale, r=r
+    )
+    r_throat = throat_radius
     
     # Solve field equations
     print("[3/4] Solving field equations for wormhole geometry...")
@@ -83,17 +117,22 @@ def create_wormhole_scenario(grid_size=48, domain_size=15.0):
     result_metric = engine.solve_field_equations(
         mass_distribution,
         entropy_map,
-        iterations=150
+        iterations=iterations,
+        cache=cache
     )
     
     # Extract metric
     g_00 = result_metric[..., 0, 0]
     
     # Calculate quantum pressure
-    T_quantum = engine.calculate_quantum_pressure(entropy_map)
+    T_quantum = engine.sources.get("T_quantum", (entropy_map,),
+                                   engine.calculate_quantum_pressure)
     
     # Visualizations
     print("[4/4] Generating visualizations...")
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     
     output_dir = Path(__file__).parent / 'output'
     output_dir.mkdir(exist_ok=True)
@@ -221,4 +260,4 @@ def create_wormhole_scenario(grid_size=48, domain_size=15.0):
 
 
 if __name__ == "__main__":
-    create_wormhole_scenario()
+    create_wormhole_scenario(cache=ResultCache(Path(__file__).parent / 'output' / 'cache'))
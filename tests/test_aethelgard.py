@@ -147,6 +147,267 @@ class TestAethelgardEngine(unittest.TestCase):
         self.assertLessEqual(np.max(result[..., 0, 0]), 10.0)
         self.assertGreaterEqual(np.min(result[..., 0, 0]), 0.1)
 
+    def test_closed_form_matches_iterative(self):
+        """Closed-form solver must reproduce the iterative sweep bit-for-bit."""
+        rng = np.random.default_rng(7)
+        mass_dist = rng.random((16, 16, 16)) * 1e27
+        mass_dist[:4] = 1e40  # Drives cells into the causality clamp
+        entropy_map = rng.random((16, 16, 16)) * 1e66
+
+        iterative = AethelgardEngine(grid_size=16, domain_size=5.0)
+        closed = AethelgardEngine(grid_size=16, domain_size=5.0)
+        for iterations in (1, 37, 200):
+            expected = iterative.solve_field_equations(
+                mass_dist, entropy_map, iterations=iterations, verbose=False, solver="iterative")
+            result = closed.solve_field_equations(
+                mass_dist, entropy_map, iterations=iterations, verbose=False, solver="closed_form")
+            self.assertTrue(np.array_equal(result, expected))
+
+    def test_closed_form_handles_rounding_stagnation(self):
+        """Increments below half an ulp must stall exactly as the sweep does."""
+        g_00 = np.array([1.0, 1.0, 9.99, 0.11, 5.0])
+        increment = np.array([1e-17, 2.0**-53, 1e-3, -1e-3, 2.0**-51 + 2.0**-53])
+        expected = g_00.copy()
+        for _ in range(500):
+            expected = self.engine._metric_step(expected, increment)
+        result = self.engine._closed_form_g00(g_00, increment, 500)
+        self.assertTrue(np.array_equal(result, expected))
+
+    def test_float32_solvers_agree(self):
+        """A float32 engine keeps a float32 metric; closed form and sweeps still agree."""
+        rng = np.random.default_rng(20)
+        mass_dist = rng.random((16, 16, 16)) * 1e27
+        mass_dist[:4] = 1e40
+        entropy_map = rng.random((16, 16, 16)) * 1e66  # beyond float32: sources stay float64
+
+        results = []
+        for options in ({"solver": "iterative"}, {"solver": "closed_form"}, {"tol": 0.0}):
+            engine = AethelgardEngine(grid_size=16, domain_size=5.0, dtype=np.float32)
+            self.assertEqual(engine.metric.dtype, np.float32)
+            results.append(engine.solve_field_equations(
+                mass_dist, entropy_map, iterations=200, verbose=False, **options).g_00)
+        expected = results[0]
+        self.assertEqual(expected.dtype, np.float32)
+        for result in results[1:]:
+            self.assertTrue(np.array_equal(result, expected))
+
+        reference = AethelgardEngine(grid_size=16, domain_size=5.0).solve_field_equations(
+            mass_dist, entropy_map, iterations=200, verbose=False).g_00
+        # 200 float32 additions: a few hundred ulps at worst
+        self.assertTrue(np.allclose(expected, reference, rtol=1e-4, atol=0))
+        self.assertEqual(engine.calculate_paradox_hazard(), 1.0)
+
+        for dtype in (np.float16, np.int32, "double precision"):
+            with self.assertRaises(ValueError):
+                AethelgardEngine(grid_size=8, dtype=dtype)
+
+    def test_auto_solver_falls_back_for_custom_update(self):
+        """Overriding _metric_step must route 'auto' through the iterative path."""
+        class DampedEngine(AethelgardEngine):
+            def _metric_step(self, g_00, increment):
+                return np.clip(g_00 + increment * g_00, *self.causality_limit)
+
+        engine = DampedEngine(grid_size=16, domain_size=5.0)
+        mass_dist = np.ones((16, 16, 16)) * 1e27
+        entropy_map = np.zeros((16, 16, 16))
+        result = engine.solve_field_equations(mass_dist, entropy_map, iterations=5, verbose=False)
+
+        g_00 = np.ones((16, 16, 16))
+        increment = 0.01 * ((8 * np.pi * engine.G / engine.c**4) * (mass_dist * engine.c**2))
+        for _ in range(5):
+            g_00 = np.clip(g_00 + increment * g_00, *engine.causality_limit)
+        self.assertTrue(np.array_equal(result[..., 0, 0], g_00))
+
+    def test_invalid_solver_rejected(self):
+        """Unknown solver names must be rejected."""
+        field = np.zeros((16, 16, 16))
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations(field, field, iterations=5, solver="magic")
+
+    def test_tolerance_stops_once_clamped(self):
+        """With tol, the sweep stops when every cell sits at the causality clamp."""
+        mass_dist = np.ones((16, 16, 16)) * 1e40
+        entropy_map = np.zeros((16, 16, 16))
+        metric, info = self.engine.solve_field_equations(
+            mass_dist, entropy_map, iterations=500, verbose=False, tol=0.0, return_info=True)
+        self.assertTrue(info['converged'])
+        self.assertLess(info['iterations'], 5)
+        self.assertEqual(len(info['residual_max']), info['iterations'])
+        self.assertEqual(info['residual_max'][-1], 0.0)
+        self.assertTrue(np.all(metric[..., 0, 0] == 10.0))
+        self.assertIs(self.engine.solver_info, info)
+
+    def test_tracked_sweep_matches_full_run(self):
+        """tol=0 reproduces the full run; residuals are the per-step changes."""
+        rng = np.random.default_rng(5)
+        mass_dist = rng.random((16, 16, 16)) * 1e27
+        mass_dist[:4] = 1e40
+        entropy_map = rng.random((16, 16, 16)) * 1e66
+        expected = AethelgardEngine(grid_size=16, domain_size=5.0).solve_field_equations(
+            mass_dist, entropy_map, iterations=300, verbose=False, solver="iterative")
+
+        metric, info = self.engine.solve_field_equations(
+            mass_dist, entropy_map, iterations=300, verbose=False, tol=0.0, return_info=True)
+        self.assertEqual(info['solver'], 'iterative')
+        self.assertTrue(np.array_equal(metric, expected))
+
+        # First step: the heavy cells jump from 1.0 straight to the 10.0 clamp
+        self.assertEqual(info['residual_max'][0], 9.0)
+        self.assertLessEqual(info['residual_rms'][0], info['residual_max'][0])
+        self.assertTrue(np.all(np.diff(info['residual_rms']) <= 0))
+
+    def test_tolerance_early_stop(self):
+        """A positive tol stops before the cap and reports the residual history."""
+        mass_dist = np.ones((16, 16, 16)) * 1e27
+        mass_dist[:8] = 1e40
+        entropy_map = np.zeros((16, 16, 16))
+        tiny = 0.01 * (8 * np.pi * self.engine.G / self.engine.c**4) * 1e27 * self.engine.c**2
+        _, info = self.engine.solve_field_equations(
+            mass_dist, entropy_map, iterations=1000, verbose=False, tol=2 * tiny,
+            return_info=True)
+        self.assertTrue(info['converged'])
+        self.assertLess(info['iterations'], 1000)
+        self.assertTrue(np.all(info['residual_max'][:-1] > 2 * tiny))
+        self.assertLessEqual(info['residual_max'][-1], 2 * tiny)
+
+    def test_tolerance_with_custom_update(self):
+        """Overridden _metric_step is tracked on the full grid."""
+        class DampedEngine(AethelgardEngine):
+            def _metric_step(self, g_00, increment):
+                return np.clip(g_00 + increment * g_00, *self.causality_limit)
+
+        engine = DampedEngine(grid_size=8, domain_size=5.0)
+        mass_dist = np.ones((8, 8, 8)) * 1e40
+        _, info = engine.solve_field_equations(
+            mass_dist, np.zeros((8, 8, 8)), iterations=50, verbose=False, tol=0.0,
+            return_info=True)
+        self.assertTrue(info['converged'])
+        self.assertLess(info['iterations'], 50)
+
+    def test_tolerance_validation(self):
+        """Invalid tolerances and closed_form with tol are rejected."""
+        field = np.zeros((16, 16, 16))
+        for tol in (-1.0, "1e-3", True, float('nan')):
+            with self.assertRaises(ValueError):
+                self.engine.solve_field_equations(field, field, iterations=5, tol=tol)
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations(field, field, iterations=5, tol=1e-6,
+                                              solver="closed_form")
+        self.engine.solve_field_equations(field, field, iterations=5, verbose=False)
+        self.assertIsNone(self.engine.solver_info['residual_max'])
+
+    def test_info_without_tolerance(self):
+        """return_info alone keeps the solver and reports no residuals."""
+        field = np.ones((16, 16, 16)) * 1e27
+        for solver in ("auto", "closed_form"):
+            _, info = self.engine.solve_field_equations(
+                field, np.zeros_like(field), iterations=5, verbose=False, solver=solver,
+                return_info=True)
+            self.assertEqual(info['solver'], 'closed_form')
+            self.assertIs(info, self.engine.solver_info)
+            self.assertIsNone(info['residual_max'])
+            self.assertIsNone(info['residual_rms'])
+
+    def test_spectral_solver(self):
+        """The spectral solve subtracts the potential of the sweep's coupling."""
+        from aethelgard_operators import PoissonSolver
+
+        rng = np.random.default_rng(16)
+        mass_dist = rng.random((16, 16, 16)) * 1e24
+        entropy_map = rng.random((16, 16, 16))
+        engine = self.engine
+        T_total = mass_dist * engine.c**2 - engine.calculate_quantum_pressure(entropy_map)
+        coupling = 8 * np.pi * engine.G / engine.c**4
+        for boundary in ("dirichlet", "periodic"):
+            metric, info = engine.solve_field_equations(
+                mass_dist, entropy_map, verbose=False, solver="spectral", boundary=boundary,
+                return_info=True)
+            expected = np.clip(1.0 - PoissonSolver(engine.dx, boundary)(coupling * T_total),
+                               *engine.causality_limit)
+            self.assertTrue(np.allclose(metric[..., 0, 0], expected, rtol=1e-12))
+            self.assertEqual((info['solver'], info['iterations']), ('spectral', 0))
+            engine.metric = type(engine.metric)((16, 16, 16))
+
+        # One solver per boundary, reused with its eigenvalue table
+        solver = engine._poisson_solver("dirichlet")
+        inverse = solver._inverse
+        engine.solve_field_equations(mass_dist, entropy_map, verbose=False, solver="spectral")
+        self.assertIs(engine._poisson_solver("dirichlet"), solver)
+        self.assertIs(solver._inverse, inverse)
+        self.assertEqual(set(engine._poisson), {"dirichlet", "periodic"})
+        engine.metric = type(engine.metric)((16, 16, 16))
+
+        # Mass raises g_00 as in the sweep, most at the center of a Dirichlet box
+        blob = np.zeros((16, 16, 16))
+        blob[6:10, 6:10, 6:10] = 1e25
+        g_00 = AethelgardEngine(grid_size=16, domain_size=5.0).solve_field_equations(
+            blob, np.zeros_like(blob), verbose=False, solver="spectral")[..., 0, 0]
+        self.assertTrue(np.all(g_00 >= 1.0))
+        self.assertEqual(g_00[7, 7, 7], g_00.max())
+
+        batch, _ = engine.solve_field_equations_batch(
+            mass_dist[None], entropy_map[None], verbose=False, solver="spectral")
+        single = AethelgardEngine(grid_size=16, domain_size=5.0).solve_field_equations(
+            mass_dist, entropy_map, verbose=False, solver="spectral")
+        self.assertTrue(np.allclose(batch[0], single[..., 0, 0], rtol=1e-12))
+
+        with self.assertRaises(ValueError):
+            engine.solve_field_equations(mass_dist, entropy_map, solver="spectral", tol=1e-6)
+        with self.assertRaises(ValueError):
+            engine.solve_field_equations(mass_dist, entropy_map, solver="spectral",
+                                         boundary="open")
+
+    def test_batch_matches_individual_solves(self):
+        """Batched members equal independent solves on fresh engines."""
+        rng = np.random.default_rng(5)
+        mass_batch = rng.random((3, 16, 16, 16)) * 1e27
+        mass_batch[2] *= 1e13  # One member hits the causality clamp
+        entropy_batch = rng.random((3, 16, 16, 16)) * 1e66
+
+        self.engine.solve_field_equations(mass_batch[0], entropy_batch[0], iterations=5,
+                                          verbose=False)
+        g_00, hazards = self.engine.solve_field_equations_batch(
+            mass_batch, entropy_batch, iterations=40, verbose=False)
+
+        self.assertEqual(g_00.shape, (3, 16, 16, 16))
+        self.assertEqual(hazards.shape, (3,))
+        for b in range(3):
+            engine = AethelgardEngine(grid_size=16, domain_size=5.0)
+            metric = engine.solve_field_equations(mass_batch[b], entropy_batch[b], iterations=40,
+                                                  verbose=False)
+            self.assertTrue(np.array_equal(g_00[b], metric[..., 0, 0]))
+            self.assertEqual(hazards[b], engine.calculate_paradox_hazard())
+        self.assertEqual(hazards[2], 1.0)
+
+    def test_batch_validation(self):
+        """Batch shapes and sizes are validated."""
+        good = np.zeros((2, 16, 16, 16))
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(np.zeros((16, 16, 16)), good)
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(good, np.zeros((3, 16, 16, 16)))
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(good, good, iterations=0)
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(good, good, iterations=10001)
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(good, good, solver="magic")
+        empty = np.zeros((0, 16, 16, 16))
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(empty, empty)
+        # The bound is on B x N³, not on B alone
+        oversized = np.broadcast_to(0.0, (256**3 // 16**3 + 1, 16, 16, 16))
+        with self.assertRaises(ValueError):
+            self.engine.solve_field_equations_batch(oversized, oversized)
+
+    def test_batch_does_not_grow_laplacian_scratch(self):
+        """Compact stencils keep a one-grid scratch buffer after a batch."""
+        engine = AethelgardEngine(grid_size=16, domain_size=5.0, stencil=2)
+        batch = np.random.default_rng(2).random((4, 16, 16, 16))
+        engine.solve_field_equations_batch(batch * 1e27, batch * 1e66, iterations=5,
+                                           verbose=False)
+        self.assertEqual(engine.laplacian._scratch.shape, (16, 16, 16))
+
 
 class TestPhysicalConsistency(unittest.TestCase):
     """Tests for physical consistency of the model."""
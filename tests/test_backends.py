@@ -0,0 +1,119 @@
+"""
+Tests for the array-backend registry.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import aethelgard_backends
+from aethelgard_backends import (
+    BACKEND_ENV,
+    Backend,
+    backend_available,
+    backend_names,
+    get_backend,
+    register_backend,
+)
+from aethelgard_engine import AethelgardEngine
+from aethelgard_engine_gpu import AethelgardEngineGPU
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_builtin_backends_and_selection(self):
+        """Engines resolve backends by name, else from the environment."""
+        self.assertEqual(set(backend_names()), {"numpy", "numba", "threaded", "cupy"})
+        with mock.patch.dict(os.environ, {BACKEND_ENV: "threaded"}):
+            engine = AethelgardEngine(grid_size=8)
+            self.assertEqual(engine.backend, "threaded")
+            self.assertIsNotNone(engine._kernels)
+            self.assertEqual(AethelgardEngine(grid_size=8, backend="numpy").backend, "numpy")
+        with mock.patch.dict(os.environ, {BACKEND_ENV: "fortran"}):
+            with self.assertRaises(ValueError):
+                AethelgardEngine(grid_size=8)
+        self.assertEqual(get_backend().name, "numpy")
+
+    def test_missing_dependency(self):
+        """An uninstalled backend raises ImportError only when it is selected."""
+        with mock.patch.dict("sys.modules", {"cupy": None}):
+            self.assertFalse(backend_available("cupy"))
+            with self.assertRaises(ImportError):
+                AethelgardEngine(grid_size=8, backend="cupy")
+            # The GPU engine falls back to the NumPy backend
+            engine = AethelgardEngineGPU(grid_size=8)
+        self.assertFalse(engine.use_gpu)
+        self.assertEqual(engine.backend, "numpy")
+
+    def test_device_backend_restrictions(self):
+        """Device backends run the iterative sweep; NumPy-only engines reject them."""
+        register_backend("device", lambda: Backend("device", np, host=False))
+        self.addCleanup(aethelgard_backends._LOADERS.pop, "device")
+        engine = AethelgardEngine(grid_size=8, backend="device")
+        mass = np.full((8, 8, 8), 1e40)
+        entropy = np.zeros((8, 8, 8))
+        engine.solve_field_equations(mass, entropy, iterations=5, verbose=False)
+        self.assertEqual(engine.solver_info['solver'], "iterative")
+        for options in ({"solver": "closed_form"}, {"solver": "spectral"}, {"tol": 1e-3}):
+            with self.assertRaises(ValueError):
+                engine.solve_field_equations(mass, entropy, iterations=5, verbose=False,
+                                             **options)
+        with self.assertRaises(ValueError):
+            AethelgardEngineTimeEvolution(grid_size=8, backend="device")
+
+
+class TestThreadedBackend(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(21)
+        self.mass = rng.random((12, 12, 12)) * 1e27
+        self.mass[:3] = 1e40
+        self.entropy = rng.random((12, 12, 12)) * 1e66
+        blocks = mock.patch.object(aethelgard_backends, "BLOCK_CELLS", 100)  # several blocks
+        blocks.start()
+        self.addCleanup(blocks.stop)
+
+    def test_static_solver_bit_identical(self):
+        """The threaded sweep reproduces the NumPy sweep exactly."""
+        for dtype in (np.float64, np.float32):
+            results = []
+            for backend in ("numpy", "threaded"):
+                engine = AethelgardEngine(grid_size=12, domain_size=4.0, backend=backend,
+                                          dtype=dtype)
+                results.append(engine.solve_field_equations(
+                    self.mass, self.entropy, iterations=80, verbose=False, solver="iterative"))
+            self.assertTrue(np.array_equal(results[0], results[1]))
+
+    def test_time_evolution_bit_identical(self):
+        """The threaded ADM step matches the NumPy metric and K updates."""
+        engines = [AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, backend=backend)
+                   for backend in ("numpy", "threaded")]
+        for engine in engines:
+            engine.evolve_metric(self.mass * 1e-10, self.entropy * 1e-40, time_steps=5,
+                                 entropy_evolution=True, verbose=False)
+        self.assertTrue(np.array_equal(engines[0].metric, engines[1].metric))
+        self.assertTrue(np.array_equal(engines[0].K, engines[1].K))
+
+    def test_overridden_adm_update_bypasses_kernel(self):
+        """A subclass metric update runs on kernel backends instead of the fused step."""
+        class Frozen(AethelgardEngineTimeEvolution):
+            def _update_metric_adm(self, stress_energy):
+                self.calls += 1
+
+        engines = []
+        for backend in ("numpy", "threaded"):
+            engine = Frozen(grid_size=12, domain_size=4.0, backend=backend)
+            engine.calls = 0
+            engine.evolve_metric(self.mass * 1e-10, self.entropy * 1e-40, time_steps=3,
+                                 verbose=False)
+            self.assertEqual(engine.calls, 3)
+            engines.append(engine)
+        self.assertTrue(np.array_equal(engines[1].metric, np.asarray(Frozen(grid_size=12).metric)))
+        self.assertTrue(np.array_equal(engines[0].K, engines[1].K))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Tests for the derived source-term cache and the persistent result cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from aethelgard_cache import ResultCache, SourceTermCache
+from aethelgard_engine import AethelgardEngine
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestSourceTermCache(unittest.TestCase):
+
+    def test_hits_by_identity_and_lru_eviction(self):
+        """Same arrays hit; equal-valued copies and views miss; old entries are evicted."""
+        cache = SourceTermCache(maxsize=2)
+        a = np.arange(8.0)
+        compute = mock.Mock(side_effect=lambda x: x * 2)
+
+        first = cache.get("double", (a,), compute)
+        self.assertIs(cache.get("double", (a,), compute), first)
+        self.assertEqual(compute.call_count, 1)
+
+        cache.get("double", (a.copy(),), compute)
+        cache.get("double", (a[::2],), compute)
+        self.assertEqual(compute.call_count, 3)
+        self.assertEqual(len(cache), 2)
+        cache.get("double", (a,), compute)  # evicted as least recently used
+        self.assertEqual(compute.call_count, 4)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_explicit_invalidation(self):
+        """invalidate(array) drops dependent entries; invalidate() drops all."""
+        cache = SourceTermCache()
+        a, b = np.ones(4), np.zeros(4)
+        cache.get("sum", (a, b), np.add)
+        cache.get("neg", (b,), np.negative)
+
+        a[:] = 3.0
+        cache.invalidate(a)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(np.array_equal(cache.get("sum", (a, b), np.add), np.full(4, 3.0)))
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            SourceTermCache(maxsize=0)
+
+
+class TestStaticSourceEvolution(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(13)
+        self.mass = rng.random((10, 10, 10)) * 1e27
+        self.entropy = rng.random((10, 10, 10))
+
+    def test_static_sources_pay_the_laplacian_once(self):
+        """A static entropy map is differentiated once per run, with identical results."""
+        engine = AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0)
+        with mock.patch.object(engine, "calculate_quantum_pressure",
+                               wraps=engine.calculate_quantum_pressure) as pressure:
+            engine.evolve_metric(self.mass, self.entropy, time_steps=6, verbose=False)
+        self.assertEqual(pressure.call_count, 1)
+
+        # Reference: the uncached per-step assembly through the update hooks
+        reference = AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0, in_place=False)
+        T_quantum = reference.calculate_quantum_pressure(self.entropy)
+        for _ in range(6):
+            T_total = self.mass * reference.c**2 - T_quantum
+            reference._update_metric_adm(T_total)
+            reference._update_extrinsic_curvature(T_total)
+        self.assertTrue(np.array_equal(engine.metric.components, reference.metric.components))
+        self.assertTrue(np.array_equal(engine.K.components, reference.K.components))
+
+    def test_dynamic_sources_bypass_the_cache(self):
+        """Evolving or time-dependent entropy is recomputed every step."""
+        engine = AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0)
+        engine.evolve_metric(self.mass, self.entropy, time_steps=3, entropy_evolution=True,
+                             verbose=False)
+        engine.evolve_metric(self.mass, lambda t: self.entropy, time_steps=3, verbose=False)
+        self.assertEqual(len(engine.sources), 0)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        rng = np.random.default_rng(23)
+        self.mass = rng.random((10, 10, 10)) * 1e40
+        self.entropy = rng.random((10, 10, 10)) * 1e66
+
+    def test_solve_round_trip(self):
+        """A second solve (any process) restores the identical metric without solving."""
+        cache = ResultCache(self.dir)
+        first = AethelgardEngine(grid_size=10, domain_size=4.0)
+        expected, info = first.solve_field_equations(self.mass, self.entropy, verbose=False,
+                                                     return_info=True, cache=cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+        cache = ResultCache(self.dir)
+        engine = AethelgardEngine(grid_size=10, domain_size=4.0)
+        with mock.patch.object(engine, "_solve_g00") as solve:
+            metric, cached_info = engine.solve_field_equations(
+                self.mass, self.entropy, verbose=False, return_info=True, cache=cache)
+        solve.assert_not_called()
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue(np.array_equal(metric.components, expected.components))
+        self.assertTrue(np.array_equal(cached_info['residual_max'], info['residual_max']))
+        self.assertEqual(cached_info['iterations'], info['iterations'])
+        # The stored pressure is handed on through the source-term cache
+        self.assertTrue(np.array_equal(
+            engine.sources.get("T_quantum", (self.entropy,), mock.Mock()),
+            first.calculate_quantum_pressure(self.entropy)))
+
+    def test_key_covers_inputs_settings_and_state(self):
+        """Different inputs, solver arguments or starting metric are different entries."""
+        cache = ResultCache(self.dir)
+        engine = AethelgardEngine(grid_size=10, domain_size=4.0)
+        engine.solve_field_equations(self.mass, self.entropy, verbose=False, cache=cache)
+        engine.solve_field_equations(self.mass, self.entropy, verbose=False, cache=cache)
+        AethelgardEngine(grid_size=10, domain_size=4.0).solve_field_equations(
+            self.mass, self.entropy, iterations=60, verbose=False, cache=cache)
+        AethelgardEngine(grid_size=10, domain_size=5.0).solve_field_equations(
+            self.mass, self.entropy, verbose=False, cache=cache)
+        entropy = self.entropy.copy()
+        entropy[0, 0, 0] *= 2.0
+        AethelgardEngine(grid_size=10, domain_size=4.0).solve_field_equations(
+            self.mass, entropy, verbose=False, cache=cache)
+        self.assertEqual((cache.hits, len(cache)), (0, 5))
+
+    def test_batch_round_trip(self):
+        """Cached batches return the stored g_00 stack and hazards."""
+        cache = ResultCache(self.dir)
+        engine = AethelgardEngine(grid_size=10, domain_size=4.0)
+        batch = (self.mass[np.newaxis], np.zeros((1, 10, 10, 10)))
+        expected = engine.solve_field_equations_batch(*batch, verbose=False, cache=cache)
+        cached = engine.solve_field_equations_batch(*batch, verbose=False, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        for got, want in zip(cached, expected, strict=True):
+            self.assertTrue(np.array_equal(got, want))
+
+    def test_lru_eviction(self):
+        """Beyond max_bytes the least recently used entries go first."""
+        cache = ResultCache(self.dir, max_bytes=3 * 8000 + 1000)
+        keys = [ResultCache.key([np.full(3, i)]) for i in range(4)]
+        for age, key in enumerate(keys[:3]):
+            cache.put(key, {"x": np.zeros(1000)})
+            os.utime(os.path.join(self.dir, key, "entry.json"), (age, age))
+        self.assertIsNotNone(cache.get(keys[0]))  # now the most recently used
+        cache.put(keys[3], {"x": np.zeros(1000)})
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            cache.get("../escape")
+        with self.assertRaises(ValueError):
+            ResultCache(self.dir, max_bytes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
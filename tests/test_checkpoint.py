@@ -0,0 +1,121 @@
+"""
+Tests for time-evolution checkpoint / restart.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import aethelgard_checkpoint
+from aethelgard_checkpoint import read_manifest, write_checkpoint
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestCheckpointRestart(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(10)
+        self.mass = rng.random((12, 12, 12)) * 1e27
+        self.entropy = rng.random((12, 12, 12))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "run.ckpt"
+
+    def evolve(self, engine, entropy, steps, **kwargs):
+        return engine.evolve_metric(self.mass, entropy, time_steps=steps,
+                                    entropy_evolution=True, verbose=False, **kwargs)
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        """Checkpoint at step 6, resume, finish: identical to one 10-step run."""
+        reference = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        self.evolve(reference, self.entropy, 10)
+
+        first = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        self.evolve(first, self.entropy, 6, checkpoint_dir=self.path, checkpoint_every=4)
+
+        resumed = AethelgardEngineTimeEvolution.resume_from(self.path)
+        self.assertIsInstance(resumed.metric.components, np.memmap)
+        self.assertEqual(resumed.step_count, 6)
+        self.evolve(resumed, resumed.entropy, 4)
+
+        self.assertTrue(np.array_equal(resumed.metric.components, reference.metric.components))
+        self.assertTrue(np.array_equal(resumed.K.components, reference.K.components))
+        self.assertEqual(resumed.current_time, reference.current_time)
+        self.assertTrue(np.array_equal(resumed.history.records, reference.history.records))
+
+    def test_resume_is_copy_on_write(self):
+        """The resumed run never modifies the checkpoint it was loaded from."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        self.evolve(engine, self.entropy, 3, checkpoint_dir=self.path)
+        saved = np.load(self.path / read_manifest(self.path)["files"]["metric"])
+
+        resumed = AethelgardEngineTimeEvolution.resume_from(self.path)
+        self.evolve(resumed, resumed.entropy, 2)
+        on_disk = np.load(self.path / read_manifest(self.path)["files"]["metric"])
+        self.assertTrue(np.array_equal(on_disk, saved))
+
+        in_ram = AethelgardEngineTimeEvolution.resume_from(self.path, mmap_mode=None)
+        self.assertNotIsInstance(in_ram.metric.components, np.memmap)
+
+    def test_manifest_and_stale_files(self):
+        """Each write gets a new sequence; superseded field files are removed."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, dt=0.5,
+                                               stencil=4, in_place=False, dtype=np.float32)
+        self.evolve(engine, self.entropy, 5, checkpoint_dir=self.path, checkpoint_every=2)
+
+        manifest = json.loads((self.path / "manifest.json").read_text())
+        self.assertEqual(manifest["sequence"], 2)
+        self.assertEqual(manifest["step"], 5)
+        self.assertEqual(manifest["engine"]["stencil"], 4)
+        self.assertFalse(manifest["engine"]["in_place"])
+        names = {p.name for p in self.path.iterdir()}
+        self.assertEqual(names, set(manifest["files"].values()) | {"manifest.json"})
+
+        resumed = AethelgardEngineTimeEvolution.resume_from(self.path)
+        self.assertEqual(resumed.dt, 0.5)
+        self.assertEqual(resumed.laplacian.stencil, 4)
+        self.assertEqual(resumed.dtype, np.float32)
+        self.assertEqual(resumed.metric.dtype, np.float32)
+
+    def test_checkpoint_without_entropy(self):
+        """A direct write without an entropy field resumes with entropy=None."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        manifest = write_checkpoint(engine, self.path)
+        self.assertNotIn("entropy", manifest["files"])
+        self.assertIsNone(AethelgardEngineTimeEvolution.resume_from(self.path).entropy)
+
+    def test_invalid_checkpoints(self):
+        """Missing, foreign-format or mismatched checkpoints are rejected."""
+        with self.assertRaises(ValueError):
+            AethelgardEngineTimeEvolution.resume_from(self.path)
+        with self.assertRaises(ValueError):
+            write_checkpoint(AethelgardEngineTimeEvolution(grid_size=8), "../escape")
+
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        write_checkpoint(engine, self.path)
+        manifest = read_manifest(self.path)
+        np.save(self.path / manifest["files"]["alpha"], np.ones((4, 4, 4)))
+        with self.assertRaises(ValueError):
+            AethelgardEngineTimeEvolution.resume_from(self.path)
+
+        manifest["format"] = aethelgard_checkpoint.FORMAT_VERSION + 1
+        (self.path / "manifest.json").write_text(json.dumps(manifest))
+        with self.assertRaises(ValueError):
+            AethelgardEngineTimeEvolution.resume_from(self.path)
+
+    def test_evolve_validation(self):
+        """checkpoint_every must be a positive integer and needs a directory."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        with self.assertRaises(ValueError):
+            self.evolve(engine, self.entropy, 2, checkpoint_every=1)
+        for every in (0, 2.5):
+            with self.assertRaises(ValueError):
+                self.evolve(engine, self.entropy, 2, checkpoint_dir=self.path,
+                            checkpoint_every=every)
+
+
+if __name__ == '__main__':
+    unittest.main()
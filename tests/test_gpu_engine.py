@@ -42,3 +42,13 @@ class TestAethelgardEngineGPU(unittest.TestCase):
         entropy_map = np.random.rand(16, 16, 16) * 5.0
         result = self.engine.solve_field_equations(mass_dist, entropy_map, iterations=5)
         self.assertIsNotNone(result)
+
+    def test_to_cpu_handles_compact_metric(self):
+        """to_cpu returns the solved metric with host-side components."""
+        mass_dist = np.random.rand(16, 16, 16) * 1e12
+        entropy_map = np.random.rand(16, 16, 16)
+        result = self.engine.solve_field_equations(mass_dist, entropy_map, iterations=5,
+                                                   verbose=False)
+        host = self.engine.to_cpu(result)
+        self.assertIsInstance(host.components, np.ndarray)
+        self.assertTrue(np.array_equal(host[..., 0, 0], result[..., 0, 0]))
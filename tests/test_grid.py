@@ -0,0 +1,78 @@
+"""
+Tests for the cached coordinate grid.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scenarios"))
+from grid_utils import radial_distance
+
+from aethelgard_engine import AethelgardEngine
+from aethelgard_grid import (
+    GRID_CACHE_SIZE,
+    RADIAL_CACHE_SIZE,
+    CoordinateGrid,
+    clear_grid_cache,
+    coordinate_grid,
+)
+
+
+class TestCoordinateGrid(unittest.TestCase):
+
+    def test_matches_meshgrid(self):
+        """Open axes and radial fields reproduce the dense meshgrid formulas exactly."""
+        grid = CoordinateGrid(12, 7.0)
+        x = np.linspace(0, 7.0, 12)
+        X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
+        for dense, open_axis, expected in zip(grid.dense(), grid.axes, (X, Y, Z), strict=True):
+            self.assertTrue(np.array_equal(dense, expected))
+            self.assertTrue(np.array_equal(np.broadcast_to(open_axis, grid.shape), expected))
+
+        r = np.sqrt((X - 1.0)**2 + (Y - 2.0)**2 + (Z - 3.5)**2)
+        self.assertTrue(np.array_equal(grid.radial_distance((1.0, 2.0, 3.5)), r))
+        r = np.maximum(np.sqrt((X - 3.5)**2 + (Y - 3.5)**2 + (Z - 3.5)**2), 0.4)
+        self.assertTrue(np.array_equal(grid.radial_distance(floor=0.4), r))
+
+    def test_radial_cache(self):
+        """Radial fields are cached read-only per (center, floor), least recently used out."""
+        grid = CoordinateGrid(8, 4.0)
+        r = grid.radial_distance()
+        self.assertIs(grid.radial_distance(center=2.0), r)
+        self.assertFalse(r.flags.writeable)
+        with self.assertRaises(ValueError):
+            r[0, 0, 0] = 0.0
+
+        for floor in range(1, RADIAL_CACHE_SIZE + 1):
+            grid.radial_distance(floor=floor)
+        self.assertIsNot(grid.radial_distance(), r)
+        with self.assertRaises(ValueError):
+            grid.radial_distance(center=(1.0, 2.0))
+        with self.assertRaises(ValueError):
+            CoordinateGrid(0, 4.0)
+
+    def test_shared_by_engines_and_scenarios(self):
+        """Engines and the scenario helper use one grid per (N, domain size)."""
+        engine = AethelgardEngine(grid_size=10, domain_size=6.0)
+        self.assertIs(engine.coordinates, coordinate_grid(10, 6.0))
+        self.assertIs(radial_distance(10, 6.0, floor=0.1),
+                      engine.coordinates.radial_distance(floor=0.1))
+
+    def test_grid_cache_is_bounded_and_clearable(self):
+        """Only GRID_CACHE_SIZE grids stay shared; clear_grid_cache releases them."""
+        grid = coordinate_grid(6, 1.0)
+        self.addCleanup(clear_grid_cache)
+        for n in range(7, 7 + GRID_CACHE_SIZE):
+            coordinate_grid(n, 1.0)
+        self.assertIsNot(coordinate_grid(6, 1.0), grid)
+
+        grid = coordinate_grid(6, 1.0)
+        clear_grid_cache()
+        self.assertIsNot(coordinate_grid(6, 1.0), grid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the array-backed time-evolution history.
+"""
+
+import unittest
+
+import numpy as np
+
+import aethelgard_history
+from aethelgard_history import EvolutionHistory
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestEvolutionHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = EvolutionHistory()
+        self.rng = np.random.default_rng(4)
+
+    def test_append_and_dict_access(self):
+        """Records grow geometrically and read back like the old dict of lists."""
+        for t in range(5):
+            self.history.append(time=t * 0.1, metric_mean=1.0 + t)
+        self.assertEqual(self.history.size, 5)
+        self.assertTrue(np.allclose(self.history['time'], [0.0, 0.1, 0.2, 0.3, 0.4]))
+        self.assertEqual(self.history['metric_mean'][-1], 5.0)
+        self.assertTrue(np.all(np.isnan(self.history['K_mean'])))
+        self.assertEqual(list(self.history), list(aethelgard_history.HISTORY_FIELDS))
+        self.assertIn('entropy_mean', self.history)
+        self.assertEqual(self.history.records.shape, (5,))
+        with self.assertRaises(KeyError):
+            self.history.append(time=1.0, bogus=2.0)
+
+    def test_reserve_preallocates(self):
+        """reserve() sizes the record array once for a whole run."""
+        self.history.reserve(100)
+        buffer = self.history._data
+        for t in range(100):
+            self.history.append(time=float(t))
+        self.assertIs(self.history._data, buffer)
+        self.history.clear()
+        self.assertEqual(len(self.history['time']), 0)
+
+    def test_streaming_moments_match_numpy(self):
+        """Chunked Welford moments match np.mean / np.std across many chunks."""
+        field = 1.0 + 1e-3 * self.rng.standard_normal((48, 48, 48))
+        self.assertGreater(field.size, aethelgard_history.CHUNK_CELLS)
+        mean, std = self.history.moments(field)
+        self.assertAlmostEqual(mean, np.mean(field), delta=1e-15)
+        self.assertTrue(np.isclose(std, np.std(field), rtol=1e-12))
+
+        strided = field[:, ::2, 1:]
+        mean, std = self.history.moments(strided)
+        self.assertTrue(np.isclose(std, np.std(strided), rtol=1e-12))
+
+    def test_abs_mean_matches_numpy(self):
+        """abs_mean equals np.mean(np.abs(x)) for dense and tensor-valued fields."""
+        K = self.rng.standard_normal((40, 40, 40, 3, 3))
+        self.assertTrue(np.isclose(self.history.abs_mean(K), np.mean(np.abs(K)), rtol=1e-12))
+        diagonal = K[..., 1, 1]
+        self.assertTrue(np.isclose(self.history.abs_mean(diagonal),
+                                   np.mean(np.abs(diagonal)), rtol=1e-12))
+
+
+class TestEvolutionHistoryRecording(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        self.mass = rng.random((12, 12, 12)) * 1e11
+        self.entropy = rng.random((12, 12, 12))
+
+    def test_history_matches_full_grid_reductions(self):
+        """Recorded diagnostics equal the direct full-grid reductions."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, dt=0.01)
+        engine.evolve_metric(self.mass, self.entropy, time_steps=3, verbose=False)
+        g_00 = engine.metric[..., 0, 0]
+        self.assertTrue(np.isclose(engine.history['metric_mean'][-1], np.mean(g_00),
+                                   rtol=1e-14))
+        self.assertTrue(np.isclose(engine.history['metric_std'][-1], np.std(g_00), rtol=1e-12))
+        self.assertTrue(np.isclose(engine.history['K_mean'][-1], np.mean(np.abs(engine.K)),
+                                   rtol=1e-12))
+        self.assertEqual(engine.history['entropy_mean'][-1], np.mean(self.entropy))
+
+    def test_stride_and_accumulation(self):
+        """Every stride-th step and the final step are recorded; calls accumulate."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, dt=0.5)
+        history = engine.evolve_metric(self.mass, self.entropy, time_steps=10,
+                                       verbose=False, history_stride=3)
+        self.assertTrue(np.allclose(history['time'], [1.5, 3.0, 4.5, 5.0]))
+        engine.evolve_metric(self.mass, lambda t: self.entropy * (1 + t), time_steps=2,
+                             verbose=False)
+        self.assertEqual(history.size, 6)
+        self.assertTrue(np.allclose(history['time'][-2:], [5.5, 6.0]))
+        self.assertTrue(np.isclose(history['entropy_mean'][-1], np.mean(self.entropy * 6.5)))
+
+    def test_in_place_adm_step_bit_identical(self):
+        """Scratch-buffer ADM updates match the broadcast updates exactly."""
+        engines = [AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, dt=0.01,
+                                                 in_place=flag) for flag in (True, False)]
+        for engine in engines:
+            engine.evolve_metric(self.mass, self.entropy, time_steps=4, verbose=False)
+        self.assertTrue(np.array_equal(engines[0].metric.components,
+                                       engines[1].metric.components))
+        self.assertTrue(np.array_equal(engines[0].K.components, engines[1].K.components))
+        self.assertEqual(engines[0]._adm_scratch.shape, (2, 12, 12, 12))
+        self.assertIsNone(engines[1]._adm_scratch)
+
+        K = np.asarray(engines[0].K)
+        self.assertEqual(K.shape, (12, 12, 12, 3, 3))
+        self.assertTrue(np.array_equal(K[..., 0, 1], np.zeros((12, 12, 12))))
+        self.assertTrue(np.array_equal(K[..., 2, 2], engines[0].K[..., 2, 2]))
+
+    def test_overridden_update_is_honoured(self):
+        """A subclass hook disables the in-place fast path."""
+        class Frozen(AethelgardEngineTimeEvolution):
+            def _update_extrinsic_curvature(self, stress_energy):
+                pass
+
+        engine = Frozen(grid_size=12, domain_size=4.0)
+        reference = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        for e in (engine, reference):
+            e.evolve_metric(self.mass * 1e16, self.entropy, time_steps=2, verbose=False)
+        self.assertFalse(np.any(engine.K.components))
+        self.assertTrue(np.any(reference.K.components))
+        self.assertTrue(np.array_equal(engine.metric.components, reference.metric.components))
+
+    def test_invalid_stride(self):
+        """The stride must be a positive integer."""
+        engine = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0)
+        for stride in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                engine.evolve_metric(self.mass, self.entropy, time_steps=2, verbose=False,
+                                     history_stride=stride)
+
+
+if __name__ == '__main__':
+    unittest.main()
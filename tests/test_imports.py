@@ -0,0 +1,69 @@
+"""
+Import-time tests: engine modules must not pull in heavy optional
+dependencies or print anything when imported, so worker processes that only
+solve fields start quickly.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENGINE_MODULES = ("aethelgard_engine", "aethelgard_engine_gpu", "aethelgard_time_evolution",
+                  "aethelgard_tiled", "interactive_visualizer")
+
+# Optional dependencies only the plotting / GPU / compiled paths need
+HEAVY_MODULES = ("cupy", "matplotlib", "dash", "plotly", "numba", "scipy")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import numpy
+numpy_seconds = time.perf_counter() - start
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"numpy": numpy_seconds, "module": seconds, "heavy": heavy}}))
+"""
+
+
+def probe_import(module, extra_path=()):
+    """Import `module` in a fresh interpreter; returns (report dict, other output)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([*extra_path, str(ROOT), str(ROOT / "scenarios")])
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    *output, report = result.stdout.splitlines()
+    return json.loads(report), "\n".join(output) + result.stderr
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_no_heavy_imports_or_output(self):
+        """Importing an engine loads no optional dependency and prints nothing."""
+        # A stand-in CuPy that announces itself proves no import is even attempted
+        with tempfile.TemporaryDirectory() as fake:
+            Path(fake, "cupy.py").write_text("print('cupy imported')\n")
+            for module in (*ENGINE_MODULES, "parameter_sweep"):
+                with self.subTest(module=module):
+                    report, output = probe_import(module, extra_path=[fake])
+                    self.assertEqual(report["heavy"], [])
+                    self.assertEqual(output, "")
+
+    def test_import_benchmark(self):
+        """Each engine imports in less time than twice NumPy's own import."""
+        for module in ENGINE_MODULES:
+            with self.subTest(module=module):
+                report, _ = probe_import(module)
+                self.assertLess(report["module"], 2 * report["numpy"])
+
+
+if __name__ == '__main__':
+    unittest.main()
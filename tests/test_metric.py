@@ -0,0 +1,95 @@
+"""
+Unit tests for compact metric storage.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from aethelgard_engine import AethelgardEngine
+from aethelgard_metric import CompactMetric
+
+
+class TestCompactMetric(unittest.TestCase):
+
+    def setUp(self):
+        self.metric = CompactMetric((4, 5, 6))
+
+    def test_shape_and_storage(self):
+        """Dense shape is reported while only the diagonal is stored."""
+        self.assertEqual(self.metric.shape, (4, 5, 6, 4, 4))
+        self.assertEqual(self.metric.ndim, 5)
+        self.assertEqual(self.metric.dtype, np.float64)
+        self.assertEqual(self.metric.nbytes, 4 * 4 * 5 * 6 * 8)
+
+    def test_dense_expansion_matches_identity(self):
+        """Lazy expansion yields the Minkowski-like identity start."""
+        dense = np.asarray(self.metric)
+        expected = np.broadcast_to(np.eye(4), (4, 5, 6, 4, 4))
+        self.assertTrue(np.array_equal(dense, expected))
+        self.assertEqual(np.asarray(self.metric, dtype=np.float32).dtype, np.float32)
+
+    def test_diagonal_views_are_contiguous_and_writable(self):
+        """metric[..., mu, mu] is a view, so in-place updates persist."""
+        g_00 = self.metric[..., 0, 0]
+        self.assertTrue(g_00.flags['C_CONTIGUOUS'])
+        self.metric[..., 2, 2] += 0.5
+        self.metric[1, 2, 3, 0, 0] = 7.0
+        self.assertTrue(np.allclose(self.metric[..., 2, 2], 1.5))
+        self.assertEqual(self.metric[1, 2, 3, 0, 0], 7.0)
+        self.assertEqual(self.metric[1, 2, 3, -4, -4], 7.0)
+
+    def test_off_diagonal_components(self):
+        """Off-diagonal reads are zero; only zero writes are accepted."""
+        self.assertTrue(np.all(self.metric[..., 0, 1] == 0.0))
+        self.metric[..., 0, 1] = 0.0
+        with self.assertRaises(ValueError):
+            self.metric[..., 0, 1] = 1.0
+
+    def test_general_indexing_falls_back_to_dense(self):
+        """Non-component keys index the dense expansion."""
+        self.assertEqual(self.metric[0].shape, (5, 6, 4, 4))
+        with self.assertRaises(IndexError):
+            self.metric[0] = 1.0
+        with self.assertRaises(IndexError):
+            self.metric[..., 4, 4]
+
+    def test_partial_indexing_expands_only_the_slice(self):
+        """Slices and partial keys match the dense tensor without building it."""
+        self.metric[..., 1, 1] += np.arange(4 * 5 * 6).reshape(4, 5, 6)
+        dense = self.metric.to_dense()
+        keys = [0, (slice(None), slice(None), 2), (1, 2, 3, 0), (0, Ellipsis, 1),
+                (Ellipsis, slice(1, 3), slice(None)), (slice(None, None, 2), -1, 1, 1)]
+        with mock.patch.object(CompactMetric, 'to_dense', side_effect=AssertionError):
+            for key in keys:
+                self.assertTrue(np.array_equal(self.metric[key], dense[key]), key)
+        mask = np.zeros((4, 5, 6), dtype=bool)
+        mask[1, 2, 3] = True
+        self.assertTrue(np.array_equal(self.metric[mask], dense[mask]))
+
+    def test_copy_is_independent(self):
+        """copy() duplicates the components."""
+        clone = self.metric.copy()
+        clone[..., 0, 0] += 1.0
+        self.assertTrue(np.allclose(self.metric[..., 0, 0], 1.0))
+        self.assertIn("CompactMetric", repr(clone))
+
+    def test_wraps_existing_components(self):
+        """Existing component arrays are wrapped without copying."""
+        components = np.zeros((3, 2, 2, 2))
+        metric = CompactMetric((2, 2, 2), dim=3, components=components)
+        metric[..., 1, 1] = 4.0
+        self.assertTrue(np.all(components[1] == 4.0))
+        with self.assertRaises(ValueError):
+            CompactMetric((2, 2, 2), components=components)
+
+    def test_engine_uses_compact_storage(self):
+        """The engine stores 4 instead of 16 doubles per cell."""
+        engine = AethelgardEngine(grid_size=16, domain_size=5.0)
+        self.assertIsInstance(engine.metric, CompactMetric)
+        self.assertEqual(engine.metric.nbytes, 16**3 * 4 * 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
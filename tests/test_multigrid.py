@@ -0,0 +1,83 @@
+"""
+Tests for the geometric multigrid Poisson solver.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_engine import AethelgardEngine
+from aethelgard_multigrid import MultigridSolver
+from aethelgard_operators import PoissonSolver
+
+
+class TestMultigridSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(17)
+        self.dx = 0.2
+
+    def test_matches_spectral_dirichlet_solve(self):
+        """V-cycles converge to the DST solution for both smoothers and batches."""
+        f = self.rng.standard_normal((2, 16, 8, 16))
+        expected = PoissonSolver(self.dx, "dirichlet")(f)
+        for smoother in ("gauss_seidel", "jacobi"):
+            u, info = MultigridSolver(smoother).solve(f, self.dx, tol=1e-10)
+            self.assertTrue(info['converged'])
+            self.assertLess(np.max(np.abs(u - expected)), 1e-8 * np.max(np.abs(expected)))
+            self.assertEqual(len(info['residual_max']), info['iterations'])
+            self.assertTrue(np.all(np.diff(info['residual_max']) < 0))
+            self.assertLessEqual(info['residual_rms'][-1], info['residual_max'][-1])
+
+    def test_cycles_independent_of_grid_size(self):
+        """The residual reduction per cycle does not degrade as the grid is refined."""
+        cycles = []
+        for n in (8, 16, 32):
+            f = self.rng.standard_normal((n, n, n))
+            _, info = MultigridSolver().solve(f, 1.0 / n, tol=1e-8)
+            cycles.append(info['iterations'])
+            self.assertLess(info['residual_max'][1] / info['residual_max'][0], 0.15)
+        self.assertLessEqual(max(cycles) - min(cycles), 1)
+
+    def test_uncoarsenable_grid_and_zero_source(self):
+        """Odd grids fall back to the direct solve; a zero source needs no cycles."""
+        f = self.rng.standard_normal((9, 9, 9))
+        u, info = MultigridSolver().solve(f, self.dx)
+        self.assertEqual(info['iterations'], 1)
+        self.assertTrue(np.allclose(u, PoissonSolver(self.dx)(f)))
+        u, info = MultigridSolver().solve(np.zeros((8, 8, 8)), self.dx)
+        self.assertEqual((info['iterations'], info['converged']), (0, True))
+        self.assertFalse(np.any(u))
+
+    def test_validation(self):
+        """Smoother and sweep settings are checked."""
+        for kwargs in ({"smoother": "sor"}, {"pre_smooth": -1}, {"post_smooth": 1.5},
+                       {"pre_smooth": 0, "post_smooth": 0}, {"coarsest": 0}):
+            with self.assertRaises(ValueError):
+                MultigridSolver(**kwargs)
+
+    def test_engine_multigrid_solver(self):
+        """solver='multigrid' agrees with the spectral solve and reports each cycle."""
+        mass = self.rng.random((16, 16, 16)) * 1e24
+        entropy = self.rng.random((16, 16, 16))
+        spectral = AethelgardEngine(grid_size=16, domain_size=5.0).solve_field_equations(
+            mass, entropy, verbose=False, solver="spectral")
+        engine = AethelgardEngine(grid_size=16, domain_size=5.0)
+        metric, info = engine.solve_field_equations(
+            mass, entropy, verbose=False, solver="multigrid", tol=1e-10, return_info=True,
+            multigrid=MultigridSolver("jacobi"))
+        self.assertTrue(np.allclose(metric[..., 0, 0], spectral[..., 0, 0], rtol=0, atol=1e-9))
+        self.assertEqual(info['solver'], 'multigrid')
+        self.assertTrue(info['converged'])
+        self.assertLessEqual(info['residual_max'][-1], 1e-10)
+
+        _, info = engine.solve_field_equations(mass, entropy, iterations=2, verbose=False,
+                                               solver="multigrid", return_info=True)
+        self.assertEqual(info['iterations'], 2)
+        self.assertFalse(info['converged'])
+        with self.assertRaises(ValueError):
+            engine.solve_field_equations(mass, entropy, solver="multigrid", boundary="periodic")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the optional Numba-compiled backend.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import aethelgard_numba
+from aethelgard_engine import AethelgardEngine
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+@unittest.skipUnless(aethelgard_numba.NUMBA_AVAILABLE, "Numba not installed")
+class TestNumbaBackend(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.mass = rng.random((12, 12, 12)) * 1e27
+        self.mass[:3] = 1e40  # Saturates the causality clamp
+        self.entropy = rng.random((12, 12, 12)) * 1e66
+
+    def test_static_solver_bit_identical(self):
+        """The fused kernel reproduces the NumPy sweep exactly, in either precision."""
+        for dtype in (np.float64, np.float32):
+            reference = AethelgardEngine(grid_size=12, domain_size=4.0, dtype=dtype)
+            compiled = AethelgardEngine(grid_size=12, domain_size=4.0, backend="numba",
+                                        dtype=dtype)
+            expected = reference.solve_field_equations(
+                self.mass, self.entropy, iterations=120, verbose=False, solver="iterative")
+            with mock.patch.object(AethelgardEngine, '_closed_form_g00',
+                                   side_effect=AssertionError):
+                result = compiled.solve_field_equations(
+                    self.mass, self.entropy, iterations=120, verbose=False, solver="iterative")
+            self.assertEqual(result.dtype, dtype)
+            self.assertTrue(np.array_equal(result, expected))
+
+    def test_closed_form_runs_in_numpy(self):
+        """Only the iterative sweep is compiled; the closed form stays in NumPy."""
+        compiled = AethelgardEngine(grid_size=12, domain_size=4.0, backend="numba")
+        with mock.patch.object(compiled._kernels, 'solve_g00_kernel',
+                               side_effect=AssertionError):
+            for solver in ("auto", "closed_form"):
+                compiled.solve_field_equations(
+                    self.mass, self.entropy, iterations=120, verbose=False, solver=solver)
+
+    def test_time_evolution_bit_identical(self):
+        """The fused ADM kernel matches the NumPy metric and K updates."""
+        for dtype in (np.float64, np.float32):
+            reference = AethelgardEngineTimeEvolution(grid_size=12, domain_size=4.0, dt=0.01,
+                                                      dtype=dtype)
+            compiled = AethelgardEngineTimeEvolution(
+                grid_size=12, domain_size=4.0, dt=0.01, backend="numba", dtype=dtype)
+            for engine in (reference, compiled):
+                engine.evolve_metric(self.mass * 1e-10, self.entropy * 1e-40, time_steps=5,
+                                     entropy_evolution=True, verbose=False)
+            self.assertTrue(np.array_equal(compiled.metric, reference.metric))
+            self.assertTrue(np.array_equal(compiled.K, reference.K))
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            AethelgardEngine(grid_size=8, backend="fortran")
+
+    def test_missing_numba_reported(self):
+        """Requesting the compiled backend without Numba raises ImportError."""
+        with mock.patch.object(aethelgard_numba, "NUMBA_AVAILABLE", False):
+            with self.assertRaises(ImportError):
+                AethelgardEngine(grid_size=8, backend="numba")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Unit tests for the shared finite-difference operators.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_engine import AethelgardEngine
+from aethelgard_operators import LaplacianOperator, PoissonSolver
+
+
+def nested_gradient_laplacian(field, dx):
+    """Reference: the original np.gradient-of-np.gradient Laplacian."""
+    laplacian = np.zeros_like(field)
+    for i, g in enumerate(np.gradient(field, dx)):
+        laplacian += np.gradient(g, dx)[i]
+    return laplacian
+
+
+class TestLaplacianOperator(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3)
+        self.dx = 0.25
+
+    def test_gradient_mode_is_bit_identical(self):
+        """Compatibility mode reproduces the nested np.gradient result exactly."""
+        for shape in [(8, 9, 10), (2, 5, 7)]:
+            field = self.rng.standard_normal(shape)
+            result = LaplacianOperator(self.dx)(field)
+            self.assertTrue(np.array_equal(result, nested_gradient_laplacian(field, self.dx)))
+
+    def test_compact_stencils_exact_on_quadratic(self):
+        """Both compact stencils are exact for x² + y² + z² away from the edges."""
+        x = np.arange(16) * self.dx
+        X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
+        field = X**2 + Y**2 + Z**2
+        second = LaplacianOperator(self.dx, 2)(field)
+        fourth = LaplacianOperator(self.dx, 4)(field)
+        self.assertTrue(np.allclose(second[1:-1, 1:-1, 1:-1], 6.0, rtol=1e-10))
+        self.assertTrue(np.allclose(fourth[2:-2, 2:-2, 2:-2], 6.0, rtol=1e-10))
+
+    def test_fourth_order_more_accurate(self):
+        """The fourth-order stencil beats second order on a smooth field."""
+        x = np.arange(24) * 0.1
+        X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
+        field = np.sin(X) * np.cos(Y) * np.exp(Z / 3)
+        exact = -(2.0 - 1.0 / 9.0) * field
+        inner = (slice(3, -3),) * 3
+        errors = [np.abs(LaplacianOperator(0.1, s)(field) - exact)[inner].max()
+                  for s in ("gradient", 2, 4)]
+        self.assertLess(errors[1], errors[0])
+        self.assertLess(errors[2], errors[1] / 100)
+
+    def test_edges_match_gradient_mode(self):
+        """Layers the stencil cannot reach use the np.gradient edge values."""
+        for n in (3, 4, 5, 9):
+            profile = self.rng.standard_normal(n)
+            field = np.broadcast_to(profile[:, None, None], (n, 4, 4)).copy()
+            reference = nested_gradient_laplacian(field, self.dx)
+            for stencil, layers in ((2, 1), (4, 2)):
+                result = LaplacianOperator(self.dx, stencil)(field)
+                self.assertTrue(np.allclose(result[:layers], reference[:layers], rtol=1e-12))
+                self.assertTrue(np.allclose(result[-layers:], reference[-layers:], rtol=1e-12))
+
+    def test_one_dimensional_fields(self):
+        """1D fields work with every stencil and match a line of the 3D result."""
+        for n in (3, 6, 9):
+            profile = self.rng.standard_normal(n)
+            field = np.broadcast_to(profile[:, None, None], (n, 4, 4)).copy()
+            for stencil in ("gradient", 2, 4):
+                with self.subTest(n=n, stencil=stencil):
+                    line = LaplacianOperator(self.dx, stencil, axes=(-1,))(profile)
+                    expected = LaplacianOperator(self.dx, stencil)(field)[:, 0, 0]
+                    self.assertTrue(np.array_equal(line, expected))
+
+    def test_out_parameter_and_batch_axes(self):
+        """Results can be written into a buffer and leading axes are batched."""
+        batch = self.rng.standard_normal((3, 6, 6, 6))
+        out = np.full_like(batch, np.nan)
+        op = LaplacianOperator(self.dx, 2)
+        op(batch, out=out)
+        for b in range(3):
+            self.assertTrue(np.allclose(out[b], op(batch[b])))
+
+    def test_spectral_radius_bounds_eigenvalues(self):
+        """spectral_radius bounds |λ| of each stencil, edge rows included."""
+        n = 12
+        for stencil in ("gradient", 2, 4):
+            op = LaplacianOperator(self.dx, stencil, axes=(-1,))
+            matrix = op(np.eye(n)).T
+            eigenvalues = np.linalg.eigvals(matrix)
+            self.assertLessEqual(np.max(np.abs(eigenvalues)), op.spectral_radius)
+            self.assertGreater(np.max(np.abs(eigenvalues)), 0.8 * op.spectral_radius)
+        self.assertEqual(LaplacianOperator(self.dx, 2).spectral_radius, 12 / self.dx**2)
+
+    def test_invalid_stencil(self):
+        """Unknown stencils are rejected by the operator and the engine."""
+        with self.assertRaises(ValueError):
+            LaplacianOperator(self.dx, 3)
+        with self.assertRaises(ValueError):
+            AethelgardEngine(grid_size=8, stencil="spectral")
+
+    def test_engine_stencil_selection(self):
+        """The engine's quantum pressure uses the configured stencil."""
+        engine = AethelgardEngine(grid_size=8, domain_size=2.0, stencil=4)
+        field = self.rng.standard_normal((8, 8, 8))
+        expected = LaplacianOperator(engine.dx, 4)(field) * (engine.hbar * engine.c / engine.dx**4)
+        self.assertTrue(np.allclose(engine.calculate_quantum_pressure(field), expected))
+
+
+class TestPoissonSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(16)
+        self.dx = 0.2
+
+    def test_dirichlet_inverts_compact_stencil(self):
+        """∇²u = f holds with u = 0 on the faces (ghost cells mirror -u)."""
+        f = self.rng.standard_normal((2, 9, 10, 11))
+        u = PoissonSolver(self.dx, "dirichlet")(f)
+        padded = np.pad(u, [(0, 0)] + [(1, 1)] * 3, mode="symmetric")
+        for axis in (1, 2, 3):
+            padded[(slice(None),) * axis + (0,)] *= -1
+            padded[(slice(None),) * axis + (-1,)] *= -1
+        residual = LaplacianOperator(self.dx, 2)(padded)[:, 1:-1, 1:-1, 1:-1] - f
+        self.assertLess(np.max(np.abs(residual)), 1e-10 * np.max(np.abs(f)) / self.dx**2)
+
+    def test_periodic_inverts_wrapped_stencil(self):
+        """Periodic solves drop the mean of f and return a zero-mean u."""
+        f = self.rng.standard_normal((8, 9, 10)) + 3.0
+        u = PoissonSolver(self.dx, "periodic")(f)
+        wrapped = sum(np.roll(u, 1, axis) - 2 * u + np.roll(u, -1, axis)
+                      for axis in range(3)) / self.dx**2
+        self.assertTrue(np.allclose(wrapped, f - f.mean(), atol=1e-10))
+        self.assertAlmostEqual(u.mean(), 0.0)
+        with self.assertRaises(ValueError):
+            PoissonSolver(self.dx, "neumann")
+
+
+if __name__ == '__main__':
+    unittest.main()
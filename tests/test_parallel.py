@@ -0,0 +1,95 @@
+"""
+Tests for the shared-memory slab workers.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_operators import LaplacianOperator
+from aethelgard_parallel import SlabLaplacian, SlabWorkers
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestSlabWorkers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.slabs = SlabWorkers(3, (11, 6, 7))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.slabs.close()
+
+    def setUp(self):
+        self.field = np.random.default_rng(19).random((11, 6, 7))
+
+    def test_halo_exchange_matches_serial_laplacian(self):
+        """Slabs with halos reproduce every stencil bit for bit."""
+        self.assertEqual(self.slabs.slabs, [(0, 3), (3, 7), (7, 11)])
+        for stencil in ("gradient", 2, 4):
+            expected = LaplacianOperator(0.3, stencil)(self.field)
+            result = SlabLaplacian(self.slabs, 0.3, stencil)(self.field)
+            self.assertTrue(np.array_equal(result, expected))
+        # Other shapes run serially
+        batch = np.stack([self.field, self.field])
+        self.assertTrue(np.array_equal(SlabLaplacian(self.slabs, 0.3)(batch),
+                                       LaplacianOperator(0.3)(batch)))
+
+    def test_collective_reductions(self):
+        """Merged slab partials agree with the serial reductions."""
+        components = np.stack([self.field + 1.5, -self.field])
+        mean, std = self.slabs.reduce("moments", components, 0)
+        self.assertAlmostEqual(mean, np.mean(components[0]), places=12)
+        self.assertAlmostEqual(std, np.std(components[0]), places=12)
+        self.assertAlmostEqual(self.slabs.reduce("abs_sum", components),
+                               np.abs(components).sum(), places=9)
+        self.assertAlmostEqual(self.slabs.reduce("sum", self.field), self.field.sum(), places=9)
+        self.assertEqual(self.slabs.reduce("max_deviation", components, 0),
+                         np.max(np.abs(components[0] - 1.0)))
+
+    def test_validation(self):
+        """Worker counts are bounded by the grid."""
+        for workers in (1, 0, 2.0, 4):
+            with self.assertRaises(ValueError):
+                SlabWorkers(workers, (11, 6, 7))
+
+
+class TestSlabEvolution(unittest.TestCase):
+
+    def test_parallel_evolution_matches_serial(self):
+        """Evolving entropy on slabs gives the serial fields exactly and close history."""
+        rng = np.random.default_rng(20)
+        mass = rng.random((12, 12, 12)) * 1e27
+        entropy = rng.random((12, 12, 12))
+        kwargs = dict(grid_size=12, domain_size=4.0, dt=0.01, stencil=4)
+        run = dict(time_steps=5, entropy_evolution=True)
+
+        serial = AethelgardEngineTimeEvolution(**kwargs)
+        engine = AethelgardEngineTimeEvolution(workers=2, **kwargs)
+        try:
+            expected = serial.evolve_metric(mass, entropy, verbose=False, **run)
+            history = engine.evolve_metric(mass, entropy, verbose=False, **run)
+            for field in ("metric_mean", "metric_std", "K_mean", "entropy_mean"):
+                self.assertTrue(np.allclose(history[field], expected[field], rtol=1e-12))
+            self.assertEqual(engine.calculate_paradox_hazard(),
+                             serial.calculate_paradox_hazard())
+
+            final = list(engine.steps(mass, entropy, **run))[-1]
+            reference = list(serial.steps(mass, entropy, **run))[-1]
+            self.assertTrue(np.array_equal(final.entropy, reference.entropy))
+        finally:
+            engine.close()
+
+        # close() keeps the state in private memory; the engine continues serially
+        self.assertIsNone(engine.slabs)
+        self.assertNotIsInstance(engine.laplacian, SlabLaplacian)
+        engine.evolve_metric(mass, entropy, verbose=False, **run)
+        serial.evolve_metric(mass, entropy, verbose=False, **run)
+        self.assertTrue(np.array_equal(engine.metric.components, serial.metric.components))
+        self.assertTrue(np.array_equal(engine.K.components, serial.K.components))
+        engine.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
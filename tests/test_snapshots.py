@@ -0,0 +1,120 @@
+"""
+Tests for the streaming snapshot writer.
+"""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+import aethelgard_snapshots
+from aethelgard_snapshots import SnapshotReader, SnapshotWriter
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+class TestSnapshotWriter(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.mass = rng.random((10, 10, 10)) * 1e27
+        self.entropy = rng.random((10, 10, 10))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "run.snap"
+
+    def test_every_kth_step_is_streamed(self):
+        """Snapshots hold the fields as they were at their step."""
+        engine = AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0)
+        with SnapshotWriter(self.path, every=3) as writer:
+            engine.evolve_metric(self.mass, self.entropy, time_steps=6,
+                                 entropy_evolution=True, verbose=False, snapshots=writer)
+        self.assertEqual(writer.written, 2)
+
+        reader = SnapshotReader(self.path)
+        self.assertEqual(len(reader), 2)
+        self.assertTrue(np.array_equal(reader.steps, [3, 6]))
+        self.assertTrue(np.allclose(reader.times, [0.03, 0.06]))
+        last = reader[-1]
+        self.assertTrue(np.array_equal(last["g_00"], engine.metric.g_00))
+        self.assertTrue(np.array_equal(last["K"], engine.K.components))
+
+        replay = AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0)
+        replay.evolve_metric(self.mass, self.entropy, time_steps=3,
+                             entropy_evolution=True, verbose=False)
+        times, fields = zip(*reader.series("g_00"), strict=True)
+        self.assertTrue(np.array_equal(fields[0], replay.metric.g_00))
+        self.assertEqual(len(times), 2)
+
+    def test_staging_buffers_are_recycled(self):
+        """Memory stays at `buffers` snapshots regardless of run length."""
+        field = np.zeros((10, 10, 10))
+        allocations = []
+        empty_like = np.empty_like
+
+        def counting(array, *args, **kwargs):
+            allocations.append(array.shape)
+            return empty_like(array, *args, **kwargs)
+
+        with mock.patch.object(aethelgard_snapshots.np, "empty_like", counting), \
+                SnapshotWriter(self.path, fields=("entropy",), buffers=2, level=0) as writer:
+            for step in range(8):
+                field[...] = step
+                writer.write(step, step * 0.1, entropy=field)
+        self.assertLessEqual(len(allocations), 2)
+        reader = SnapshotReader(self.path)
+        self.assertEqual([float(snap["entropy"][0, 0, 0]) for snap in
+                          (reader[i] for i in range(len(reader)))], list(range(8)))
+
+    def test_slow_writer_applies_backpressure(self):
+        """The solver blocks rather than queueing beyond the buffer pool."""
+        gate = threading.Event()
+        save = aethelgard_snapshots._save_npz
+
+        def slow(*args):
+            gate.wait(5)
+            save(*args)
+
+        field = np.ones((4, 4, 4))
+        with mock.patch.object(aethelgard_snapshots, "_save_npz", slow):
+            writer = SnapshotWriter(self.path, fields=("g_00",), buffers=1)
+            writer.write(0, 0.0, g_00=field)
+            blocked = threading.Thread(target=writer.write, args=(1, 0.1), kwargs={"g_00": field})
+            blocked.start()
+            blocked.join(0.2)
+            self.assertTrue(blocked.is_alive())
+            gate.set()
+            blocked.join(5)
+            writer.close()
+        self.assertEqual(writer.written, 2)
+
+    def test_writer_errors_surface(self):
+        """A failing write is reported on the solver thread and nothing is left half-written."""
+        with mock.patch.object(aethelgard_snapshots, "_save_npz", side_effect=OSError("disk full")):
+            writer = SnapshotWriter(self.path, fields=("g_00",))
+            writer.write(0, 0.0, g_00=np.ones((4, 4, 4)))
+            with self.assertRaises(RuntimeError):
+                writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.write(1, 0.1, g_00=np.ones((4, 4, 4)))
+        self.assertEqual(list(self.path.iterdir()), [])
+
+    def test_validation(self):
+        """Bad intervals, buffers, fields, levels and paths are rejected."""
+        for kwargs in ({"every": 0}, {"buffers": 0}, {"fields": ("rho",)}, {"fields": ()},
+                       {"level": 10}):
+            with self.assertRaises(ValueError):
+                SnapshotWriter(self.path, **kwargs)
+        with self.assertRaises(ValueError):
+            SnapshotWriter("../escape")
+
+        writer = SnapshotWriter(self.path)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(0, 0.0, g_00=np.ones(1), K=np.ones(1), entropy=np.ones(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for declarative time-dependent entropy sources.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_sources import EntropySource, GaussianSource, SeparableSource, TravelingWave
+from aethelgard_time_evolution import AethelgardEngineTimeEvolution
+
+
+def wave_callable(engine):
+    x = engine.coordinates.axes[0]
+    k = 2 * np.pi / 3.0
+    return lambda t: np.broadcast_to(2.0 * (1 + 0.5 * np.sin(k * x - k * t)),
+                                     engine.coordinates.shape)
+
+
+def collapse_callable(engine):
+    r = engine.coordinates.radial_distance(center=5.0)
+    return lambda t: 2.0 * (1 + 0.5 * t) * np.exp(-r**2 / (3.0 - 0.5 * t))
+
+
+class TestSources(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = AethelgardEngineTimeEvolution(grid_size=16, domain_size=10.0)
+
+    def assertClose(self, actual, expected):
+        np.testing.assert_allclose(actual, expected, rtol=1e-12,
+                                   atol=1e-12 * np.max(np.abs(expected)))
+
+    def test_fields_and_pressures_match_callables(self):
+        """Bound sources reproduce the equivalent callable and its pressure to rounding."""
+        pairs = [
+            (TravelingWave(amplitude=2.0, wavelength=3.0, velocity=1.0), wave_callable),
+            (GaussianSource(amplitude=lambda t: 2.0 * (1 + 0.5 * t),
+                            width=lambda t: 3.0 - 0.5 * t, center=5.0), collapse_callable),
+        ]
+        for stencil in ("gradient", 2, 4):
+            engine = AethelgardEngineTimeEvolution(grid_size=16, domain_size=10.0,
+                                                   stencil=stencil)
+            for source, reference in pairs:
+                bound, reference = source.bind(engine), reference(engine)
+                for t in (0.0, 0.7, 2.5):
+                    with self.subTest(stencil=stencil, source=type(source).__name__, t=t):
+                        entropy = bound(t)
+                        self.assertClose(entropy, reference(t))
+                        self.assertClose(bound.pressure(t, entropy),
+                                         engine.calculate_quantum_pressure(reference(t)))
+
+    def test_separable_terms(self):
+        """Spatial factors may be arrays or callables of the grid; numbers are constant."""
+        x, y, _ = self.engine.coordinates.axes
+        source = SeparableSource([(x**2 * y, lambda t: t**2), (lambda grid: grid.axes[2]**3, 3.0)])
+        bound = source.bind(self.engine)
+        expected = np.broadcast_to(1.5**2 * x**2 * y + 3.0 * self.engine.coordinates.axes[2]**3,
+                                   self.engine.coordinates.shape)
+        self.assertClose(bound(1.5), expected)
+        self.assertClose(bound.pressure(1.5, bound(1.5)),
+                         self.engine.calculate_quantum_pressure(expected))
+
+    def test_evolve_matches_callables(self):
+        """evolve_metric and steps accept sources; results match the callables."""
+        mass = np.full((16, 16, 16), 1e5)
+        sources = [(TravelingWave(amplitude=2.0, wavelength=3.0, velocity=1.0), wave_callable),
+                   (GaussianSource(amplitude=2.0, width=lambda t: 3.0 - 0.5 * t, center=5.0),
+                    collapse_callable)]
+        for source, reference in sources:
+            with self.subTest(source=type(source).__name__):
+                engines = [AethelgardEngineTimeEvolution(grid_size=16, domain_size=10.0)
+                           for _ in range(3)]
+                engines[0].evolve_metric(mass, reference(engines[0]), time_steps=10,
+                                         verbose=False)
+                engines[1].evolve_metric(mass, source, time_steps=10, verbose=False)
+                for _ in engines[2].steps(mass, source, time_steps=10):
+                    pass
+                for engine in engines[1:]:
+                    np.testing.assert_allclose(engine.metric, engines[0].metric, rtol=1e-12)
+                    self.assertEqual(engine.current_time, engines[0].current_time)
+
+    def test_overridden_pressure_is_used(self):
+        """A subclass pressure formula bypasses the factored pressures."""
+        class Squared(AethelgardEngineTimeEvolution):
+            def calculate_quantum_pressure(self, entropy_field):
+                return super().calculate_quantum_pressure(entropy_field**2)
+
+        engine = Squared(grid_size=16, domain_size=10.0)
+        for source in (GaussianSource(amplitude=2.0, width=3.0),
+                       TravelingWave(amplitude=2.0, wavelength=3.0, velocity=1.0)):
+            with self.subTest(source=type(source).__name__):
+                bound = source.bind(engine)
+                self.assertFalse(bound.factored)
+                entropy = bound(0.7)
+                self.assertTrue(np.array_equal(bound.pressure(0.7, entropy),
+                                               engine.calculate_quantum_pressure(entropy)))
+
+    def test_validation(self):
+        """Invalid source parameters raise ValueError."""
+        with self.assertRaises(ValueError):
+            SeparableSource([])
+        with self.assertRaises(ValueError):
+            SeparableSource([(1.0, "often")])
+        with self.assertRaises(ValueError):
+            SeparableSource([(np.ones((3, 3)), 1.0)]).bind(self.engine)
+        with self.assertRaises(ValueError):
+            TravelingWave(amplitude=1.0, wavelength=0.0, velocity=1.0)
+        with self.assertRaises(ValueError):
+            TravelingWave(amplitude=1.0, wavelength=1.0, velocity=1.0, axis=3)
+        with self.assertRaises(ValueError):
+            GaussianSource(amplitude=1.0, width=lambda t: 1.0 - t).bind(self.engine)(2.0)
+        with self.assertRaises(NotImplementedError):
+            EntropySource().bind(self.engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Tests for adaptive time stepping and the entropy diffusion integrators.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_operators import LaplacianOperator
+from aethelgard_stepping import AdaptiveTimeStep, DiffusionIntegrator
+from aethelgard_time_evolution import ENTROPY_DIFFUSION, AethelgardEngineTimeEvolution
+
+
+class TestAdaptiveTimeStep(unittest.TestCase):
+
+    def test_propose(self):
+        """dt is the tightest of growth, accuracy, stability and dt_max, floored at dt_min."""
+        control = AdaptiveTimeStep(dt_min=1e-3, dt_max=1.0, max_change=1e-2, growth=2.0)
+        self.assertEqual(control.propose(0.1, None), 0.1)
+        self.assertEqual(control.propose(0.1, 0.0), 0.2)
+        self.assertEqual(control.propose(0.1, 1.0), 1e-2)
+        self.assertEqual(control.propose(0.1, 0.0, stability_limit=0.05), 0.05)
+        self.assertEqual(control.propose(0.8, 0.0), 1.0)
+        self.assertEqual(control.propose(0.1, 1e6), 1e-3)
+        with self.assertRaises(ValueError):
+            control.check(1e-4)
+
+    def test_validation(self):
+        """Bounds and tuning parameters are checked like the engine's dt."""
+        for kwargs in ({"dt_min": 0, "dt_max": 1.0}, {"dt_min": 1.0, "dt_max": 2000.0},
+                       {"dt_min": 2.0, "dt_max": 1.0}, {"dt_min": 0.1, "dt_max": 1.0,
+                                                        "max_change": 0},
+                       {"dt_min": 0.1, "dt_max": 1.0, "safety": 1.5},
+                       {"dt_min": 0.1, "dt_max": 1.0, "growth": 1.0}):
+            with self.assertRaises(ValueError):
+                AdaptiveTimeStep(**kwargs)
+
+
+class TestAdaptiveEvolution(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(14)
+        self.mass = rng.random((10, 10, 10)) * 1e11
+        self.entropy = rng.random((10, 10, 10))
+
+    def engine(self, **kwargs):
+        return AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0, dt=0.01, **kwargs)
+
+    def test_quiet_run_takes_fewer_steps_and_lands_on_t_end(self):
+        """A quiescent run grows dt to dt_max, records it, and ends exactly at t_end."""
+        engine = self.engine()
+        history = engine.evolve_metric(self.mass, self.entropy, time_steps=100, verbose=False,
+                                       adaptive=AdaptiveTimeStep(1e-3, 0.1), t_end=0.5)
+        self.assertEqual(engine.current_time, 0.5)
+        self.assertLess(engine.step_count, 10)
+        self.assertTrue(np.allclose(history['dt'][:4], [0.01, 0.02, 0.04, 0.08]))
+        self.assertAlmostEqual(float(np.sum(history['dt'])), 0.5)
+        self.assertEqual(history['time'][-1], 0.5)
+        self.assertIn("rate", [key[0] for key in engine.sources._entries])
+
+    def test_large_updates_limit_dt(self):
+        """No metric component moves by more than max_change after the first step."""
+        engine = self.engine()
+        control = AdaptiveTimeStep(1e-6, 0.1, max_change=1e-4)
+        states = list(engine.steps(self.mass * 1e17, self.entropy, time_steps=6,
+                                   adaptive=control))
+        previous = None
+        for state in states:
+            g_00 = state.metric.g_00.copy()
+            if previous is not None:
+                self.assertLessEqual(np.max(np.abs(g_00 - previous)), 1.0001e-4)
+            previous = g_00
+        self.assertLess(states[-1].dt, 0.01)
+
+    def test_diffusion_stability_limit(self):
+        """Evolving entropy never steps beyond the diffusion limit."""
+        engine = self.engine(stencil=2)
+        control = AdaptiveTimeStep(1e-3, 1000.0, safety=0.5)
+        limit = 0.5 * engine.dx**2 / (6 * ENTROPY_DIFFUSION)
+        history = engine.evolve_metric(self.mass, self.entropy, time_steps=12, verbose=False,
+                                       entropy_evolution=True, adaptive=control)
+        self.assertAlmostEqual(float(np.max(history['dt'])), limit)
+
+        with self.assertRaises(ValueError):
+            engine.evolve_metric(self.mass, self.entropy, time_steps=2, verbose=False,
+                                 entropy_evolution=True, t_end=1e4,
+                                 adaptive=AdaptiveTimeStep(2 * limit, 1000.0))
+
+    def test_fixed_dt_is_recorded_and_t_end_needs_adaptive(self):
+        """Fixed-step runs record their dt; t_end is validated up front."""
+        engine = self.engine()
+        history = engine.evolve_metric(self.mass, self.entropy, time_steps=3, verbose=False)
+        self.assertTrue(np.all(history['dt'] == 0.01))
+        with self.assertRaises(ValueError):
+            engine.steps(self.mass, self.entropy, t_end=1.0)
+        with self.assertRaises(ValueError):
+            engine.steps(self.mass, self.entropy, adaptive=AdaptiveTimeStep(1e-3, 0.1),
+                         t_end=0.0)
+
+
+class TestDiffusionIntegrator(unittest.TestCase):
+
+    def setUp(self):
+        self.dx = 0.25
+        self.laplacian = LaplacianOperator(self.dx, 2)
+        n = 16
+        centers = np.arange(n) + 0.5
+        # A zero-flux eigenmode of the 3-point Laplacian: decays as exp(D·λ·t)
+        self.mode = (np.cos(np.pi * 2 * centers / n)[:, None, None]
+                     * np.cos(np.pi * 3 * centers / n)[None, :, None]
+                     * np.ones(n)[None, None, :])
+        self.eigenvalue = -4 * (np.sin(np.pi * 2 / (2 * n))**2
+                                + np.sin(np.pi * 3 / (2 * n))**2) / self.dx**2
+
+    def evolve(self, method, S, dt, steps, D=0.1):
+        integrator = DiffusionIntegrator(self.laplacian, D, method)
+        for _ in range(steps):
+            S = integrator.step(S, dt)
+        return S
+
+    def test_euler_matches_original_update(self):
+        """The default integrator is the original explicit update, bit for bit."""
+        S = np.random.default_rng(15).random((8, 8, 8))
+        expected = S + 0.01 * 0.1 * self.laplacian(S)
+        self.assertTrue(np.array_equal(self.evolve("euler", S, 0.01, 1), expected))
+
+    def test_convergence_order(self):
+        """Halving dt shrinks the error by ~2**order for each integrator."""
+        t, D = 0.4, 0.1
+        exact = self.mode * np.exp(D * self.eigenvalue * t)
+        for method, order in (("backward_euler", 1), ("crank_nicolson", 2)):
+            errors = [np.max(np.abs(self.evolve(method, self.mode, t / n, n) - exact))
+                      for n in (4, 8)]
+            self.assertAlmostEqual(np.log2(errors[0] / errors[1]), order, delta=0.15)
+
+        # RK4 against a fine-step RK4 reference (the engine stencil has its own edges)
+        S = np.random.default_rng(16).random((10, 10, 10))
+        reference = self.evolve("rk4", S, t / 64, 64)
+        errors = [np.max(np.abs(self.evolve("rk4", S, t / n, n) - reference)) for n in (4, 8)]
+        self.assertGreater(np.log2(errors[0] / errors[1]), 3.7)
+
+    def test_implicit_steps_stable_beyond_explicit_limit(self):
+        """At 10x the Euler limit the implicit methods stay bounded; Euler does not."""
+        S = np.random.default_rng(17).random((12, 12, 12))
+        dt = 10 * DiffusionIntegrator(self.laplacian, 0.1).stability_limit()
+        self.assertGreater(np.max(np.abs(self.evolve("euler", S, dt, 20))), 1e6)
+        for method in ("crank_nicolson", "backward_euler"):
+            result = self.evolve(method, S, dt, 20)
+            self.assertLessEqual(np.max(np.abs(result)), np.max(S))
+            self.assertAlmostEqual(result.mean(), S.mean())  # zero flux conserves S
+            self.assertEqual(DiffusionIntegrator(self.laplacian, 0.1, method).stability_limit(),
+                             np.inf)
+
+    def test_engine_configuration(self):
+        """D and the integrator are engine options, validated up front."""
+        engine = AethelgardEngineTimeEvolution(grid_size=8, diffusion_coefficient=0.5,
+                                               integrator="crank_nicolson")
+        S = np.random.default_rng(18).random((8, 8, 8))
+        reference = DiffusionIntegrator(engine.laplacian, 0.5, "crank_nicolson")
+        expected = np.abs(reference.step(S, engine.dt))
+        self.assertTrue(np.array_equal(engine._evolve_entropy(S), expected))
+        control = AdaptiveTimeStep(1e-3, 1000.0)
+        self.assertEqual(engine._diffusion_limit(control), np.inf)
+        for kwargs in ({"integrator": "leapfrog"}, {"diffusion_coefficient": -1.0}):
+            with self.assertRaises(ValueError):
+                AethelgardEngineTimeEvolution(grid_size=8, **kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
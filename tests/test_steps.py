@@ -0,0 +1,80 @@
+"""
+Tests for the generator-based stepping API.
+"""
+
+import unittest
+
+import numpy as np
+
+from aethelgard_time_evolution import MAX_TIME_STEPS, AethelgardEngineTimeEvolution
+
+
+class TestSteps(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(12)
+        self.mass = rng.random((10, 10, 10)) * 1e27
+        self.entropy = rng.random((10, 10, 10))
+
+    def engine(self):
+        return AethelgardEngineTimeEvolution(grid_size=10, domain_size=4.0)
+
+    def test_steps_match_evolve_metric(self):
+        """Pulling every state reproduces evolve_metric without touching history."""
+        reference = self.engine()
+        reference.evolve_metric(self.mass, self.entropy, time_steps=5,
+                                entropy_evolution=True, verbose=False)
+
+        engine = self.engine()
+        states = list(engine.steps(self.mass, self.entropy, time_steps=5,
+                                   entropy_evolution=True))
+        self.assertEqual([state.step for state in states], [1, 2, 3, 4, 5])
+        self.assertEqual(states[-1].time, reference.current_time)
+        self.assertTrue(np.array_equal(engine.metric.components, reference.metric.components))
+        self.assertTrue(np.array_equal(engine.K.components, reference.K.components))
+        self.assertEqual(engine.history.size, 0)
+
+    def test_states_are_live_views(self):
+        """States expose the engine's own arrays instead of copies."""
+        engine = self.engine()
+        state = next(engine.steps(self.mass, self.entropy))
+        self.assertIs(state.metric, engine.metric)
+        self.assertIs(state.K, engine.K)
+        np.testing.assert_array_equal(state.T_quantum,
+                                      engine.calculate_quantum_pressure(self.entropy))
+
+    def test_early_stop_and_continue(self):
+        """Abandoning the generator leaves the engine at the last completed step."""
+        engine = self.engine()
+        for state in engine.steps(self.mass, self.entropy, time_steps=MAX_TIME_STEPS):
+            if state.step == 3:
+                break
+        self.assertEqual(engine.step_count, 3)
+
+        engine.evolve_metric(self.mass, self.entropy, time_steps=2, verbose=False)
+        reference = self.engine()
+        reference.evolve_metric(self.mass, self.entropy, time_steps=5, verbose=False)
+        self.assertTrue(np.array_equal(engine.metric.components, reference.metric.components))
+
+    def test_callable_entropy_and_validation(self):
+        """Callables are sampled at each step's start; bad counts fail eagerly."""
+        engine = self.engine()
+        seen = []
+
+        def entropy(t):
+            seen.append(t)
+            return self.entropy * (1 + t)
+
+        states = engine.steps(self.mass, entropy, time_steps=3)
+        self.assertEqual(seen, [])
+        last = list(states)[-1]
+        self.assertTrue(np.allclose(seen, [0.0, 0.01, 0.02]))
+        self.assertTrue(np.array_equal(last.entropy, self.entropy * (1 + seen[-1])))
+
+        for time_steps in (0, 2.5, MAX_TIME_STEPS + 1):
+            with self.assertRaises(ValueError):
+                engine.steps(self.mass, self.entropy, time_steps=time_steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
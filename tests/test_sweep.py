@@ -0,0 +1,146 @@
+"""
+Tests for the parallel scenario parameter sweep.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scenarios'))
+import parameter_sweep
+from black_hole_quantum_core import build_black_hole_inputs
+from parameter_sweep import (
+    MAX_CONFIGURATIONS,
+    MAX_ITERATIONS,
+    expand_grid,
+    format_table,
+    run_sweep,
+    write_table,
+)
+
+from aethelgard_engine import AethelgardEngine
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    def test_expand_grid(self):
+        """The grid expands to the Cartesian product; scalars are fixed values."""
+        configs = expand_grid({"a": [1, 2], "b": (3, 4), "c": 5})
+        self.assertEqual(len(configs), 4)
+        self.assertEqual(configs[0], {"a": 1, "b": 3, "c": 5})
+        self.assertEqual(configs[-1], {"a": 2, "b": 4, "c": 5})
+
+    def test_rows_match_serial_solves(self):
+        """Workers reading shared-memory inputs reproduce a direct solve."""
+        rows = run_sweep("black_hole", {
+            "grid_size": [10],
+            "core_radius": [1.0, 2.0],
+            "iterations": [5, 40],
+        }, max_workers=2)
+        self.assertEqual(len(rows), 4)
+
+        for row in rows:
+            mass, entropy = build_black_hole_inputs(grid_size=10, core_radius=row["core_radius"])
+            engine = AethelgardEngine(grid_size=10, domain_size=20.0)
+            metric = engine.solve_field_equations(
+                mass, entropy, iterations=row["iterations"], verbose=False)
+            self.assertEqual(row["core_g00"], metric[5, 5, 5, 0, 0])
+            self.assertEqual(row["hazard"], engine.calculate_paradox_hazard())
+            T_quantum = engine.calculate_quantum_pressure(entropy)
+            self.assertEqual(row["pressure_max"], np.max(T_quantum))
+
+    def test_default_iterations_and_other_scenarios(self):
+        """Unswept iterations default per scenario."""
+        rows = run_sweep("dark_energy", {"grid_size": [8], "vacuum_entropy": [1.0]},
+                         max_workers=1)
+        self.assertEqual(rows[0]["iterations"], 100)
+        rows = run_sweep("wormhole", {"grid_size": [8], "throat_radius": [2.0]},
+                         max_workers=1)
+        self.assertEqual(len(rows), 1)
+
+    def test_validation(self):
+        """Unknown scenarios, parameters and oversized sweeps are rejected."""
+        with self.assertRaises(ValueError):
+            run_sweep("neutron_star", {"grid_size": [8]})
+        with self.assertRaises(ValueError):
+            run_sweep("black_hole", {"throat_radius": [1.0]})
+        with self.assertRaises(ValueError):
+            run_sweep("black_hole", {"r": [None]})
+        with self.assertRaises(ValueError):
+            run_sweep("black_hole", {"grid_size": []})
+        with self.assertRaises(ValueError):
+            run_sweep("black_hole", {"seed": range(MAX_CONFIGURATIONS + 1)})
+
+    def test_solve_settings_checked_before_dispatch(self):
+        """Bad grid sizes and iteration counts fail before any worker starts."""
+        for grid in ({"grid_size": [0]}, {"grid_size": [8.0]},
+                     {"grid_size": [AethelgardEngine.MAX_GRID_SIZE + 1]},
+                     {"grid_size": [8], "iterations": [5, 0]},
+                     {"grid_size": [8], "iterations": [MAX_ITERATIONS + 1]},
+                     {"grid_size": [8], "iterations": [2.5]}):
+            with self.subTest(grid=grid), \
+                    mock.patch.object(parameter_sweep, "ProcessPoolExecutor") as pool:
+                with self.assertRaises(ValueError):
+                    run_sweep("dark_energy", grid)
+                pool.assert_not_called()
+
+    def test_shared_memory_is_bounded_and_released(self):
+        """At most `window` input groups are live; all blocks are unlinked."""
+        live, peak = set(), [0]
+        share, unlink = parameter_sweep._share_arrays, parameter_sweep._unlink
+
+        def tracking_share(arrays):
+            specs = share(arrays)
+            live.add(specs[0][0])
+            peak[0] = max(peak[0], len(live))
+            return specs
+
+        def tracking_unlink(specs):
+            live.discard(specs[0][0])
+            unlink(specs)
+
+        groups = [({"grid_size": 8, "domain_size": 10.0, "inputs": {"grid_size": 8, "seed": s}},
+                   [2 * s, 2 * s + 1],
+                   [{"grid_size": 8, "domain_size": 10.0, "iterations": i} for i in (3, 6)])
+                  for s in range(5)]
+        with mock.patch.object(parameter_sweep, '_share_arrays', tracking_share), \
+                mock.patch.object(parameter_sweep, '_unlink', tracking_unlink), \
+                ThreadPoolExecutor(max_workers=4) as pool:
+            rows = parameter_sweep._run_pipeline(pool, "dark_energy", groups, 10, window=2)
+        self.assertEqual(len(rows), 10)
+        self.assertTrue(all(row is not None for row in rows))
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual(live, set())
+
+    def test_failed_build_releases_shared_memory(self):
+        """Errors in a worker propagate and leave no blocks behind."""
+        before = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+        with self.assertRaises(ValueError):
+            run_sweep("dark_energy", {"grid_size": [8], "domain_size": [10.0, -1.0]},
+                      max_workers=2)
+        if os.path.isdir('/dev/shm'):
+            self.assertEqual(set(os.listdir('/dev/shm')) - before, set())
+
+    def test_table_output_and_optional_plot(self):
+        """Rows can be written as CSV and formatted; plotting is opt-in."""
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = run_sweep("dark_energy", {"grid_size": [8], "iterations": [3, 6]},
+                             max_workers=1, plot=True, output_dir=tmp)
+            self.assertTrue((Path(tmp) / "dark_energy_sweep.png").exists())
+
+            path = Path(tmp) / "sweep.csv"
+            write_table(rows, path)
+            lines = path.read_text().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertIn("core_g00", lines[0])
+        self.assertIn("hazard", format_table(rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
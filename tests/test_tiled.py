@@ -0,0 +1,102 @@
+"""
+Tests for the tiled (block-decomposed) engine.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from aethelgard_engine import AethelgardEngine
+from aethelgard_tiled import METRIC_FILE, AethelgardEngineTiled
+
+
+class TestTiledEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(18)
+        self.mass = rng.random((20, 20, 20)) * 1e27
+        self.mass[:5] = 1e40  # part of the grid hits the causality clamp
+        self.entropy = rng.random((20, 20, 20)) * 1e66
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_matches_monolithic_engine(self):
+        """Tiles with halos reproduce the full-grid engine bit for bit."""
+        for stencil in ("gradient", 2, 4):
+            reference = AethelgardEngine(grid_size=20, domain_size=5.0, stencil=stencil)
+            expected = reference.solve_field_equations(self.mass, self.entropy, iterations=30,
+                                                       verbose=False)
+            for solver in ("closed_form", "iterative"):
+                tiled = AethelgardEngineTiled(grid_size=20, domain_size=5.0, stencil=stencil,
+                                              tile_size=8)
+                self.assertEqual(len(tiled.tiles()), 27)
+                metric = tiled.solve_field_equations(self.mass, self.entropy, iterations=30,
+                                                     verbose=False, solver=solver)
+                self.assertTrue(np.array_equal(metric.components, expected.components))
+                self.assertEqual(tiled.solver_info['solver'], solver)
+                self.assertEqual(tiled.calculate_paradox_hazard(),
+                                 reference.calculate_paradox_hazard())
+            self.assertTrue(np.array_equal(tiled.calculate_quantum_pressure(self.entropy),
+                                           reference.calculate_quantum_pressure(self.entropy)))
+
+    def test_out_of_core_storage_and_workers(self):
+        """Memory-mapped fields and a process pool give the same result."""
+        np.save(self.tmp / "mass.npy", self.mass)
+        mass = np.load(self.tmp / "mass.npy", mmap_mode="r")
+        expected = AethelgardEngine(grid_size=20, domain_size=5.0).solve_field_equations(
+            self.mass, self.entropy, iterations=30, verbose=False)
+
+        tiled = AethelgardEngineTiled(grid_size=20, domain_size=5.0, tile_size=10,
+                                      storage=self.tmp / "run", workers=2)
+        with mock.patch.object(np, "save", wraps=np.save) as save:
+            metric = tiled.solve_field_equations(mass, self.entropy, iterations=30,
+                                                 verbose=False)
+        self.assertIsInstance(metric.components, np.memmap)
+        self.assertTrue(np.array_equal(metric.components, expected.components))
+        on_disk = np.load(self.tmp / "run" / METRIC_FILE, mmap_mode="r")
+        self.assertTrue(np.array_equal(on_disk, expected.components))
+        # Only the in-memory input was spilled for the workers, and only for the solve
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual([p.name for p in (self.tmp / "run").iterdir()], [METRIC_FILE])
+
+        # Each pressure call gets its own file; earlier results are left alone
+        first = tiled.calculate_quantum_pressure(self.entropy)
+        expected_pressure = np.array(first)
+        second = tiled.calculate_quantum_pressure(2 * self.entropy)
+        self.assertIsInstance(first, np.memmap)
+        self.assertNotEqual(first.filename, second.filename)
+        self.assertTrue(np.array_equal(first, expected_pressure))
+
+    def test_validation(self):
+        """The grid cap is lifted; tiling, worker and solver options are checked."""
+        self.assertEqual(AethelgardEngineTiled.MAX_GRID_SIZE, 2048)
+        with self.assertRaises(ValueError):
+            AethelgardEngineTiled(grid_size=2049, storage=self.tmp)
+        # Beyond the monolithic cap only with storage (the metric would be in memory)
+        with self.assertRaises(ValueError):
+            AethelgardEngineTiled(grid_size=AethelgardEngine.MAX_GRID_SIZE + 1)
+        for kwargs in ({"tile_size": 0}, {"tile_size": 257}, {"workers": 0},
+                       {"workers": 2}, {"storage": self.tmp / ".." / "escape"}):
+            with self.assertRaises(ValueError):
+                AethelgardEngineTiled(grid_size=8, **kwargs)
+        tiled = AethelgardEngineTiled(grid_size=20, tile_size=8)
+        for kwargs in ({"solver": "spectral"}, {"tol": 1e-6}, {"boundary": "open"},
+                       {"multigrid": object()}, {"cache": object()}):
+            with self.assertRaises(ValueError):
+                tiled.solve_field_equations(self.mass, self.entropy, verbose=False, **kwargs)
+        metric, info = tiled.solve_field_equations(self.mass, self.entropy, verbose=False,
+                                                   return_info=True)
+        self.assertIs(info, tiled.solver_info)
+        self.assertIs(metric, tiled.metric)
+        with self.assertRaises(ValueError):
+            tiled.solve_field_equations(self.mass[:8], self.entropy)
+
+
+if __name__ == '__main__':
+    unittest.main()